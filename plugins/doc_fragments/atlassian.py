@@ -36,7 +36,162 @@ options:
 
     connection_timeout:
         description:
-            - Controls the HTTP connections timeout period (in seconds) to Keycloak API.
+            - Controls the HTTP connections timeout period (in seconds) to the Atlassian API.
         type: int
         default: 10
+
+    read_timeout:
+        description:
+            - How long (in seconds) to wait for the Atlassian API to send a response.
+        type: int
+        default: 60
+
+    api_deadline:
+        description:
+            - Overall time (in seconds) all API requests of a single module run may take, including retries.
+            - No limit if not set.
+        type: int
+
+    pool_connections:
+        description:
+            - Number of connection pools (one per host) to keep.
+        type: int
+        default: 4
+
+    pool_maxsize:
+        description:
+            - Maximum number of connections kept open per host.
+            - Should be at least the number of parallel requests so they reuse established TLS connections.
+        type: int
+        default: 16
+
+    parallel_requests:
+        description:
+            - Maximum number of independent API requests (e.g. permission grants) a module sends concurrently.
+        type: int
+        default: 4
+
+    cache_path:
+        description:
+            - Directory to cache responses of rarely changing reference data (roles, schemes, settings) in.
+            - The cache is shared between module runs and forks and is keyed by instance and credentials.
+            - Cached responses are revalidated once they expire and dropped whenever the module changes the
+              resource they belong to.
+            - The ids of roles, permission schemes and notification schemes are indexed by name there as well,
+              the index is reloaded once it expires or a name is missing.
+            - If not set, the value of the E(ATLASSIAN_CACHE_PATH) environment variable is used.
+            - If neither is set, nothing is written to disk. Responses and the index are then only kept in memory
+              and shared by the items of a single module run.
+        type: path
+
+    cache_max_size:
+        description:
+            - Maximum size of the response cache in MiB. The least recently used responses are evicted first.
+        type: int
+        default: 64
+
+    max_retries:
+        description:
+            - How many times a throttled (HTTP 429) or unavailable (HTTP 502, 503, 504) API request is retried.
+            - Only idempotent requests are retried.
+            - The delay between attempts honours the C(Retry-After) and C(X-RateLimit-Reset) headers
+              and otherwise uses a jittered exponential backoff.
+        type: int
+        default: 5
+
+    retry_deadline:
+        description:
+            - Total time (in seconds) a single API request may spend retrying before giving up.
+        type: int
+        default: 120
+
+    rate_limit:
+        description:
+            - Maximum number of API requests per second sent to the instance by all module runs on this host together.
+            - Forks share the budget through a state file per instance in O(cache_path), or the system temporary
+              directory if no cache is configured.
+            - If not set, the value of the E(ATLASSIAN_RATE_LIMIT) environment variable is used.
+            - Requests are not rate limited if neither is set.
+        type: float
+
+    rate_limit_burst:
+        description:
+            - Number of requests that may be sent at once before O(rate_limit) applies.
+        type: int
+        default: 10
+
+    api_stats:
+        description:
+            - Return an C(api_stats) block with the number of API requests, bytes sent and received and
+              latency percentiles in total and per endpoint.
+        type: bool
+        default: false
+
+    items:
+        description:
+            - Process a list of objects in a single module run instead of looping over the task.
+            - Every item is a dict of module options, options given to the task apply to every item as defaults.
+            - Items are validated one after the other and processed with the same API session and shared
+              reference data. Modules which support it process up to O(parallel_requests) items at once.
+              A failed item does not stop the others.
+            - The result of every item is returned in C(results), with its C(changed), C(diff) and C(msg), and a C(summary) of the counts.
+        type: list
+        elements: dict
+
+notes:
+    - Every module returns C(api_retries) with the number of API requests retried (C(count)) and the seconds
+      slept before retrying them (C(sleep)).
+    - If the E(ATLASSIAN_PROFILE_DIR) environment variable is set, the module run is profiled and the reports are
+      written to that directory. The module then returns C(profile) with the paths of the C(pstats) file and the
+      text C(report) and the C(peak_memory) in bytes.
+'''
+
+    # Options of the lookup and inventory plugins
+    PLUGIN = r'''
+options:
+    atlassian_instance:
+        description:
+            - Name of the Atlassian cloud instance.
+        type: str
+        env:
+            - name: ATLASSIAN_INSTANCE
+        vars:
+            - name: atlassian_instance
+
+    atlassian_username:
+        description:
+            - Username to authenticate for API access with.
+        type: str
+        env:
+            - name: ATLASSIAN_USERNAME
+        vars:
+            - name: atlassian_username
+
+    atlassian_password:
+        description:
+            - Password to authenticate for API access with.
+        type: str
+        env:
+            - name: ATLASSIAN_PASSWORD
+        vars:
+            - name: atlassian_password
+
+    validate_certs:
+        description:
+            - Verify TLS certificates (do not disable this in production).
+        type: bool
+        default: true
+
+    cache_path:
+        description:
+            - Directory to cache responses of rarely changing reference data (roles, schemes, settings) in.
+            - The cache is shared with the modules and between forks and is keyed by instance and credentials.
+            - Lookups keep their results in memory of the process running them only. Ansible runs every task for
+              every host in a fork of its own, so without O(cache_path) nothing a lookup fetched is shared between
+              tasks or hosts.
+            - Only the responses of roles, permission schemes and notification schemes are kept in O(cache_path).
+              Users and spaces are looked up again by every fork.
+        type: path
+        env:
+            - name: ATLASSIAN_CACHE_PATH
 '''
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: atlassian
+
+short_description: HttpApi plugin for the Atlassian Cloud APIs
+
+description:
+    - Keeps an HTTP session to the Jira, Confluence and Bitbucket Cloud APIs open for the lifetime of the
+      persistent connection, so all tasks of a play against the host reuse the same TCP and TLS connections.
+    - Use it with the C(ansible.netcommon.httpapi) connection and C(ansible_network_os=scsitteam.atlassian.atlassian).
+    - The modules still build their URLs from O(scsitteam.atlassian.jira_info#module:atlassian_instance).
+    - Requests are authenticated with the module credentials, or C(ansible_user) and C(ansible_httpapi_password)
+      if the module has none.
+
+options:
+    pool_maxsize:
+        description:
+            - Maximum number of connections kept open per host.
+        type: int
+        default: 16
+        vars:
+            - name: ansible_httpapi_atlassian_pool_maxsize
+
+author:
+    - Marius Rieder (@jiuka)
+'''
+
+import base64
+import time
+
+from ansible.errors import AnsibleConnectionFailure
+from ansible.module_utils.basic import missing_required_lib
+from ansible.plugins.httpapi import HttpApiBase
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.transport import HAS_REQUESTS, KeepAliveAdapter
+
+if HAS_REQUESTS:
+    import requests
+
+
+class HttpApi(HttpApiBase):
+    def __init__(self, connection):
+        super().__init__(connection)
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            if not HAS_REQUESTS:
+                raise AnsibleConnectionFailure(missing_required_lib('requests'))
+            self._session = requests.Session()
+            adapter = KeepAliveAdapter(
+                pool_maxsize=self.get_option('pool_maxsize'),
+                pool_block=True,
+                max_retries=0,
+            )
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+            self._session.verify = self.connection.get_option('validate_certs')
+        return self._session
+
+    def send_request(self, method, url, headers=None, body=None, timeout=None):
+        """Send a request prepared by a module and return its response.
+
+        The content is returned base64 encoded as the response has to pass
+        the JSON-RPC channel back to the module.
+        """
+        headers = dict(headers or {})
+        auth = None
+        if 'Authorization' not in headers and self.connection.get_option('remote_user'):
+            auth = (self.connection.get_option('remote_user'), self.connection.get_option('password'))
+
+        start = time.monotonic()
+        response = self.session.request(
+            method, url,
+            headers=headers,
+            data=body.encode('utf-8') if body is not None else None,
+            auth=auth,
+            timeout=tuple(timeout) if isinstance(timeout, list) else timeout,
+        )
+        return dict(
+            status=response.status_code,
+            reason=response.reason,
+            headers=dict(response.headers),
+            content=base64.b64encode(response.content).decode('ascii'),
+            elapsed=time.monotonic() - start,
+        )
+
+    def logout(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: atlassian
+
+short_description: Jira projects, Confluence spaces and Bitbucket projects as inventory
+
+description:
+    - Adds a host for every Jira project, Confluence space and Bitbucket project of an Atlassian Cloud instance.
+    - Hosts are named C(jira-<key>), C(confluence-<key>) and C(bitbucket-<key>) and added to the
+      C(jira_projects), C(confluence_spaces) and C(bitbucket_projects) groups.
+    - The API object of a host is available as the C(jira_project), C(confluence_space) or C(bitbucket_project) host variable.
+    - Hosts use the local connection, tasks run against the API from the controller.
+    - Pages of objects are fetched concurrently once the first page tells how many objects there are.
+    - Configuration files must end in C(atlassian.yml) or C(atlassian.yaml).
+
+options:
+    plugin:
+        description:
+            - The name of this plugin, it should always be set to V(scsitteam.atlassian.atlassian).
+        type: str
+        required: true
+        choices: ['scsitteam.atlassian.atlassian']
+
+    sources:
+        description:
+            - Kinds of objects to add as hosts.
+        type: list
+        elements: str
+        choices: ['jira_projects', 'confluence_spaces', 'bitbucket_projects']
+        default: ['jira_projects', 'confluence_spaces']
+
+    bitbucket_workspace:
+        description:
+            - Bitbucket workspace to add the projects of.
+            - Required if O(sources) contains V(bitbucket_projects). The same credentials are used.
+        type: str
+
+    parallel_requests:
+        description:
+            - Maximum number of pages fetched at once.
+        type: int
+        default: 4
+
+extends_documentation_fragment:
+- constructed
+- inventory_cache
+- scsitteam.atlassian.atlassian.plugin
+author:
+    - Marius Rieder (@jiuka)
+'''
+
+EXAMPLES = '''
+# atlassian.yml
+plugin: scsitteam.atlassian.atlassian
+atlassian_instance: example
+sources:
+  - jira_projects
+  - confluence_spaces
+  - bitbucket_projects
+bitbucket_workspace: example
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.cache/ansible/atlassian
+cache_timeout: 3600
+keyed_groups:
+  - key: jira_project.projectTypeKey | default(omit)
+    prefix: jira_type
+compose:
+  project_lead: jira_project.lead.displayName | default(omit)
+'''
+
+from ansible.errors import AnsibleParserError
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import (
+    AtlassianApiError, BitbucketApi, ConfluenceApi, JiraPlatformApi)
+from ansible_collections.scsitteam.atlassian.plugins.plugin_utils.atlassian import PLUGIN_OPTIONS, PluginModule
+
+# Group, host name prefix and host variable of every source
+SOURCES = dict(
+    jira_projects=('jira-', 'jira_project'),
+    confluence_spaces=('confluence-', 'confluence_space'),
+    bitbucket_projects=('bitbucket-', 'bitbucket_project'),
+)
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+    NAME = 'scsitteam.atlassian.atlassian'
+
+    def verify_file(self, path):
+        return super().verify_file(path) and path.endswith(('atlassian.yml', 'atlassian.yaml'))
+
+    def parse(self, inventory, loader, path, cache=True):
+        super().parse(inventory, loader, path)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option('cache') and cache
+        update_cache = self.get_option('cache') and not cache
+        objects = None
+        if use_cache:
+            try:
+                objects = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if objects is None:
+            objects = self._fetch()
+        if update_cache:
+            self._cache[cache_key] = objects
+
+        self._populate(objects)
+
+    def _module(self, **options):
+        options = dict({option: self.get_option(option) for option in PLUGIN_OPTIONS},
+                       parallel_requests=self.get_option('parallel_requests'), **options)
+        module = PluginModule(self.NAME, options, error=AnsibleParserError)
+        if not module.params.get('atlassian_instance'):
+            raise AnsibleParserError("No atlassian_instance given")
+        return module
+
+    def _fetch(self):
+        """Fetch the objects of every source, return them by source."""
+        objects = {}
+        try:
+            for source in self.get_option('sources'):
+                if source == 'jira_projects':
+                    api = JiraPlatformApi(self._module())
+                    objects[source] = api.paginate_all("/api/3/project/search", params=dict(maxResults=100, expand='description,lead'))
+                elif source == 'confluence_spaces':
+                    api = ConfluenceApi(self._module())
+                    objects[source] = api.paginate_all("/api/v2/spaces", params=dict(limit=250))
+                elif source == 'bitbucket_projects':
+                    if not self.get_option('bitbucket_workspace'):
+                        raise AnsibleParserError("bitbucket_workspace is required for bitbucket_projects")
+                    api = BitbucketApi(self._module(atlassian_instance=self.get_option('bitbucket_workspace')))
+                    objects[source] = api.paginate_all("/projects", params=dict(pagelen=100))
+        except AtlassianApiError as e:
+            raise AnsibleParserError(e.msg)
+        return objects
+
+    def _populate(self, objects):
+        strict = self.get_option('strict')
+        for source, items in objects.items():
+            prefix, variable = SOURCES[source]
+            self.inventory.add_group(source)
+            for item in items:
+                host = self.inventory.add_host(f"{prefix}{item['key']}", group=source)
+                self.inventory.set_variable(host, 'ansible_connection', 'local')
+                self.inventory.set_variable(host, variable, item)
+
+                hostvars = self.inventory.get_host(host).get_vars()
+                self._set_composite_vars(self.get_option('compose'), hostvars, host, strict=strict)
+                self._add_host_to_composed_groups(self.get_option('groups'), hostvars, host, strict=strict)
+                self._add_host_to_keyed_groups(self.get_option('keyed_groups'), hostvars, host, strict=strict)
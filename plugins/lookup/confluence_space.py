@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: confluence_space
+
+short_description: Look up Confluence spaces
+
+description:
+    - Returns the space for every space key given.
+    - The spaces are fetched in bulk and kept for the rest of the process only, they are not shared between forks.
+
+options:
+    _terms:
+        description:
+            - Keys of the spaces.
+        type: list
+        elements: str
+        required: true
+
+extends_documentation_fragment:
+- scsitteam.atlassian.atlassian.plugin
+author:
+    - Marius Rieder (@jiuka)
+'''
+
+EXAMPLES = '''
+- name: Show the ID of a space
+  ansible.builtin.debug:
+    msg: "{{ lookup('scsitteam.atlassian.confluence_space', 'DOCS').id }}"
+'''
+
+RETURN = '''
+_raw:
+    description: The spaces in the order of the terms.
+    type: list
+    elements: dict
+    contains:
+        id:
+            description: The ID of the space.
+            type: str
+        key:
+            description: The key of the space.
+            type: str
+        name:
+            description: The name of the space.
+            type: str
+'''
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import BULK_SIZE, ConfluenceApi, chunked
+from ansible_collections.scsitteam.atlassian.plugins.plugin_utils.atlassian import AtlassianLookupBase
+
+
+class LookupModule(AtlassianLookupBase):
+    api_class = ConfluenceApi
+
+    def resolve(self, api, terms):
+        spaces = {}
+        for chunk in chunked(terms, BULK_SIZE):
+            for space in api.paginate("/api/v2/spaces", params=dict(keys=','.join(chunk), limit=BULK_SIZE)):
+                spaces[space['key']] = space
+        return {term: spaces[term] for term in terms if term in spaces}
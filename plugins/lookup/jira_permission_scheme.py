@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: jira_permission_scheme
+
+short_description: Look up Jira permission schemes
+
+description:
+    - Returns the permission scheme for every name given.
+    - All permission schemes are fetched with a single request and kept for the rest of the process, see O(cache_path) to share them between forks.
+
+options:
+    _terms:
+        description:
+            - Names of the permission schemes.
+        type: list
+        elements: str
+        required: true
+
+extends_documentation_fragment:
+- scsitteam.atlassian.atlassian.plugin
+author:
+    - Marius Rieder (@jiuka)
+'''
+
+EXAMPLES = '''
+- name: Show the ID of the default permission scheme
+  ansible.builtin.debug:
+    msg: "{{ lookup('scsitteam.atlassian.jira_permission_scheme', 'Default Permission Scheme').id }}"
+'''
+
+RETURN = '''
+_raw:
+    description: The permission schemes in the order of the terms.
+    type: list
+    elements: dict
+    contains:
+        id:
+            description: The ID of the permission scheme.
+            type: int
+        name:
+            description: The name of the permission scheme.
+            type: str
+        description:
+            description: The description of the permission scheme.
+            type: str
+'''
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import JiraPlatformApi
+from ansible_collections.scsitteam.atlassian.plugins.plugin_utils.atlassian import AtlassianLookupBase
+
+
+class LookupModule(AtlassianLookupBase):
+    api_class = JiraPlatformApi
+
+    def resolve(self, api, terms):
+        schemes = {s['name']: s for s in api.get("/api/3/permissionscheme")['permissionSchemes']}
+        return {term: schemes[term] for term in terms if term in schemes}
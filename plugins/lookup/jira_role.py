@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: jira_role
+
+short_description: Look up Jira project roles
+
+description:
+    - Returns the project role for every name given.
+    - All roles are fetched with a single request and kept for the rest of the process, see O(cache_path) to share them between forks.
+
+options:
+    _terms:
+        description:
+            - Names of the project roles.
+        type: list
+        elements: str
+        required: true
+
+extends_documentation_fragment:
+- scsitteam.atlassian.atlassian.plugin
+author:
+    - Marius Rieder (@jiuka)
+'''
+
+EXAMPLES = '''
+- name: Show the ID of the Developers role
+  ansible.builtin.debug:
+    msg: "{{ lookup('scsitteam.atlassian.jira_role', 'Developers').id }}"
+
+- name: Get the IDs of several roles
+  ansible.builtin.set_fact:
+    role_ids: "{{ query('scsitteam.atlassian.jira_role', 'Developers', 'Administrators') | map(attribute='id') }}"
+'''
+
+RETURN = '''
+_raw:
+    description: The project roles in the order of the terms.
+    type: list
+    elements: dict
+    contains:
+        id:
+            description: The ID of the project role.
+            type: int
+        name:
+            description: The name of the project role.
+            type: str
+        description:
+            description: The description of the project role.
+            type: str
+'''
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import JiraPlatformApi
+from ansible_collections.scsitteam.atlassian.plugins.plugin_utils.atlassian import AtlassianLookupBase
+
+
+class LookupModule(AtlassianLookupBase):
+    api_class = JiraPlatformApi
+
+    def resolve(self, api, terms):
+        roles = {r['name']: r for r in api.get("/api/2/role")}
+        return {term: roles[term] for term in terms if term in roles}
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: jira_user
+
+short_description: Look up Jira users
+
+description:
+    - Returns the user for every name, email address or accountId given.
+    - AccountIds are resolved in bulk, names and email addresses need a search each.
+    - Users are kept for the rest of the process only, they are not shared between forks.
+
+options:
+    _terms:
+        description:
+            - Names, email addresses or accountIds of the users.
+        type: list
+        elements: str
+        required: true
+
+extends_documentation_fragment:
+- scsitteam.atlassian.atlassian.plugin
+author:
+    - Marius Rieder (@jiuka)
+'''
+
+EXAMPLES = '''
+- name: Show the accountId of a user
+  ansible.builtin.debug:
+    msg: "{{ lookup('scsitteam.atlassian.jira_user', 'jane.doe@example.com').accountId }}"
+
+- name: Get the accountIds of all team members
+  ansible.builtin.set_fact:
+    account_ids: "{{ query('scsitteam.atlassian.jira_user', *team) | map(attribute='accountId') }}"
+'''
+
+RETURN = '''
+_raw:
+    description: The users in the order of the terms.
+    type: list
+    elements: dict
+    contains:
+        accountId:
+            description: The accountId of the user.
+            type: str
+        displayName:
+            description: The display name of the user.
+            type: str
+        emailAddress:
+            description: The email address of the user, if visible.
+            type: str
+'''
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import JiraPlatformApi
+from ansible_collections.scsitteam.atlassian.plugins.plugin_utils.atlassian import AtlassianLookupBase
+
+
+class LookupModule(AtlassianLookupBase):
+    api_class = JiraPlatformApi
+
+    def resolve(self, api, terms):
+        users, missing = api.resolve_users(terms)
+        return users
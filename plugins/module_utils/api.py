@@ -7,23 +7,109 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-import traceback
-
-try:
-    import requests
-except ImportError:
-    HAS_ANOTHER_LIBRARY = False
-    ANOTHER_LIBRARY_IMPORT_ERROR = traceback.format_exc()
-else:
-    HAS_ANOTHER_LIBRARY = True
-    ANOTHER_LIBRARY_IMPORT_ERROR = None
+import random
+import re
+import threading
+import time
 
+from copy import deepcopy
+from datetime import datetime, timezone
 from functools import cached_property
+from urllib.parse import urlencode
+
+from ansible.module_utils.basic import missing_required_lib
+
+# requests, the transport and the response cache are only imported once the
+# first request is made. Each task is a fresh process, so this keeps them off
+# the startup path of modules which fail argument validation or never reach
+# the network.
+
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+RETRY_STATUS_CODES = frozenset((429, 502, 503, 504))
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 30
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+BULK_SIZE = 50
+ACCOUNT_ID = re.compile(r'^(?:[0-9a-f]{24}|[0-9]+:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$')
+GROUP_ID = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
+
+
+def chunked(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def retry_after(headers):
+    """Return the delay in seconds the server asked for, or None."""
+    from email.utils import parsedate_to_datetime
+
+    delays = []
+    for header in ('Retry-After', 'Beta-Retry-After'):
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            delays.append(float(value))
+        except ValueError:
+            try:
+                delays.append((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+
+    reset = headers.get('X-RateLimit-Reset')
+    if reset is not None:
+        try:
+            reset = float(reset)
+            # Either an epoch timestamp or a relative number of seconds
+            delays.append(reset - time.time() if reset > 1e9 else reset)
+        except ValueError:
+            try:
+                reset = datetime.fromisoformat(reset.replace('Z', '+00:00'))
+                if reset.tzinfo is None:
+                    reset = reset.replace(tzinfo=timezone.utc)
+                delays.append((reset - datetime.now(timezone.utc)).total_seconds())
+            except ValueError:
+                pass
+
+    if not delays:
+        return None
+    return max(0, max(delays))
+
+
+def backoff(attempt, delay=None):
+    """Full jitter exponential backoff, never shorter than the server delay."""
+    jitter = random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** attempt))
+    if delay is None:
+        return jitter
+    return delay + jitter / 4
+
+
+class AtlassianApiError(Exception):
+    """Raised instead of failing the module where fail_json can not be used."""
+
+    def __init__(self, msg, **kwargs):
+        super().__init__(msg)
+        self.msg = msg
+        self.kwargs = kwargs
 
 
 class AtlassianApi(object):
+    # Key holding the items of a page of a paginated endpoint
+    page_key = 'values'
+
+    # Seconds responses of a path (and its sub paths) may be served from
+    # the response cache, if enabled.
+    cache_ttls = {}
+
+    # List endpoints of the objects kept in the resolver index, their TTL
+    # is the one of the response cache.
+    indexed = ()
+
     def __init__(self, module):
         self.module = module
+        self._objects = {}
 
     def url(self, url):
         pass
@@ -40,73 +126,563 @@ class AtlassianApi(object):
     def delete(self, url, **kwargs):
         return self._request('DELETE', url, **kwargs)
 
-    def _request(self, method, url, **kwargs):
-        url = self.url(url)
+    def paginate(self, url, stream=False, **kwargs):
+        """Lazily yield the items of a paginated list endpoint.
+
+        Pages are only fetched as the caller consumes the generator, so
+        stopping early (e.g. with next()) avoids fetching further pages.
+        With stream=True every page is parsed incrementally as well.
+        """
+        while url is not None:
+            if stream:
+                items = self.get(url, stream=self.page_key, **kwargs)
+                if items is None:
+                    return
+                yield from items
+                page, count = items.document, items.count
+            else:
+                page = self.get(url, **kwargs)
+                if page is None:
+                    return
+                yield from self._page_items(page)
+                count = len(self._page_items(page))
+            url, kwargs = self._next_page(url, page, count, kwargs)
+
+    def paginate_all(self, url, **kwargs):
+        """Return all items of a paginated list endpoint.
+
+        Once the first page tells how many items there are, all remaining
+        pages are fetched with up to parallel_requests requests at once.
+        Endpoints without a total are paginated one page after the other.
+        """
+        page = self.get(url, **kwargs)
+        if page is None:
+            return []
+        items = list(self._page_items(page))
+        remaining = self._remaining_pages(page, len(items), kwargs)
+        if remaining is None:
+            next_url, next_kwargs = self._next_page(url, page, len(items), kwargs)
+            if next_url is not None:
+                items.extend(self.paginate(next_url, **next_kwargs))
+            return items
+        for page in self.map_concurrently(lambda page_kwargs: self.get(url, **page_kwargs), remaining):
+            items.extend(self._page_items(page or {self.page_key: []}))
+        return items
+
+    def map_concurrently(self, fn, items):
+        """Return fn applied to every item, with up to parallel_requests calls at once.
+
+        Meant for lookups, unlike ApiExecutor the calls are made in check
+        mode as well.
+        """
+        items = list(items)
+        if len(items) < 2:
+            return [fn(item) for item in items]
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max(1, self.module.params.get('parallel_requests') or 1)) as pool:
+            try:
+                return list(pool.map(fn, items))
+            except AtlassianApiError as e:
+                self._fail(e.msg, **e.kwargs)
+
+    def _page_items(self, page):
+        return page[self.page_key]
+
+    def _next_page(self, url, page, count, kwargs):
+        return None, kwargs
+
+    def _remaining_pages(self, page, count, kwargs):
+        """Request kwargs of all pages after page, None if the total is not known."""
+        return None
+
+    @staticmethod
+    def _resolved(memo, names):
+        found = {n: memo[n] for n in names if memo.get(n) is not None}
+        missing = [n for n in dict.fromkeys(names) if memo.get(n) is None]
+        return found, missing
+
+    def _request(self, method, url, retry=None, stream=None, max_age=None, **kwargs):
+        """Send a request to the API and return the decoded response.
+
+        With stream set the response body is parsed incrementally and a
+        JsonArrayStream over the array stream names (or the document itself
+        if stream is True) is returned instead. With max_age set cached
+        responses older than max_age seconds are revalidated before their
+        TTL expires.
+        """
+        resource = None
+        if not url.startswith('https://'):
+            resource = url
+            url = self.url(url)
+        if retry is None:
+            retry = method.upper() in IDEMPOTENT_METHODS
+
+        # Serve cacheable reference data from the response cache
+        ttl = self._cache_ttl(resource) if method.upper() == 'GET' and not stream else None
+        entry = None
+        if ttl:
+            cache_url = f"{url}?{urlencode(sorted((kwargs.get('params') or {}).items()), doseq=True)}"
+            entry = self._cache.get(resource, cache_url)
+            if entry is not None:
+                if time.time() - entry['stored'] < (ttl if max_age is None else max_age):
+                    self.module.stats.record(method, url, 'cached')
+                    return entry['body']
+                headers = dict(kwargs.get('headers') or {})
+                if entry.get('etag'):
+                    headers['If-None-Match'] = entry['etag']
+                if entry.get('last_modified'):
+                    headers['If-Modified-Since'] = entry['last_modified']
+                kwargs['headers'] = headers
+
+        self._require_requests()
+        import requests
         try:
-            resp = self._cli.request(method, url, **kwargs)
-            if resp.status_code == 404:
-                return None
-            if resp.status_code == 204:
-                return None
-            resp.raise_for_status()
-            return resp.json()
+            try:
+                resp = self._send(method, url, retry, stream=bool(stream), **kwargs)
+            finally:
+                if method.upper() not in ('GET', 'HEAD') and resource is not None and self._cache is not None:
+                    self._cache.invalidate(resource)
+                    self._invalidate_index(resource)
+            streamed = None
+            try:
+                if resp.status_code == 304 and entry is not None:
+                    self._cache.touch(resource, cache_url, entry)
+                    return entry['body']
+                if resp.status_code == 404:
+                    return None
+                if resp.status_code == 204:
+                    return None
+                resp.raise_for_status()
+                if stream:
+                    from ansible_collections.scsitteam.atlassian.plugins.module_utils.jsonstream import JsonArrayStream
+                    streamed = JsonArrayStream(
+                        resp.iter_content(STREAM_CHUNK_SIZE), None if stream is True else stream,
+                        fail=lambda e: self._fail(f"Could not stream {method.upper()} {url}: {e}"),
+                        close=resp.close,
+                    )
+                    return streamed
+                data = resp.json()
+                if ttl:
+                    self._cache.set(resource, cache_url, data, resp.headers)
+                return data
+            finally:
+                # Unless the stream closes it, release the connection of an unread streamed body to the pool
+                if streamed is None:
+                    resp.close()
         except requests.HTTPError as e:
-            self.module.fail_json(f"Could not {method.upper()} {url}: {str(e)}", test=e.response.text)
+            self._fail(f"Could not {method.upper()} {url}: {str(e)}", test=e.response.text)
         except requests.JSONDecodeError as e:
-            self.module.fail_json(f"API returned invalid JSON when trying to {method.upper()} {url}: {str(e)}")
+            self._fail(f"API returned invalid JSON when trying to {method.upper()} {url}: {str(e)}")
         except Exception as e:
-            self.module.fail_json(f"Could not {method.upper()} {url}: {str(e)}")
+            self._fail(f"Could not {method.upper()} {url}: {str(e)}")
+
+    def _require_requests(self):
+        from ansible_collections.scsitteam.atlassian.plugins.module_utils.transport import HAS_REQUESTS, REQUESTS_IMPORT_ERROR
+        if not HAS_REQUESTS:
+            self._fail(missing_required_lib('requests'), exception=REQUESTS_IMPORT_ERROR)
+
+    def _fail(self, msg, **kwargs):
+        # fail_json exits the process, which is only safe on the main thread
+        if threading.current_thread() is not threading.main_thread():
+            raise AtlassianApiError(msg, **kwargs)
+        self.module.fail_json(msg, **kwargs)
+
+    def _send(self, method, url, retry, **kwargs):
+        """Send the request, retrying throttled or failed attempts.
+
+        Only requests flagged as retry safe are repeated. Idempotent methods
+        are by default, POST requests have to opt in with retry=True.
+        """
+        max_retries = (self.module.params.get('max_retries') or 0) if retry else 0
+        deadline = time.monotonic() + (self.module.params.get('retry_deadline') or 0)
+        if self._cli.deadline is not None:
+            deadline = min(deadline, self._cli.deadline)
+        import requests
+        attempt, latency, resp = 0, 0.0, None
+        try:
+            while True:
+                if self._limiter is not None:
+                    self.module.stats.limited(self._limiter.acquire())
+                start = time.monotonic()
+                try:
+                    resp = self._cli.request(method, url, **kwargs)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    if attempt >= max_retries:
+                        raise
+                    resp, delay, error = None, None, e
+                else:
+                    if resp.status_code not in RETRY_STATUS_CODES or attempt >= max_retries:
+                        return resp
+                    delay = retry_after(resp.headers)
+                finally:
+                    latency += time.monotonic() - start
+
+                delay = backoff(attempt, delay)
+                if time.monotonic() + delay > deadline:
+                    if resp is None:
+                        raise error
+                    return resp
+
+                if resp is not None:
+                    resp.close()
+                self.module.stats.retried(delay)
+                time.sleep(delay)
+                attempt += 1
+        finally:
+            self._record(method, url, resp, latency, attempt, kwargs.get('stream'))
+
+    def _record(self, method, url, resp, latency, retries, stream=False):
+        if resp is None:
+            self.module.stats.record(method, url, 'error', latency=latency, retries=retries)
+            return
+        body = resp.request.body if resp.request is not None else None
+        if stream:
+            bytes_in = int(resp.headers.get('Content-Length') or 0)
+        else:
+            bytes_in = len(resp.content or b'')
+        self.module.stats.record(method, url, resp.status_code, bytes_in=bytes_in, bytes_out=len(body or b''),
+                                 latency=latency, retries=retries)
+
+    def _cache_ttl(self, resource):
+        """TTL of the longest matching cache_ttls prefix, None if not cacheable."""
+        if resource is None or self._cache is None:
+            return None
+        path = '/' + resource.lstrip('/').split('?', 1)[0]
+        matches = [prefix for prefix in self.cache_ttls if path == prefix or path.startswith(prefix + '/')]
+        if not matches:
+            return None
+        return self.cache_ttls[max(matches, key=len)]
 
     @cached_property
-    def _cli(self):
-        cli = requests.Session()
-        cli.auth = (
-            self.module.params.get('atlassian_username'),
-            self.module.params.get('atlassian_password')
+    def _cache(self):
+        if not self.module.params.get('cache_path'):
+            from ansible_collections.scsitteam.atlassian.plugins.module_utils.cache import MemoryCache
+            return MemoryCache()
+        from ansible_collections.scsitteam.atlassian.plugins.module_utils.cache import ResponseCache, credentials_hash
+        return ResponseCache(
+            self.module.params.get('cache_path'),
+            credentials_hash(self.module.params),
+            (self.module.params.get('cache_max_size') or 0) * 1024 * 1024,
+        )
+
+    @cached_property
+    def _index(self):
+        from ansible_collections.scsitteam.atlassian.plugins.module_utils.resolver import ResolverIndex, index_path
+        if not self.module.params.get('cache_path'):
+            return ResolverIndex()
+        from ansible_collections.scsitteam.atlassian.plugins.module_utils.cache import credentials_hash
+        return ResolverIndex(index_path(self.module.params.get('cache_path'), credentials_hash(self.module.params)))
+
+    def _resolve_id(self, kind, name, load):
+        """Return the id of the object named name from the resolver index, None if there is none.
+
+        load(max_age) returns all objects of kind. They are kept for the
+        module run, so looking up an object just loaded needs no request.
+        """
+        def index(reload):
+            objects = load(0 if reload else None) or []
+            self._objects[kind] = {o['name']: o for o in objects}
+            return {o['name']: str(o['id']) for o in objects}
+
+        return self._index.lookup(kind, name, index, self.cache_ttls[kind])
+
+    def _get_indexed(self, kind, name, load, **kwargs):
+        """Return the object named name, fetched by the id from the resolver index."""
+        for attempt in range(2):
+            id = self._resolve_id(kind, name, load)
+            if id is None:
+                return None
+            if not kwargs and name in self._objects.get(kind, {}):
+                return deepcopy(self._objects[kind][name])
+            found = self.get(f"{kind}/{id}", **kwargs)
+            if found is not None:
+                return found
+            # Deleted since the index was loaded
+            self._cache.invalidate(kind)
+            self._invalidate_index(kind)
+        return None
+
+    def _invalidate_index(self, resource):
+        path = resource.strip('/').split('?', 1)[0]
+        for kind in self.indexed:
+            if path == kind.strip('/') or path.startswith(kind.strip('/') + '/'):
+                self._objects.pop(kind, None)
+                self._index.invalidate(kind)
+
+    @cached_property
+    def _limiter(self):
+        if not self.module.params.get('rate_limit'):
+            return None
+        import tempfile
+        from ansible_collections.scsitteam.atlassian.plugins.module_utils.ratelimit import RateLimiter, state_path
+        return RateLimiter(
+            state_path(self.module.params.get('cache_path') or tempfile.gettempdir(), self.module.params.get('atlassian_instance')),
+            self.module.params.get('rate_limit'),
+            self.module.params.get('rate_limit_burst'),
         )
-        cli.headers.update({
+
+    @cached_property
+    def _cli(self):
+        from ansible_collections.scsitteam.atlassian.plugins.module_utils.transport import Transport
+        cli = Transport(self.module)
+        # Over a persistent connection the httpapi plugin may authenticate instead
+        if self.module.params.get('atlassian_username'):
+            cli.session.auth = (
+                self.module.params.get('atlassian_username'),
+                self.module.params.get('atlassian_password')
+            )
+        cli.session.headers.update({
             'User-Agent': f"Ansible-{self.module.ansible_version}/{self.module._name}",
         })
-        cli.verify = self.module.params.get('validate_certs')
+        cli.session.verify = self.module.params.get('validate_certs')
 
         return cli
 
 
 class ConfluenceApi(AtlassianApi):
+    def __init__(self, module):
+        super().__init__(module)
+        self._users = {}
+        self._groups = {}
+
     def url(self, url):
         return f"https://{self.module.params.get('atlassian_instance')}.atlassian.net/wiki/{url.lstrip('/')}"
 
+    page_key = 'results'
+
+    def _next_page(self, url, page, count, kwargs):
+        # Cursor based, the next link already carries all query parameters
+        next_url = page.get('_links', {}).get('next')
+        if next_url is None:
+            return None, kwargs
+        kwargs = kwargs.copy()
+        kwargs.pop('params', None)
+        return next_url.split('/wiki/', 1)[-1], kwargs
+
+    def has_pages(self, space_id):
+        """Check if a space has any pages by fetching at most one."""
+        return bool(self.page_titles(space_id, 1))
+
+    def page_titles(self, space_id, limit):
+        """Titles of the first limit pages of a space, fetched with a single request."""
+        pages = self.get(f"/api/v2/spaces/{space_id}/pages", params=dict(limit=limit))
+        return [p['title'] for p in pages['results']] if pages else []
+
+    def count_pages(self, space_key):
+        """Number of pages in a space without fetching them."""
+        found = self.get("/rest/api/search", params=dict(cql=f'space="{space_key}" and type=page', limit=1, excerpt='none'))
+        return found['totalSize'] if found else 0
+
+    def get_space(self, key):
+        spaces = self.get("/api/v2/spaces", params=dict(keys=key))
+        return next((s for s in spaces['results'] if s['key'] == key), None) if spaces else None
+
+    def resolve_users(self, names):
+        """Resolve user names or accountIds to accountIds.
+
+        Names need a search each, which are sent concurrently. The search
+        is fuzzy, only users with exactly the name as display name count.
+        Results are memoized for the lifetime of the API object. Returns a
+        dict of name to accountId and the list of names that could not be
+        resolved.
+        """
+        pending = [n for n in dict.fromkeys(names) if n not in self._users]
+        for name in pending:
+            if ACCOUNT_ID.match(name):
+                self._users[name] = name
+
+        def search(name):
+            quoted = name.replace('\\', '\\\\').replace('"', '\\"')
+            found = self.paginate("/rest/api/search/user", params=dict(cql=f'user.fullname~"{quoted}"', limit=200))
+            account_ids = [result['user']['accountId'] for result in found if result['user'].get('displayName') == name]
+            return account_ids[0] if len(account_ids) == 1 else None
+
+        pending = [n for n in pending if n not in self._users]
+        self._users.update(zip(pending, self.map_concurrently(search, pending)))
+        return self._resolved(self._users, names)
+
+    def resolve_groups(self, names):
+        """Resolve group names or groupIds to groupIds, like resolve_users()."""
+        pending = [n for n in dict.fromkeys(names) if n not in self._groups]
+        for name in pending:
+            if GROUP_ID.match(name):
+                self._groups[name] = name
+
+        def by_name(name):
+            group = self.get("/rest/api/group/by-name", params=dict(name=name))
+            return group['id'] if group else None
+
+        pending = [n for n in pending if n not in self._groups]
+        self._groups.update(zip(pending, self.map_concurrently(by_name, pending)))
+        return self._resolved(self._groups, names)
+
 
 class JiraPlatformApi(AtlassianApi):
+    cache_ttls = {
+        '/api/2/role': 3600,
+        '/api/3/permissionscheme': 3600,
+        '/api/3/notificationscheme': 3600,
+        '/api/3/application-properties': 300,
+    }
+
+    indexed = ('/api/2/role', '/api/3/permissionscheme', '/api/3/notificationscheme')
+
+    def __init__(self, module):
+        super().__init__(module)
+        self._users = {}
+        self._groups = {}
+
     def url(self, url):
         return f"https://{self.module.params.get('atlassian_instance')}.atlassian.net/rest/{url.lstrip('/')}"
 
-    def get_role(self, name):
-        roles = self.get("/api/2/role")
-        return next(filter(lambda r: r['name'] == name, roles), None)
+    def _next_page(self, url, page, count, kwargs):
+        # Offset based, isLast is not returned by every endpoint
+        start = page.get('startAt', 0) + count
+        if page.get('isLast', start >= page.get('total', start)) or not count:
+            return None, kwargs
+        kwargs = kwargs.copy()
+        kwargs['params'] = dict(kwargs.get('params') or {}, startAt=start)
+        return url, kwargs
+
+    def _remaining_pages(self, page, count, kwargs):
+        if 'total' not in page:
+            return None
+        size = page.get('maxResults') or count
+        if not size:
+            return []
+        params = kwargs.get('params') or {}
+        return [dict(kwargs, params=dict(params, startAt=start))
+                for start in range(page.get('startAt', 0) + size, page['total'], size)]
+
+    def has_issues(self, jql):
+        """Check if any issue matches jql by fetching at most one issue key."""
+        return bool(self.issue_keys(jql, 1))
+
+    def issue_keys(self, jql, limit):
+        """Keys of the first limit issues matching jql, fetched with a single request."""
+        issues = self.get("/api/3/search/jql", params=dict(jql=jql, maxResults=limit, fields='key'))
+        return [i['key'] for i in issues['issues']] if issues else []
+
+    def count_issues(self, jql):
+        """Number of issues matching jql without fetching any of them.
+
+        Uses the approximate count endpoint and falls back to the total of an
+        empty search where it is not available.
+        """
+        count = self.post("/api/3/search/approximate-count", json=dict(jql=jql), retry=True)
+        if count is not None:
+            return count['count']
+        issues = self.get("/api/2/search", params=dict(jql=jql, maxResults=0, fields='key'))
+        return issues['total']
+
+    def _load_roles(self, max_age=None):
+        return self.get("/api/2/role", max_age=max_age)
+
+    def _load_permission_schemes(self, max_age=None):
+        schemes = self.get("/api/3/permissionscheme", max_age=max_age)
+        return schemes['permissionSchemes'] if schemes else []
+
+    def _load_notification_schemes(self, max_age=None):
+        return self.paginate_all("/api/3/notificationscheme", params=dict(maxResults=50), max_age=max_age)
+
+    def role_id(self, name):
+        return self._resolve_id('/api/2/role', name, self._load_roles)
+
+    def permission_scheme_id(self, name):
+        return self._resolve_id('/api/3/permissionscheme', name, self._load_permission_schemes)
+
+    def notification_scheme_id(self, name):
+        return self._resolve_id('/api/3/notificationscheme', name, self._load_notification_schemes)
+
+    def get_role(self, name, **kwargs):
+        return self._get_indexed('/api/2/role', name, self._load_roles, **kwargs)
+
+    def get_permission_scheme(self, name, **kwargs):
+        return self._get_indexed('/api/3/permissionscheme', name, self._load_permission_schemes, **kwargs)
 
     def get_project_role(self, project, role):
-        project_roles = self.get(f"/api/2/project/{project}/role")
-        if role not in project_roles:
-            return
-        url = project_roles[role].split('/', 4)[-1]
-        return self.get(url)
+        role_id = self.role_id(role)
+        if role_id is None:
+            return None
+        return self.get(f"/api/2/project/{project}/role/{role_id}")
 
     def get_user(self, name):
-        users = self.get(f"/api/3/user/search?query={ name }")
-        if len(users) == 1:
-            return users[0]
-        return None
+        users, missing = self.resolve_users([name])
+        return users.get(name)
 
     def get_group(self, name):
-        groups = self.get("/api/2/groups/picker", params=dict(query=name, property="name"))
-        return next(filter(lambda g: g['name'] == name, groups["groups"]), None)
+        groups, missing = self.resolve_groups([name])
+        return groups.get(name)
+
+    def resolve_users(self, names):
+        """Resolve user names or accountIds to users.
+
+        AccountIds are resolved in bulk, names need a search each, which are
+        sent concurrently. The search is fuzzy, only users with exactly the
+        name as display name or email address count. Results are memoized
+        for the lifetime of the API object. Returns a dict of name to user
+        and the list of names that could not be resolved.
+        """
+        pending = [n for n in dict.fromkeys(names) if n not in self._users]
+
+        account_ids = [n for n in pending if ACCOUNT_ID.match(n)]
+        for chunk in chunked(account_ids, BULK_SIZE):
+            for user in self.paginate("/api/3/user/bulk", params=dict(accountId=chunk, maxResults=BULK_SIZE)):
+                self._users[user['accountId']] = user
+
+        def search(name):
+            users = self.get("/api/3/user/search", params=dict(query=name)) or []
+            users = [u for u in users if name in (u.get('displayName'), u.get('emailAddress'))]
+            return users[0] if len(users) == 1 else None
+
+        pending = [n for n in pending if n not in self._users]
+        self._users.update(zip(pending, self.map_concurrently(search, pending)))
+        return self._resolved(self._users, names)
+
+    def resolve_groups(self, names):
+        """Resolve group names or groupIds to groups with as few bulk requests as possible.
+
+        Results are memoized for the lifetime of the API object. Returns a
+        dict of name to group and the list of names that could not be
+        resolved.
+        """
+        pending = [n for n in dict.fromkeys(names) if n not in self._groups]
+
+        group_ids = [n for n in pending if GROUP_ID.match(n)]
+        group_names = [n for n in pending if not GROUP_ID.match(n)]
+        for key, values in (('groupId', group_ids), ('groupName', group_names)):
+            for chunk in chunked(values, BULK_SIZE):
+                for group in self.paginate("/api/2/group/bulk", params={key: chunk, 'maxResults': BULK_SIZE}):
+                    self._groups[group['groupId']] = group
+                    self._groups[group['name']] = group
+
+        for name in pending:
+            self._groups.setdefault(name, None)
+
+        return self._resolved(self._groups, names)
 
 
 class BitbucketApi(AtlassianApi):
     def url(self, url):
         return f"https://api.bitbucket.org/2.0/workspaces/{self.module.params.get('atlassian_instance')}/{url.lstrip('/')}"
 
+    def _next_page(self, url, page, count, kwargs):
+        # The next link is absolute and already carries all query parameters
+        if 'next' not in page:
+            return None, kwargs
+        kwargs = kwargs.copy()
+        kwargs.pop('params', None)
+        return page['next'], kwargs
+
+    def _remaining_pages(self, page, count, kwargs):
+        # size is optional, it is left out where counting is expensive
+        if 'size' not in page or not page.get('pagelen'):
+            return None
+        params = kwargs.get('params') or {}
+        last = -(-page['size'] // page['pagelen'])
+        return [dict(kwargs, params=dict(params, page=number, pagelen=page['pagelen']))
+                for number in range(page.get('page', 1) + 1, last + 1)]
+
 
 class BitbucketLegacyApi(AtlassianApi):
     def url(self, url):
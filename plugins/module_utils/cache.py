@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from contextlib import contextmanager
+from copy import deepcopy
+
+
+def credentials_hash(params):
+    """Hash identifying the instance and credentials a module runs with."""
+    return hashlib.sha256('\0'.join([
+        params.get('atlassian_instance') or '',
+        params.get('atlassian_username') or '',
+        params.get('atlassian_password') or '',
+    ]).encode()).hexdigest()
+
+
+def resource_group(resource):
+    """Invalidation group of a resource, the first three path segments (e.g. api/2/role)."""
+    return '/'.join(resource.strip('/').split('?', 1)[0].split('/')[:3])
+
+
+def cache_entry(url, body, headers):
+    return dict(
+        url=url,
+        stored=time.time(),
+        etag=headers.get('ETag'),
+        last_modified=headers.get('Last-Modified'),
+        body=body,
+    )
+
+
+@contextmanager
+def locked(path, shared=False):
+    """Hold an flock on path, shared between readers or exclusive."""
+    with open(path, 'a') as fd:
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class ResponseCache(object):
+    """On disk cache for API responses shared between module runs.
+
+    Entries are grouped by instance, credentials and resource (the first
+    three path segments, e.g. api/2/role) so a write can invalidate every
+    cached response of the resource it touched. Concurrent module runs
+    coordinate through an flock on the cache directory and the least
+    recently used entries are evicted once max_size bytes are exceeded.
+    """
+
+    def __init__(self, path, scope, max_size):
+        self.path = path
+        self.scope = scope
+        self.max_size = max_size
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        self.lock = os.path.join(self.path, '.lock')
+
+    def _group(self, resource):
+        return os.path.join(self.path, hashlib.sha256(f"{self.scope}\0{resource_group(resource)}".encode()).hexdigest()[:32])
+
+    def _entry(self, resource, url):
+        return os.path.join(self._group(resource), hashlib.sha256(f"{self.scope}\0{url}".encode()).hexdigest() + '.json')
+
+    def get(self, resource, url):
+        """Return the cached entry for url or None."""
+        path = self._entry(resource, url)
+        try:
+            with open(path) as fd:
+                entry = json.load(fd)
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def set(self, resource, url, body, headers):
+        entry = cache_entry(url, body, headers)
+        group = self._group(resource)
+        with locked(self.lock):
+            os.makedirs(group, mode=0o700, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=group, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp, self._entry(resource, url))
+            self._evict()
+
+    def touch(self, resource, url, entry):
+        """Mark a revalidated entry as fresh again."""
+        self.set(resource, url, entry['body'], {'ETag': entry.get('etag'), 'Last-Modified': entry.get('last_modified')})
+
+    def invalidate(self, resource):
+        """Drop every cached response of the resource."""
+        with locked(self.lock):
+            shutil.rmtree(self._group(resource), ignore_errors=True)
+
+    def _evict(self):
+        entries = []
+        for group in os.scandir(self.path):
+            if not group.is_dir():
+                continue
+            for entry in os.scandir(group.path):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(e[1] for e in entries)
+        for mtime, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            size -= entry_size
+
+
+class MemoryCache(object):
+    """ResponseCache kept in memory for a single module run.
+
+    Used without cache_path, so the items of a module run share the
+    reference data they look up. Entries are copied on the way in and out
+    as callers modify the responses they get.
+    """
+
+    def __init__(self):
+        self.groups = {}
+        self.lock = threading.Lock()
+
+    def get(self, resource, url):
+        with self.lock:
+            return deepcopy(self.groups.get(resource_group(resource), {}).get(url))
+
+    def set(self, resource, url, body, headers):
+        entry = deepcopy(cache_entry(url, body, headers))
+        with self.lock:
+            self.groups.setdefault(resource_group(resource), {})[url] = entry
+
+    def touch(self, resource, url, entry):
+        self.set(resource, url, entry['body'], {'ETag': entry.get('etag'), 'Last-Modified': entry.get('last_modified')})
+
+    def invalidate(self, resource):
+        with self.lock:
+            self.groups.pop(resource_group(resource), None)
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import atexit
+import base64
+import fcntl
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+from requests.adapters import BaseAdapter
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.transport import CASSETTE_MODE_ENV, build_response
+
+# Never written to a cassette
+SCRUBBED_HEADERS = ('set-cookie', 'content-encoding', 'transfer-encoding', 'content-length')
+
+_cassettes = {}
+_cassettes_lock = threading.Lock()
+
+
+class CassetteMiss(Exception):
+    pass
+
+
+def request_key(request):
+    """Match requests on method, URL and body, JSON bodies independent of key order."""
+    body = request.body or b''
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    try:
+        body = json.dumps(json.loads(body), sort_keys=True).encode('utf-8')
+    except ValueError:
+        pass
+    return f"{request.method.upper()} {request.url} {hashlib.sha256(body).hexdigest()[:16]}"
+
+
+def cassette(path, mode, latency=0.0):
+    """Return the Cassette of path, shared by all transports of the process."""
+    if mode not in ('record', 'replay'):
+        raise ValueError(f"{CASSETTE_MODE_ENV} must be 'record' or 'replay', not {mode!r}")
+    with _cassettes_lock:
+        if (path, mode) not in _cassettes:
+            _cassettes[(path, mode)] = Cassette(path, mode, latency)
+        return _cassettes[(path, mode)]
+
+
+def flush():
+    """Write the responses recorded by every cassette of the process so far."""
+    with _cassettes_lock:
+        recording = [c for c in _cassettes.values() if c.mode == 'record']
+    for recorded in recording:
+        recorded.flush()
+
+
+class Cassette(object):
+    """Request and response pairs of recorded module runs.
+
+    A cassette is a gzip compressed file with one JSON object per response.
+    Request headers, including Authorization and cookies, are never stored
+    and neither are Set-Cookie response headers. Recorded responses are
+    appended as one gzip member per process once it exits, under a lock so
+    parallel forks can record into the same cassette.
+
+    Replaying serves identical requests in the order they were recorded,
+    the last response is repeated once they are used up. With latency set
+    the recorded latency, multiplied by latency, is waited before each
+    response is returned.
+    """
+
+    def __init__(self, path, mode, latency=0.0):
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self._entries = []
+        self._replay = {}
+        self._lock = threading.Lock()
+        if mode == 'replay':
+            self._load()
+        else:
+            atexit.register(self.flush)
+
+    def _load(self):
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._replay.setdefault(entry['key'], []).append(entry)
+
+    def record(self, request, response, latency):
+        content = response.content or b''
+        try:
+            body = dict(text=content.decode('utf-8'))
+        except UnicodeDecodeError:
+            body = dict(base64=base64.b64encode(content).decode('ascii'))
+        entry = dict(
+            key=request_key(request),
+            status=response.status_code,
+            reason=response.reason,
+            headers={k: v for k, v in response.headers.items() if k.lower() not in SCRUBBED_HEADERS},
+            latency=round(latency, 4),
+            **body
+        )
+        with self._lock:
+            self._entries.append(entry)
+
+    def play(self, request):
+        key = request_key(request)
+        with self._lock:
+            entries = self._replay.get(key)
+            if not entries:
+                raise CassetteMiss(f"No recorded response for {request.method} {request.url} in {self.path}")
+            entry = entries.pop(0) if len(entries) > 1 else entries[0]
+        if self.latency:
+            time.sleep(entry['latency'] * self.latency)
+        return entry
+
+    def flush(self):
+        """Append the responses recorded so far to the cassette."""
+        with self._lock:
+            entries, self._entries = self._entries, []
+        if not entries:
+            return
+        data = gzip.compress(''.join(json.dumps(e, separators=(',', ':')) + '\n' for e in entries).encode('utf-8'))
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'ab') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.write(data)
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class CassetteAdapter(BaseAdapter):
+    """Transport adapter recording to or replaying from a Cassette.
+
+    When recording every request is sent through adapter, replaying never
+    touches the network.
+    """
+
+    def __init__(self, cassette, adapter):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter if cassette.mode == 'record' else None
+
+    def send(self, request, **kwargs):
+        if self.adapter is not None:
+            start = time.monotonic()
+            response = self.adapter.send(request, **kwargs)
+            # Reading the content keeps it available for streaming callers
+            response.content
+            self.cassette.record(request, response, time.monotonic() - start)
+            return response
+
+        entry = self.cassette.play(request)
+        content = entry['text'].encode('utf-8') if 'text' in entry else base64.b64decode(entry['base64'])
+        return build_response(request, self, entry['status'], entry['reason'], entry['headers'], content, entry['latency'])
+
+    def close(self):
+        if self.adapter is not None:
+            self.adapter.close()
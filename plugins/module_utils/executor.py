@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ApiExecutor(object):
+    """Run independent API requests concurrently.
+
+    Calls submitted with submit() start right away on up to
+    parallel_requests worker threads. wait() returns their results in
+    submission order. Once a call fails, all calls which did not start yet
+    are cancelled and the module fails with the errors in submission
+    order. In check mode submitted calls are not executed at all.
+    """
+
+    def __init__(self, module):
+        self.module = module
+        self.pool = None
+        self.futures = []
+
+    def submit(self, fn, *args, **kwargs):
+        if self.module.check_mode:
+            self.futures.append(None)
+            return
+        if self.pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.pool = ThreadPoolExecutor(max_workers=max(1, self.module.params.get('parallel_requests') or 1))
+        self.futures.append(self.pool.submit(fn, *args, **kwargs))
+
+    def wait(self):
+        futures, self.futures = self.futures, []
+        pending = [f for f in futures if f is not None]
+        if not pending:
+            return [None] * len(futures)
+
+        from concurrent.futures import FIRST_EXCEPTION, wait
+        done, not_done = wait(pending, return_when=FIRST_EXCEPTION)
+        for future in not_done:
+            future.cancel()
+        self.pool.shutdown(wait=True)
+        self.pool = None
+
+        errors = []
+        for idx, future in enumerate(futures):
+            if future is None or future.cancelled() or future.exception() is None:
+                continue
+            error = future.exception()
+            errors.append(dict(index=idx, msg=getattr(error, 'msg', str(error)), **getattr(error, 'kwargs', {})))
+        if errors:
+            self.module.fail_json(msg=errors[0]['msg'], errors=errors)
+
+        return [None if f is None else f.result() for f in futures]
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import codecs
+import json
+
+WHITESPACE = ' \t\n\r'
+NUMBER = '+-.0123456789eE'
+
+
+class JsonArrayStream(object):
+    """Incrementally parse one array out of a JSON document.
+
+    Iterating yields the elements of the array as soon as they are complete,
+    only ever keeping the current element and the unparsed rest of the last
+    chunk in memory. The array is either the document itself (key=None) or
+    the value of key in the top level object.
+
+    After the iteration document holds the rest of the document with the
+    array left empty, e.g. to read pagination fields, and count the number
+    of elements yielded. fail is called with the error message if parsing
+    fails and close once the iteration ends, even if stopped early.
+    """
+
+    def __init__(self, chunks, key=None, fail=None, close=None):
+        self.chunks = iter(chunks)
+        self.key = key
+        self.fail = fail
+        self.close = close
+        self.count = 0
+        self.document = None
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self):
+        try:
+            yield from self._parse()
+        except Exception as e:
+            if self.fail is None:
+                raise
+            self.fail(str(e))
+            raise
+        finally:
+            if self.close is not None:
+                self.close()
+
+    def _read(self):
+        """Append the next chunk to the buffer, return False at the end.
+
+        The already consumed part of the buffer is dropped on the way.
+        """
+        if self._eof:
+            return False
+        chunk = next(self.chunks, None)
+        self._buf = self._buf[self._pos:]
+        self._pos = 0
+        if chunk is None:
+            self._eof = True
+            self._buf += self._decoder.decode(b'', final=True)
+            return False
+        self._buf += self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        return True
+
+    def _parse(self):
+        skeleton = [self._prefix()]
+
+        while True:
+            if not self._skip():
+                raise ValueError("Unexpected end of JSON array")
+            if self._buf[self._pos] == ']':
+                self._pos += 1
+                break
+            if self.count and self._buf[self._pos] == ',':
+                self._pos += 1
+                if not self._skip():
+                    raise ValueError("Unexpected end of JSON array")
+            elif self.count:
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {self._buf[self._pos]!r}")
+
+            # A number running up to the end of the buffer may still continue
+            if self._buf[self._pos] in NUMBER:
+                while len(self._buf.rstrip(NUMBER)) <= self._pos and self._read():
+                    pass
+
+            while True:
+                try:
+                    item, self._pos = self._json.raw_decode(self._buf, self._pos)
+                except ValueError:
+                    if not self._read():
+                        raise
+                    continue
+                break
+
+            self.count += 1
+            yield item
+
+        skeleton.append(']')
+        while self._read():
+            pass
+        skeleton.append(self._buf[self._pos:])
+        self._buf = ''
+        self.document = json.loads(''.join(skeleton))
+
+    def _skip(self):
+        """Move to the next non whitespace character, return False at the end."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return True
+            if not self._read():
+                return False
+
+    def _prefix(self):
+        """Consume the document up to and including the opening bracket of the array."""
+        depth = 0
+        in_string = escape = False
+        string_start = last_string = pending_key = None
+        pos = 0
+        while True:
+            while pos >= len(self._buf):
+                if not self._read():
+                    raise ValueError(f"JSON document has no array {self.key!r}")
+
+            char = self._buf[pos]
+            if in_string:
+                if escape:
+                    escape = False
+                elif char == '\\':
+                    escape = True
+                elif char == '"':
+                    in_string = False
+                    last_string = json.loads(self._buf[string_start:pos + 1])
+            elif char == '"':
+                in_string = True
+                string_start = pos
+            elif char in WHITESPACE:
+                pass
+            elif char == ':':
+                pending_key = last_string if depth == 1 else None
+            elif char == '[' and ((self.key is None and depth == 0) or (depth == 1 and pending_key == self.key)):
+                self._pos = pos + 1
+                return self._buf[:self._pos]
+            else:
+                if char in '{[':
+                    depth += 1
+                elif char in '}]':
+                    depth -= 1
+                pending_key = None
+            pos += 1
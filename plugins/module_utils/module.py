@@ -7,30 +7,212 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import os
+import threading
+
+from ansible.module_utils import basic
 from ansible.module_utils.basic import AnsibleModule, env_fallback
+from ansible.module_utils.common.arg_spec import ModuleArgumentSpecValidator
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import AtlassianApiError
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.stats import ApiStats
+
+# Directory to write cProfile and tracemalloc reports of every module run to
+PROFILE_DIR_ENV = 'ATLASSIAN_PROFILE_DIR'
+
+# Checks of the module options, applied to every item instead of the module
+ITEM_CHECKS = ('required_together', 'required_one_of', 'required_if', 'required_by')
+SUBOPTION_KEYS = ITEM_CHECKS + ('mutually_exclusive', 'options', 'apply_defaults')
+
+
+def atlassian_argument_spec():
+    """Options shared by every module, see the scsitteam.atlassian.atlassian doc fragment."""
+    return dict(
+        atlassian_instance=dict(
+            type='str',
+            required=False,
+            fallback=(env_fallback, ['ATLASSIAN_INSTANCE'])
+        ),
+        atlassian_username=dict(
+            type='str',
+            required=False,
+            fallback=(env_fallback, ['ATLASSIAN_USERNAME'])
+        ),
+        atlassian_password=dict(
+            type='str',
+            required=False,
+            fallback=(env_fallback, ['ATLASSIAN_PASSWORD']),
+            no_log=True
+        ),
+        validate_certs=dict(type='bool', default=True),
+        connection_timeout=dict(type='int', default=10),
+        read_timeout=dict(type='int', default=60),
+        api_deadline=dict(type='int'),
+        pool_connections=dict(type='int', default=4),
+        pool_maxsize=dict(type='int', default=16),
+        cache_path=dict(
+            type='path',
+            required=False,
+            fallback=(env_fallback, ['ATLASSIAN_CACHE_PATH'])
+        ),
+        cache_max_size=dict(type='int', default=64),
+        parallel_requests=dict(type='int', default=4),
+        max_retries=dict(type='int', default=5),
+        retry_deadline=dict(type='int', default=120),
+        rate_limit=dict(
+            type='float',
+            required=False,
+            fallback=(env_fallback, ['ATLASSIAN_RATE_LIMIT'])
+        ),
+        rate_limit_burst=dict(type='int', default=10),
+        api_stats=dict(type='bool', default=False),
+        items=dict(type='list', elements='dict'),
+    )
+
+
+class ItemFailed(Exception):
+    """Raised by fail_json while an item is processed."""
+
+    def __init__(self, msg, result):
+        super().__init__(msg)
+        self.msg = msg
+        self.result = result
+
+
+def items_given():
+    """Check if the module was called with items, before AnsibleModule validates the options."""
+    try:
+        params = basic._load_params()
+    except Exception:
+        # AnsibleModule reports unreadable options
+        return False
+    return isinstance(params, dict) and params.get('items') is not None
 
 
 class AnsibleAtlassianModule(AnsibleModule):
+    """AnsibleModule with the shared options of the collection.
+
+    Without items the module options are validated by AnsibleModule as
+    usual. With items every item is validated by run() on its own, with the
+    options of the task as defaults. Required options and the checks in
+    ITEM_CHECKS then apply per item, the options of the task are only
+    validated as far as needed to serve as defaults.
+    """
+
     def __init__(self, argument_spec, **kwargs):
-        argument_spec.update(dict(
-            atlassian_instance=dict(
-                type='str',
-                required=False,
-                fallback=(env_fallback, ['ATLASSIAN_INSTANCE'])
-            ),
-            atlassian_username=dict(
-                type='str',
-                required=False,
-                fallback=(env_fallback, ['ATLASSIAN_USERNAME'])
-            ),
-            atlassian_password=dict(
-                type='str',
-                required=False,
-                fallback=(env_fallback, ['ATLASSIAN_PASSWORD']),
-                no_log=True
-            ),
-            validate_certs=dict(type='bool', default=True),
-            connection_timeout=dict(type='int', default=10),
-        ))
+        self.item_spec = argument_spec
+        self.item_checks = {check: kwargs[check] for check in ITEM_CHECKS + ('mutually_exclusive',) if check in kwargs}
+        self._item = threading.local()
+
+        if items_given():
+            for check in ITEM_CHECKS:
+                kwargs.pop(check, None)
+            argument_spec = {
+                name: dict({k: v for k, v in spec.items() if k not in SUBOPTION_KEYS}, required=False, default=None)
+                for name, spec in argument_spec.items()
+            }
+        argument_spec = dict(argument_spec, **atlassian_argument_spec())
+
+        self.stats = ApiStats()
+
+        self.profiler = None
+        if os.environ.get(PROFILE_DIR_ENV):
+            from ansible_collections.scsitteam.atlassian.plugins.module_utils.profiling import Profiler
+            self.profiler = Profiler(os.environ[PROFILE_DIR_ENV])
+            self.profiler.start()
 
         super().__init__(argument_spec, **kwargs)
+
+    def exit_json(self, **kwargs):
+        self._finish(kwargs)
+        super().exit_json(**kwargs)
+
+    def fail_json(self, msg, **kwargs):
+        if getattr(self._item, 'current', None) is not None:
+            raise ItemFailed(msg, kwargs)
+        self._finish(kwargs)
+        super().fail_json(msg, **kwargs)
+
+    def run(self, process, prepare=None, parallel=False):
+        """Call process with the options of every item and exit with the results.
+
+        process takes the validated options of one item and returns its
+        result. Without items it is called once with the module options and
+        its result is the module result. With items a failed item does not
+        stop the others, the module fails once all were processed and
+        results holds the result of every item in order.
+
+        With items, prepare is called with the options of all valid items
+        first, e.g. to look up what they reference in bulk. With parallel
+        set up to parallel_requests items are processed at once.
+        """
+        if self.params.get('items') is None:
+            self.exit_json(**process(self.params))
+
+        defaults = {name: value for name, value in self.params.items() if name in self.item_spec and value is not None}
+        items = self.params['items']
+        params, results = [], []
+        for item in items:
+            validated, failure = self._call_item(item, self._validate_item, dict(defaults, **item))
+            params.append(validated)
+            results.append(failure)
+        if prepare is not None:
+            prepare([p for p in params if p is not None])
+
+        def process_item(idx):
+            if results[idx] is not None:
+                return results[idx]
+            result, failure = self._call_item(items[idx], process, params[idx])
+            return failure or result
+
+        if parallel and len(items) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=max(1, self.params.get('parallel_requests') or 1)) as pool:
+                results = list(pool.map(process_item, range(len(items))))
+        else:
+            results = [process_item(idx) for idx in range(len(items))]
+        for item, result in zip(items, results):
+            result['item'] = item
+
+        failed = [r for r in results if r.get('failed')]
+        result = dict(
+            changed=any(r.get('changed') for r in results),
+            results=results,
+            summary=dict(items=len(results), changed=len([r for r in results if r.get('changed')]), failed=len(failed)),
+        )
+        diffs = [r['diff'] for r in results if 'diff' in r]
+        if diffs:
+            result['diff'] = diffs
+        if failed:
+            self.fail_json(msg=f"{len(failed)} of {len(results)} items failed: {failed[0]['msg']}", **result)
+        self.exit_json(**result)
+
+    def _call_item(self, item, fn, *args):
+        """Call fn for item, return its result and None or None and the failed result."""
+        self._item.current = item
+        try:
+            return fn(*args), None
+        except ItemFailed as e:
+            return None, dict(e.result, failed=True, msg=e.msg)
+        except AtlassianApiError as e:
+            # Raised instead of ItemFailed on worker threads
+            return None, dict(e.kwargs, failed=True, msg=e.msg)
+        finally:
+            self._item.current = None
+
+    def _validate_item(self, params):
+        validated = ModuleArgumentSpecValidator(self.item_spec, **self.item_checks).validate(params)
+        self.no_log_values.update(validated._no_log_values)
+        if validated.error_messages:
+            self.fail_json(msg=validated.errors.msg)
+        return validated.validated_parameters
+
+    def _finish(self, result):
+        if self.profiler is not None:
+            result.setdefault('profile', self.profiler.stop(getattr(self, '_name', 'module')))
+            self.profiler = None
+
+        result.setdefault('api_retries', dict(count=self.stats.retries, sleep=round(self.stats.retry_sleep, 3)))
+        # params are not set yet if the argument validation fails
+        if getattr(self, 'params', {}).get('api_stats'):
+            result.setdefault('api_stats', self.stats.summary())
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import base64
+
+import requests
+
+from requests.adapters import BaseAdapter
+
+from ansible.module_utils.connection import Connection, ConnectionError
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.transport import build_response
+
+
+class PersistentConnectionAdapter(BaseAdapter):
+    """Transport adapter sending requests through a persistent connection.
+
+    Used when a module runs with the scsitteam.atlassian httpapi plugin, its
+    send_request() sends the request over a session that lives as long as
+    the persistent connection, so later tasks reuse the open connections.
+    """
+
+    def __init__(self, socket_path):
+        super().__init__()
+        self.connection = Connection(socket_path)
+
+    def send(self, request, timeout=None, **kwargs):
+        body = request.body
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        if isinstance(timeout, tuple):
+            timeout = list(timeout)
+        try:
+            response = self.connection.send_request(request.method, request.url, headers=dict(request.headers), body=body, timeout=timeout)
+        except ConnectionError as e:
+            raise requests.ConnectionError(str(e), request=request)
+        return build_response(request, self, response['status'], response['reason'], response['headers'],
+                              base64.b64decode(response['content']), response['elapsed'])
+
+    def close(self):
+        pass
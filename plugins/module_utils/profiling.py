@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+
+
+class Profiler(object):
+    """Profile a module run with cProfile and tracemalloc.
+
+    Started when the module is created and stopped right before it exits,
+    so the whole run including argument validation is covered. stop()
+    writes a pstats dump and a text report with the slowest functions,
+    the peak memory and the top allocations into path.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.started = time.time()
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        tracemalloc.start(10)
+        self.profile.enable()
+
+    def stop(self, name):
+        """Stop profiling and write the reports, return their paths."""
+        self.profile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        os.makedirs(self.path, exist_ok=True)
+        base = os.path.join(self.path, f"{name}-{time.strftime('%Y%m%dT%H%M%S', time.localtime(self.started))}-{os.getpid()}")
+
+        self.profile.dump_stats(f"{base}.pstats")
+
+        functions = io.StringIO()
+        pstats.Stats(self.profile, stream=functions).sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+
+        with open(f"{base}.txt", 'w') as report:
+            report.write(f"Module: {name}\n")
+            report.write(f"Wall time: {time.time() - self.started:.3f}s\n")
+            report.write(f"Peak memory: {peak / 1024:.1f} KiB (current {current / 1024:.1f} KiB)\n\n")
+            report.write(f"Top {TOP_ALLOCATIONS} allocations:\n")
+            for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+                report.write(f"  {stat}\n")
+            report.write(f"\nTop {TOP_FUNCTIONS} functions by cumulative time:\n")
+            report.write(functions.getvalue())
+
+        return dict(pstats=f"{base}.pstats", report=f"{base}.txt", peak_memory=peak)
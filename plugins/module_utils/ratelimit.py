@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import fcntl
+import hashlib
+import json
+import os
+import time
+
+
+def state_path(directory, instance):
+    """State file of the rate limiter shared by every process using instance."""
+    return os.path.join(directory, f"ansible-atlassian-ratelimit-{hashlib.sha256((instance or '').encode()).hexdigest()[:16]}.json")
+
+
+class RateLimiter(object):
+    """Token bucket shared by all module runs against the same instance.
+
+    The bucket lives in a small JSON state file every process updates under
+    an flock, so concurrent forks (and the ApiExecutor threads) draw from one
+    budget of rate requests per second with bursts of up to burst requests.
+    A request that finds the bucket empty reserves the next free token and
+    sleeps until it is due, which keeps the combined throughput just under
+    the limit instead of running into HTTP 429 responses.
+    """
+
+    def __init__(self, path, rate, burst, clock=time.time, sleep=time.sleep):
+        self.path = path
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.clock = clock
+        self.sleep = sleep
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+
+    def acquire(self):
+        """Take a token, wait for it if needed and return the seconds waited."""
+        with open(self.path, 'a+') as fd:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                fd.seek(0)
+                try:
+                    state = json.load(fd)
+                except ValueError:
+                    state = {}
+                now = self.clock()
+                tokens = state.get('tokens', self.burst) + max(now - state.get('updated', now), 0) * self.rate
+                tokens = min(tokens, self.burst) - 1
+                fd.seek(0)
+                fd.truncate()
+                json.dump(dict(tokens=tokens, updated=now), fd)
+                fd.flush()
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+        wait = -tokens / self.rate if tokens < 0 else 0.0
+        if wait:
+            self.sleep(wait)
+        return wait
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.cache import locked, resource_group
+
+
+def index_path(directory, scope):
+    """Index file of the instance and credentials scope is the hash of."""
+    return os.path.join(directory, f"resolver-{scope[:32]}.json")
+
+
+class ResolverIndex(object):
+    """Index of name to id of the reference objects of an instance.
+
+    Every kind of object is named by its list endpoint (e.g. /api/2/role)
+    and maps names to ids. A kind is loaded in full on first use and
+    reloaded once it is older than its TTL or, at most once per module
+    run, when a name is missing. Writes to a kind drop it.
+
+    With a path the index is persisted as a JSON file shared by module
+    runs and forks. It is replaced atomically, writers merge their kinds
+    into the current file under an flock so concurrent runs keep each
+    others kinds.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.kinds = None
+        self.refreshed = set()
+        self.lock = threading.Lock()
+
+    def lookup(self, kind, name, load, ttl):
+        """Return the id of name, load(reload) returns the name to id map of kind."""
+        with self.lock:
+            entry = self._kinds().get(kind)
+            if entry is None or time.time() - entry['loaded'] >= ttl or (name not in entry['ids'] and kind not in self.refreshed):
+                entry = self._store(kind, load(entry is not None))
+                self.refreshed.add(kind)
+            return entry['ids'].get(name)
+
+    def invalidate(self, resource):
+        """Drop the kinds resource belongs to."""
+        group = resource_group(resource)
+        with self.lock:
+            kinds = [kind for kind in self._kinds() if resource_group(kind) == group]
+            if not kinds:
+                return
+            for kind in kinds:
+                del self.kinds[kind]
+            self._write(drop=kinds)
+
+    def _kinds(self):
+        if self.kinds is None:
+            self.kinds = self._read()
+        return self.kinds
+
+    def _read(self):
+        if self.path is None:
+            return {}
+        try:
+            with open(self.path) as fd:
+                return json.load(fd)
+        except (OSError, ValueError):
+            return {}
+
+    def _store(self, kind, ids):
+        entry = dict(loaded=time.time(), ids=ids)
+        self.kinds[kind] = entry
+        self._write(update={kind: entry})
+        return entry
+
+    def _write(self, update=None, drop=()):
+        if self.path is None:
+            return
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        with locked(f"{self.path}.lock"):
+            kinds = self._read()
+            kinds.update(update or {})
+            for kind in drop:
+                kinds.pop(kind, None)
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(kinds, f)
+            os.replace(tmp, self.path)
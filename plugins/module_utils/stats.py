@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import re
+import threading
+
+from urllib.parse import urlsplit
+
+PLACEHOLDERS = (
+    ('{id}', re.compile(r'^[0-9]+$')),
+    ('{id}', re.compile(r'^\{?[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\}?$')),
+    ('{accountId}', re.compile(r'^(?:[0-9a-f]{24}|[0-9]+:[0-9a-f-]{36})$')),
+    ('{key}', re.compile(r'^[A-Z][A-Z0-9_]+$')),
+)
+
+
+def endpoint(method, url):
+    """Template an URL into an endpoint, e.g. GET /rest/api/2/project/{key}/role."""
+    segments = []
+    for segment in urlsplit(url).path.split('/'):
+        # Keep the API version, e.g. /rest/api/2/
+        if segments and segments[-1] == 'api':
+            segments.append(segment)
+            continue
+        for placeholder, pattern in PLACEHOLDERS:
+            if pattern.match(segment):
+                segment = placeholder
+                break
+        segments.append(segment)
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+def percentiles(values):
+    values = sorted(values)
+    if not values:
+        return dict(p50=0, p90=0, p99=0, max=0, total=0)
+
+    def rank(p):
+        return round(values[min(len(values) - 1, int(p * len(values)))], 3)
+
+    return dict(p50=rank(0.5), p90=rank(0.9), p99=rank(0.99), max=round(values[-1], 3), total=round(sum(values), 3))
+
+
+class ApiStats(object):
+    """Record every API request of a module run.
+
+    Requests are recorded with their templated endpoint, status, bytes sent
+    and received, latency and number of retries. Safe to use from the
+    ApiExecutor worker threads.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.retries = 0
+        self.retry_sleep = 0.0
+        self.rate_limit_sleep = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, method, url, status, bytes_in=0, bytes_out=0, latency=0.0, retries=0):
+        with self._lock:
+            self.requests.append(dict(
+                endpoint=endpoint(method, url),
+                status=status,
+                bytes_in=bytes_in,
+                bytes_out=bytes_out,
+                latency=latency,
+                retries=retries,
+            ))
+
+    def retried(self, delay):
+        with self._lock:
+            self.retries += 1
+            self.retry_sleep += delay
+
+    def limited(self, delay):
+        with self._lock:
+            self.rate_limit_sleep += delay
+
+    def summary(self):
+        """Request counts, bytes and latency percentiles in total and per endpoint."""
+        endpoints = {}
+        for request in self.requests:
+            endpoints.setdefault(request['endpoint'], []).append(request)
+
+        def aggregate(requests):
+            statuses = {}
+            for request in requests:
+                statuses[str(request['status'])] = statuses.get(str(request['status']), 0) + 1
+            return dict(
+                requests=len(requests),
+                statuses=statuses,
+                retries=sum(r['retries'] for r in requests),
+                bytes_in=sum(r['bytes_in'] for r in requests),
+                bytes_out=sum(r['bytes_out'] for r in requests),
+                latency=percentiles([r['latency'] for r in requests]),
+            )
+
+        summary = aggregate(self.requests)
+        summary['retry_sleep'] = round(self.retry_sleep, 3)
+        summary['rate_limit_sleep'] = round(self.rate_limit_sleep, 3)
+        summary['endpoints'] = {name: aggregate(requests) for name, requests in sorted(endpoints.items())}
+        return summary
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import io
+import os
+import socket
+import time
+import traceback
+
+from datetime import timedelta
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+except ImportError:
+    HAS_REQUESTS = False
+    REQUESTS_IMPORT_ERROR = traceback.format_exc()
+    HTTPAdapter = object
+else:
+    HAS_REQUESTS = True
+    REQUESTS_IMPORT_ERROR = None
+
+# Record the traffic of module runs to, or replay it from, a cassette file
+CASSETTE_ENV = 'ATLASSIAN_CASSETTE'
+CASSETTE_MODE_ENV = 'ATLASSIAN_CASSETTE_MODE'
+CASSETTE_LATENCY_ENV = 'ATLASSIAN_CASSETTE_LATENCY'
+
+# Probe idle connections early so a pooled connection is still usable
+# when the next request of the module run comes along.
+KEEPALIVE_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)] + [
+    (socket.IPPROTO_TCP, getattr(socket, option), value)
+    for option, value in (('TCP_KEEPIDLE', 30), ('TCP_KEEPINTVL', 10), ('TCP_KEEPCNT', 3))
+    if hasattr(socket, option)
+]
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', HTTPConnection.default_socket_options + KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+def build_response(request, adapter, status, reason, headers, content, elapsed=0.0):
+    """Build a requests Response from a response not received over a socket."""
+    response = requests.Response()
+    response.status_code = status
+    response.reason = reason
+    response.headers = requests.structures.CaseInsensitiveDict(headers)
+    response.headers['Content-Length'] = str(len(content))
+    for header in ('Content-Encoding', 'Transfer-Encoding'):
+        response.headers.pop(header, None)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.raw = io.BytesIO(content)
+    response.url = request.url
+    response.request = request
+    response.connection = adapter
+    response.elapsed = timedelta(seconds=elapsed)
+    return response
+
+
+class Transport(object):
+    """HTTP transport shared by all requests of a module run.
+
+    Applies separate connect and read timeouts to every request, enforces
+    the overall api_deadline of the module run and keeps a connection pool
+    large enough for parallel requests so they reuse TLS connections.
+
+    Modules run over the scsitteam.atlassian httpapi plugin send their
+    requests through the persistent connection instead, which keeps the
+    connections open across tasks.
+
+    If the ATLASSIAN_CASSETTE environment variable names a file, requests
+    are recorded to it or (by default) replayed from it without network
+    access, see ATLASSIAN_CASSETTE_MODE. ATLASSIAN_CASSETTE_LATENCY plays
+    back the recorded latency multiplied by its value.
+    """
+
+    def __init__(self, module):
+        self.module = module
+        self.connect_timeout = module.params.get('connection_timeout')
+        self.read_timeout = module.params.get('read_timeout')
+        if module.params.get('api_deadline'):
+            self.deadline = time.monotonic() + module.params.get('api_deadline')
+        else:
+            self.deadline = None
+
+        self.session = requests.Session()
+        # Blocking pools make parallel requests wait for a pooled
+        # connection instead of opening (and discarding) extra ones.
+        if getattr(module, '_socket_path', None):
+            from ansible_collections.scsitteam.atlassian.plugins.module_utils.persistent import PersistentConnectionAdapter
+            adapter = PersistentConnectionAdapter(module._socket_path)
+        else:
+            adapter = KeepAliveAdapter(
+                pool_connections=module.params.get('pool_connections'),
+                pool_maxsize=module.params.get('pool_maxsize'),
+                pool_block=True,
+                max_retries=0,
+            )
+        if os.environ.get(CASSETTE_ENV):
+            from ansible_collections.scsitteam.atlassian.plugins.module_utils.cassette import CassetteAdapter, cassette
+            adapter = CassetteAdapter(cassette(
+                os.environ[CASSETTE_ENV],
+                os.environ.get(CASSETTE_MODE_ENV) or 'replay',
+                float(os.environ.get(CASSETTE_LATENCY_ENV) or 0),
+            ), adapter)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def remaining(self):
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def timeout(self):
+        remaining = self.remaining()
+        if remaining is None:
+            return (self.connect_timeout, self.read_timeout)
+        if remaining <= 0:
+            raise DeadlineExceeded(f"API deadline of {self.module.params.get('api_deadline')}s exceeded")
+        return (min(self.connect_timeout, remaining), min(self.read_timeout, remaining))
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout())
+        return self.session.request(method, url, **kwargs)
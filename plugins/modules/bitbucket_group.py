@@ -41,32 +41,15 @@ from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import BitbucketLegacyApi
 
 
-def main():
-    # define available arguments/parameters a user can pass to the module
-    module_args = dict(
-        name=dict(type='str', required=True),
-        state=dict(type='str',
-                   default='present',
-                   choices=['absent', 'present']),
-    )
-
+def process(module, api, params):
     # seed the result dict in the object
     result = dict(
         changed=False,
     )
 
-    # Setup AnsibleModule
-    module = AnsibleAtlassianModule(
-        argument_spec=module_args,
-        supports_check_mode=True,
-    )
-
     # Parameters
-    name = module.params['name']
-    state = module.params['state']
-
-    # Setup API
-    api = BitbucketLegacyApi(module)
+    name = params['name']
+    state = params['state']
 
     # Get current state
     current_group = {g['name']: g for g in api.get("/groups/{workspace_id}/")}.get(name, None)
@@ -94,7 +77,28 @@ def main():
     if result['changed'] and module._diff:
         result['diff'] = dict(before=current_group, after=new_group)
 
-    module.exit_json(**result)
+    return result
+
+
+def main():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        name=dict(type='str', required=True),
+        state=dict(type='str',
+                   default='present',
+                   choices=['absent', 'present']),
+    )
+
+    # Setup AnsibleModule
+    module = AnsibleAtlassianModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    # Setup API
+    api = BitbucketLegacyApi(module)
+
+    module.run(lambda params: process(module, api, params))
 
 
 if __name__ == '__main__':
@@ -94,55 +94,22 @@ RETURN = '''
 
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import AnsibleAtlassianModule
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import BitbucketApi
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.executor import ApiExecutor
 
 
-def main():
-    # define available arguments/parameters a user can pass to the module
-    module_args = dict(
-        key=dict(type='str', required=True, no_log=False),
-        name=dict(type='str'),
-        description=dict(type='str'),
-        is_private=dict(type='bool', default=True),
-        group_permission=dict(type='dict', default=None, options=dict(
-            set=dict(type='list', elements='dict', options=dict(
-                group=dict(type='str', required=True),
-                permission=dict(type='str', required=True, choices=['read', 'write', 'create-repo', 'admin']),
-            )),
-            add=dict(type='list', elements='dict', options=dict(
-                group=dict(type='str', required=True),
-                permission=dict(type='str', required=True, choices=['read', 'write', 'create-repo', 'admin']),
-            )),
-            remove=dict(type='list', elements='str'),
-        ), mutually_exclusive=[['set', 'add'], ['set', 'remove']]),
-        state=dict(type='str',
-                   default='present',
-                   choices=['absent', 'present']),
-    )
-
+def process(module, api, params):
     # seed the result dict in the object
     result = dict(
         changed=False,
     )
 
-    # Setup AnsibleModule
-    module = AnsibleAtlassianModule(
-        argument_spec=module_args,
-        supports_check_mode=True,
-        required_if=[
-            ('state', 'present', ('name',)),
-        ]
-    )
-
     # Parameters
-    key = module.params['key']
-    name = module.params['name']
-    description = module.params['description']
-    state = module.params['state']
-    is_private = module.params['is_private']
-    group_permission = module.params['group_permission']
-
-    # Setup API
-    api = BitbucketApi(module)
+    key = params['key']
+    name = params['name']
+    description = params['description']
+    state = params['state']
+    is_private = params['is_private']
+    group_permission = params['group_permission']
 
     # Get current state
     current_project = api.get(f"/projects/{ key }")
@@ -190,46 +157,85 @@ def main():
 
     if state == 'present' and group_permission is not None:
         if current_project is not None:
-            current_group_permission = {p['group']['name']: p['permission'] for p in api.get(f"/projects/{key}/permissions-config/groups")['values']}
+            current_group_permission = {p['group']['name']: p['permission'] for p in api.paginate(f"/projects/{key}/permissions-config/groups")}
             current_project['group_permission'] = current_group_permission
         else:
             current_group_permission = {}
         new_project['group_permission'] = current_group_permission.copy()
 
+        executor = ApiExecutor(module)
+
         if group_permission['set']:
             for perm in group_permission['set']:
                 if current_group_permission.get(perm['group'], None) != perm['permission']:
                     result['changed'] = True
                     new_project['group_permission'][perm['group']] = perm['permission']
-                    if not module.check_mode:
-                        api.put(f"/projects/{key}/permissions-config/groups/{perm['group']}", json=dict(permission=perm['permission']))
+                    executor.submit(api.put, f"/projects/{key}/permissions-config/groups/{perm['group']}", json=dict(permission=perm['permission']))
             for group in current_group_permission.keys():
                 if group not in [p['group'] for p in group_permission['set']]:
+                    result['changed'] = True
                     del new_project['group_permission'][group]
-                    if not module.check_mode:
-                        api.delete(f"/projects/{key}/permissions-config/groups/{group}")
+                    executor.submit(api.delete, f"/projects/{key}/permissions-config/groups/{group}")
 
         if group_permission['add']:
             for perm in group_permission['add']:
                 if current_group_permission.get(perm['group'], None) != perm['permission']:
                     result['changed'] = True
                     new_project['group_permission'][perm['group']] = perm['permission']
-                    if not module.check_mode:
-                        api.put(f"/projects/{key}/permissions-config/groups/{perm['group']}", json=dict(permission=perm['permission']))
+                    executor.submit(api.put, f"/projects/{key}/permissions-config/groups/{perm['group']}", json=dict(permission=perm['permission']))
 
         if group_permission['remove']:
-            for perm in group_permission['remove']:
-                if current_group_permission.get(perm['group'], None) is not None:
+            for group in group_permission['remove']:
+                if current_group_permission.get(group, None) is not None:
                     result['changed'] = True
-                    del new_project['group_permission'][perm['group']]
-                    if not module.check_mode:
-                        api.delete(f"/projects/{key}/permissions-config/groups/{perm['group']}")
+                    del new_project['group_permission'][group]
+                    executor.submit(api.delete, f"/projects/{key}/permissions-config/groups/{group}")
+
+        executor.wait()
 
     # Diff
     if result['changed'] and module._diff:
         result['diff'] = dict(before=current_project, after=new_project)
 
-    module.exit_json(**result)
+    return result
+
+
+def main():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        key=dict(type='str', required=True, no_log=False),
+        name=dict(type='str'),
+        description=dict(type='str'),
+        is_private=dict(type='bool', default=True),
+        group_permission=dict(type='dict', default=None, options=dict(
+            set=dict(type='list', elements='dict', options=dict(
+                group=dict(type='str', required=True),
+                permission=dict(type='str', required=True, choices=['read', 'write', 'create-repo', 'admin']),
+            )),
+            add=dict(type='list', elements='dict', options=dict(
+                group=dict(type='str', required=True),
+                permission=dict(type='str', required=True, choices=['read', 'write', 'create-repo', 'admin']),
+            )),
+            remove=dict(type='list', elements='str'),
+        ), mutually_exclusive=[['set', 'add'], ['set', 'remove']]),
+        state=dict(type='str',
+                   default='present',
+                   choices=['absent', 'present']),
+    )
+
+    # Setup AnsibleModule
+    module = AnsibleAtlassianModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+        required_if=[
+            ('state', 'present', ('name',)),
+        ]
+    )
+
+    # Setup API
+    api = BitbucketApi(module)
+
+    module.run(lambda params: process(module, api, params))
 
 
 if __name__ == '__main__':
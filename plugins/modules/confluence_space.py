@@ -58,42 +58,34 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+pages:
+    description: Titles of the first 25 pages of the space, if it could not be deleted as it is not empty.
+    returned: failure
+    type: list
+    elements: str
+    sample: [Overview, Meeting notes]
+page_count:
+    description: Number of pages of the space, if it could not be deleted as it is not empty.
+    returned: failure
+    type: int
+    sample: 2
 '''
 
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import AnsibleAtlassianModule
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import ConfluenceApi
 
 
-def main():
-    # define available arguments/parameters a user can pass to the module
-    module_args = dict(
-        key=dict(type='str', required=True, no_log=False),
-        name=dict(type='str'),
-        description=dict(type='str'),
-        state=dict(type='str',
-                   default='present',
-                   choices=['absent', 'present']),
-    )
-
+def process(module, api, params):
     # seed the result dict in the object
     result = dict(
         changed=False,
     )
 
-    # Setup AnsibleModule
-    module = AnsibleAtlassianModule(
-        argument_spec=module_args,
-        supports_check_mode=True
-    )
-
     # Parameters
-    key = module.params['key']
-    name = module.params['name']
-    description = module.params['description']
-    state = module.params['state']
-
-    # Setup API
-    api = ConfluenceApi(module)
+    key = params['key']
+    name = params['name']
+    description = params['description']
+    state = params['state']
 
     # Get current state
     spaces = api.get("/api/v2/spaces", params={"description-format": "plain", "keys": key})
@@ -105,9 +97,8 @@ def main():
     if state == 'absent' and current_space is not None:
         result['changed'] = True
 
-        pages = api.get(f"/api/v2/spaces/{current_space['id']}/pages")['results']
-        if pages:
-            module.fail_json(msg="The Space is not empty", pages=[p['title'] for p in pages], **result)
+        if api.has_pages(current_space['id']):
+            module.fail_json(msg="The Space is not empty", pages=api.page_titles(current_space['id'], 25), page_count=api.count_pages(key), **result)
         new_space = {}
         if not module.check_mode:
             ret = api.delete(f"/rest/api/space/{key}")
@@ -153,7 +144,30 @@ def main():
     if result['changed'] and module._diff:
         result['diff'] = dict(before=current_space, after=new_space)
 
-    module.exit_json(**result)
+    return result
+
+
+def main():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        key=dict(type='str', required=True, no_log=False),
+        name=dict(type='str'),
+        description=dict(type='str'),
+        state=dict(type='str',
+                   default='present',
+                   choices=['absent', 'present']),
+    )
+
+    # Setup AnsibleModule
+    module = AnsibleAtlassianModule(
+        argument_spec=module_args,
+        supports_check_mode=True
+    )
+
+    # Setup API
+    api = ConfluenceApi(module)
+
+    module.run(lambda params: process(module, api, params))
 
 
 if __name__ == '__main__':
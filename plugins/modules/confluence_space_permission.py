@@ -8,10 +8,11 @@ DOCUMENTATION = '''
 ---
 module: confluence_space_permission
 
-short_description: Manage Confluence Space
+short_description: Manage Confluence Space permissions
 
 description:
-    - Manage a confluence space
+    - Grant and revoke the permissions of users and groups on a Confluence space.
+    - The permissions of all users and groups are reconciled with a single read of the space permissions.
 
 options:
     key:
@@ -29,6 +30,18 @@ options:
             - The Name of the user to grant permissions to.
         type: str
         required: false
+    users:
+        description:
+            - Names or accountIds of further users to grant or revoke the permissions.
+            - Mutually exclusive with O(user).
+        type: list
+        elements: str
+    groups:
+        description:
+            - Names or groupIds of further groups to grant or revoke the permissions.
+            - Mutually exclusive with O(group).
+        type: list
+        elements: str
     permission:
         description:
             - Dictionary of permissions to grant or revoke.
@@ -73,7 +86,10 @@ options:
 
     state:
         description:
-            - The desired state of the space
+            - V(grant) grants the permissions to every user and group.
+            - V(revoke) revokes the permissions from every user and group.
+            - V(pure) grants the permissions to every user and group and revokes all others they have.
+            - Permissions of users and groups not listed are never changed.
         type: str
         required: false
         choices: [ grant, revoke, pure ]
@@ -86,25 +102,170 @@ author:
 '''
 
 EXAMPLES = '''
-# Create a space
-- name: Create a space
-  confluence_space:
+# Grant a group read access
+- name: Grant read access
+  scsitteam.atlassian.confluence_space_permission:
     key: ANSIBLE
-    name: Ansible Space
-    private: true
+    group: confluence-users
+    permission:
+      space: [read]
 
-# Delete a space
-- name: Create a space
-  confluence_space:
-    state: absent
+# Reconcile the permissions of several users and groups at once
+- name: Set editor permissions
+  scsitteam.atlassian.confluence_space_permission:
     key: ANSIBLE
+    users: [Jane Doe, John Doe]
+    groups: [editors]
+    state: pure
+    permission:
+      space: [read, export]
+      page: [create, delete]
+      comment: [create]
 '''
 
 RETURN = '''
+current_permissions:
+    description: The permissions the users and groups had before.
+    returned: success
+    type: list
+    elements: dict
+    contains:
+        id:
+            description: Id of the permission.
+            type: str
+        operation:
+            description: The operation and its target type.
+            type: dict
+        subjects:
+            description: The user or group the permission is granted to, by name.
+            type: dict
+    sample: [{id: '300001', operation: {operation: read, targetType: space}, subjects: {group: [editors]}}]
+missing_permissions:
+    description: The permissions of every target type that were missing for at least one user or group.
+    returned: O(state=grant) or O(state=pure)
+    type: dict
+    sample: {space: [], page: [delete]}
+additional_permissions:
+    description: The permissions revoked as they were not listed, like in RV(current_permissions).
+    returned: O(state=pure)
+    type: list
+    elements: dict
+granted:
+    description: The permissions granted.
+    returned: success
+    type: list
+    elements: dict
+    sample: [{type: group, name: editors, target: page, operation: delete}]
+revoked:
+    description: The permissions revoked.
+    returned: success
+    type: list
+    elements: dict
 '''
 
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import AnsibleAtlassianModule
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import ConfluenceApi
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.executor import ApiExecutor
+
+
+def permission_index(api, space_id):
+    """Map every principal of the space to its operations and their permission ids."""
+    index = {}
+    for permission in api.paginate(f"/api/v2/spaces/{space_id}/permissions", params=dict(limit=250)):
+        principal = (permission['principal']['type'], permission['principal']['id'])
+        operation = (permission['operation']['targetType'], permission['operation']['key'])
+        index.setdefault(principal, {})[operation] = permission['id']
+    return index
+
+
+def permission_view(kind, name, target, operation, permission_id):
+    """A permission of a single subject, shaped like in the v1 space API."""
+    return dict(id=permission_id, operation=dict(operation=operation, targetType=target), subjects={kind: [name]})
+
+
+def by_target(operations):
+    permissions = {}
+    for target, operation in sorted(operations):
+        permissions.setdefault(target, []).append(operation)
+    return permissions
+
+
+def process(module, api, params):
+    # seed the result dict in the object
+    result = dict(
+        changed=False,
+    )
+
+    # Parameters
+    key = params['key']
+    state = params['state']
+    wanted = {(target, operation) for target, operations in params['permission'].items() for operation in operations}
+
+    space = api.get_space(key)
+    if not space:
+        module.fail_json(f"Space '{key}' not found.")
+
+    users, missing_users = api.resolve_users([params['user']] if params['user'] else params['users'] or [])
+    groups, missing_groups = api.resolve_groups([params['group']] if params['group'] else params['groups'] or [])
+    if missing_users or missing_groups:
+        module.fail_json(msg="Could not resolve all users and groups.", missing_users=missing_users, missing_groups=missing_groups)
+    subjects = [('user', name, id) for name, id in users.items()] + [('group', name, id) for name, id in groups.items()]
+
+    # Get current state
+    index = permission_index(api, space['id'])
+    result['current_permissions'] = [
+        permission_view(kind, name, target, operation, permission_id)
+        for kind, name, id in subjects for (target, operation), permission_id in sorted(index.get((kind, id), {}).items())
+    ]
+
+    executor = ApiExecutor(module)
+    granted, revoked, additional = [], [], []
+    missing = {target: set() for target in params['permission']}
+    before, after = dict(users={}, groups={}), dict(users={}, groups={})
+    for kind, name, id in subjects:
+        current = index.get((kind, id), {})
+
+        # Grant
+        grant = wanted - set(current) if state in ['grant', 'pure'] else set()
+        for target, operation in sorted(grant):
+            missing[target].add(operation)
+            granted.append(dict(type=kind, name=name, target=target, operation=operation))
+            executor.submit(api.post, f"/rest/api/space/{key}/permission", json=dict(
+                subject=dict(type=kind, identifier=id),
+                operation=dict(key=operation, target=target),
+            ))
+
+        # Revoke
+        if state == 'revoke':
+            revoke = wanted & set(current)
+        elif state == 'pure':
+            revoke = set(current) - wanted
+        else:
+            revoke = set()
+        for target, operation in sorted(revoke):
+            revoked.append(dict(type=kind, name=name, target=target, operation=operation))
+            additional.append(permission_view(kind, name, target, operation, current[(target, operation)]))
+            executor.submit(api.delete, f"/rest/api/space/{key}/permission/{current[(target, operation)]}")
+
+        before[f"{kind}s"][name] = by_target(current)
+        after[f"{kind}s"][name] = by_target((set(current) | grant) - revoke)
+
+    executor.wait()
+
+    result['granted'] = granted
+    result['revoked'] = revoked
+    if state in ['grant', 'pure']:
+        result['missing_permissions'] = {target: sorted(operations) for target, operations in missing.items()}
+    if state == 'pure':
+        result['additional_permissions'] = additional
+    if granted or revoked:
+        result['changed'] = True
+
+    # Diff
+    if result['changed'] and module._diff:
+        result['diff'] = dict(before=before, after=after)
+
+    return result
 
 
 def main():
@@ -114,6 +275,9 @@ def main():
         # Single permission
         user=dict(type='str'),
         group=dict(type='str'),
+        # Many subjects
+        users=dict(type='list', elements='str'),
+        groups=dict(type='list', elements='str'),
         permission=dict(type='dict', default={}, options=dict(
             space=dict(type='list', default=[], elements='str', choices=['read', 'delete', 'export', 'administer', 'restrict_content']),
             page=dict(type='list', default=[], elements='str', choices=['create', 'delete', 'archive']),
@@ -124,86 +288,23 @@ def main():
         state=dict(type='str', default='grant', choices=['grant', 'revoke', 'pure']),
     )
 
-    # seed the result dict in the object
-    result = dict(
-        changed=False,
-    )
-
     # Setup AnsibleModule
     module = AnsibleAtlassianModule(
         argument_spec=module_args,
         supports_check_mode=True,
         mutually_exclusive=[
-            ('user', 'group'),
+            ('user', 'users'),
+            ('group', 'groups'),
         ],
         required_one_of=[
-            ('user', 'group'),
+            ('user', 'group', 'users', 'groups'),
         ],
     )
 
-    # Parameters
-    key = module.params['key']
-    user = module.params['user']
-    group = module.params['group']
-    state = module.params['state']
-
     # Setup API
     api = ConfluenceApi(module)
 
-    # Get current state
-    current_permissions = api.get(f"/rest/api/space/{key}", params=dict(expand='permissions'))['permissions']
-    for current_permission in current_permissions:
-        if 'group' in current_permission['subjects']:
-            current_permission['subjects']['group'] = [s['name'] for s in current_permission['subjects']['group']['results']]
-        if 'user' in current_permission['subjects']:
-            current_permission['subjects']['user'] = [s['displayName'] for s in current_permission['subjects']['user']['results']]
-
-    if user:
-        current_permissions = [p for p in current_permissions if user in p['subjects'].get('user', [])]
-    if group:
-        current_permissions = [p for p in current_permissions if group in p['subjects'].get('group', [])]
-
-    result['current_permissions'] = current_permissions
-
-    # Grant
-    if state in ['grant', 'pure']:
-        from copy import deepcopy
-        missing_permissions = deepcopy(module.params['permission'])
-        for permission in current_permissions:
-            if permission['operation']['operation'] in missing_permissions.get(permission['operation']['targetType'], []):
-                missing_permissions[permission['operation']['targetType']].remove(permission['operation']['operation'])
-
-        for target, permissions in missing_permissions.items():
-            for permission in permissions:
-                payload = dict(
-                    operation=dict(
-                        key=permission,
-                        target=target,
-                    )
-                )
-                if group:
-                    payload['subject'] = dict(
-                        type='group',
-                        identifier=group,
-                    )
-                result['changed'] = True
-                if not module.check_mode:
-                    api.post(f"/rest/api/space/{key}/permission", json=payload)
-
-        result['missing_permissions'] = missing_permissions
-
-    # Pure
-    if state == 'pure':
-        permissions = module.params['permission'].copy()
-        result['additional_permissions'] = []
-        for permission in current_permissions:
-            if permission['operation']['operation'] not in permissions.get(permission['operation']['targetType'], []):
-                result['changed'] = True
-                if not module.check_mode:
-                    api.delete(f"/rest/api/space/{key}/permission/{permission['id']}")
-                result['additional_permissions'].append(permission)
-
-    module.exit_json(**result)
+    module.run(lambda params: process(module, api, params))
 
 
 if __name__ == '__main__':
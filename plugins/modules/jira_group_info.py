@@ -34,40 +34,86 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+group:
+    description:
+        - The members of the group, shaped like a single page of the group member API holding all of them.
+        - Every page is read, so RV(group.values) holds all members and RV(group.isLast) is always V(true).
+        - V(null) if the group does not exist.
+    returned: success
+    type: dict
+    contains:
+        startAt:
+            description: Always V(0).
+            type: int
+        maxResults:
+            description: Number of members.
+            type: int
+        total:
+            description: Number of members.
+            type: int
+        isLast:
+            description: Always V(true).
+            type: bool
+        values:
+            description: The members of the group.
+            type: list
+            elements: dict
+    sample:
+        startAt: 0
+        maxResults: 1
+        total: 1
+        isLast: true
+        values:
+            - accountId: 5b10a2844c20165700ede21g
+              displayName: Mia Krystof
+              emailAddress: mia@example.com
+              active: true
 '''
 
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import AnsibleAtlassianModule
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import JiraPlatformApi
 
 
+def process(module, api, params):
+    # seed the result dict in the object
+    result = dict(
+        changed=False,
+    )
+
+    # Parameters
+    name = params['name']
+
+    # Get current state
+    group = api.get("/api/2/group/member", params=dict(groupname=name))
+    if group is None:
+        result['group'] = None
+        return result
+
+    # Remaining members in the shape of the single first page
+    members = group['values']
+    if not group.get('isLast', True):
+        members.extend(api.paginate("/api/2/group/member", params=dict(groupname=name, startAt=len(members)), stream=True))
+    result['group'] = dict(startAt=0, maxResults=len(members), total=len(members), isLast=True, values=members)
+
+    return result
+
+
 def main():
     # define available arguments/parameters a user can pass to the module
     module_args = dict(
         name=dict(type='str'),
     )
 
-    # seed the result dict in the object
-    result = dict(
-        changed=False,
-    )
-
     # Setup AnsibleModule
     module = AnsibleAtlassianModule(
         argument_spec=module_args,
         supports_check_mode=True
     )
 
-    # Parameters
-    name = module.params['name']
-
     # Setup API
     api = JiraPlatformApi(module)
 
-    # Get current state
-    group = api.get(f"/api/2/group/member?groupname={ name }")
-
-    result['group'] = group
-    module.exit_json(**result)
+    module.run(lambda params: process(module, api, params))
 
 
 if __name__ == '__main__':
@@ -65,31 +65,33 @@ from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import JiraPlatformApi
 
 
-def main():
-    # define available arguments/parameters a user can pass to the module
-    module_args = dict()
-
+def process(module, api, params):
     # seed the result dict in the object
     result = dict(
         changed=False,
     )
 
+    # Get Status
+    status = api.get("/api/3/serverInfo")
+    result.update(status)
+
+    return result
+
+
+def main():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict()
+
     # Setup AnsibleModule
     module = AnsibleAtlassianModule(
         argument_spec=module_args,
         supports_check_mode=True,
     )
 
-    # Parameters
-
     # Setup API
     api = JiraPlatformApi(module)
 
-    # Get Status
-    status = api.get("/api/3/serverInfo")
-    result.update(status)
-
-    module.exit_json(**result)
+    module.run(lambda params: process(module, api, params))
 
 
 if __name__ == '__main__':
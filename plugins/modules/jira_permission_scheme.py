@@ -30,7 +30,9 @@ options:
         type: str
     permission:
         description:
-            - Dictionary of Jira permissions.
+            - Dictionary of Jira permissions and the grants they should have.
+            - The grants of every permission given are reconciled, grants not listed are removed.
+            - Permissions not given are left unchanged.
         type: dict
         suboptions:
             administer_projects:
@@ -41,10 +43,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.administer_projects[].type) is V(group), V(user) or V(projectRole).
                         type: str
             browse_projects:
                 description: Allow to administrrate the project
@@ -54,10 +59,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.browse_projects[].type) is V(group), V(user) or V(projectRole).
                         type: str
             manage_sprints_permission:
                 description: Allow to administrrate the project
@@ -67,10 +75,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.manage_sprints_permission[].type) is V(group), V(user) or V(projectRole).
                         type: str
             servicedesk_agent:
                 description: Allow to administrrate the project
@@ -80,10 +91,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.servicedesk_agent[].type) is V(group), V(user) or V(projectRole).
                         type: str
             view_dev_tools:
                 description: Allow to administrrate the project
@@ -93,10 +107,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.view_dev_tools[].type) is V(group), V(user) or V(projectRole).
                         type: str
             view_readonly_workflow:
                 description: Allow to administrrate the project
@@ -106,10 +123,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.view_readonly_workflow[].type) is V(group), V(user) or V(projectRole).
                         type: str
             assignable_user:
                 description: Allow to administrrate the project
@@ -119,10 +139,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.assignable_user[].type) is V(group), V(user) or V(projectRole).
                         type: str
             assign_issues:
                 description: Allow to administrrate the project
@@ -132,10 +155,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.assign_issues[].type) is V(group), V(user) or V(projectRole).
                         type: str
             close_issues:
                 description: Allow to administrrate the project
@@ -145,10 +171,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.close_issues[].type) is V(group), V(user) or V(projectRole).
                         type: str
             create_issues:
                 description: Allow to administrrate the project
@@ -158,10 +187,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.create_issues[].type) is V(group), V(user) or V(projectRole).
                         type: str
             delete_issues:
                 description: Allow to administrrate the project
@@ -171,10 +203,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.delete_issues[].type) is V(group), V(user) or V(projectRole).
                         type: str
             edit_issues:
                 description: Allow to administrrate the project
@@ -184,10 +219,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.edit_issues[].type) is V(group), V(user) or V(projectRole).
                         type: str
             link_issues:
                 description: Allow to administrrate the project
@@ -197,10 +235,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.link_issues[].type) is V(group), V(user) or V(projectRole).
                         type: str
             modify_reporter:
                 description: Allow to administrrate the project
@@ -210,10 +251,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.modify_reporter[].type) is V(group), V(user) or V(projectRole).
                         type: str
             move_issues:
                 description: Allow to administrrate the project
@@ -223,10 +267,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.move_issues[].type) is V(group), V(user) or V(projectRole).
                         type: str
             resolve_issues:
                 description: Allow to administrrate the project
@@ -236,10 +283,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.resolve_issues[].type) is V(group), V(user) or V(projectRole).
                         type: str
             schedule_issues:
                 description: Allow to administrrate the project
@@ -249,10 +299,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.schedule_issues[].type) is V(group), V(user) or V(projectRole).
                         type: str
             set_issue_security:
                 description: Allow to administrrate the project
@@ -262,10 +315,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.set_issue_security[].type) is V(group), V(user) or V(projectRole).
                         type: str
             transition_issues:
                 description: Allow to administrrate the project
@@ -275,10 +331,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.transition_issues[].type) is V(group), V(user) or V(projectRole).
                         type: str
             manage_watchers:
                 description: Allow to administrrate the project
@@ -288,10 +347,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.manage_watchers[].type) is V(group), V(user) or V(projectRole).
                         type: str
             view_voter_and_Watchers:
                 description: Allow to administrrate the project
@@ -301,10 +363,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.view_voter_and_Watchers[].type) is V(group), V(user) or V(projectRole).
                         type: str
             add_comments:
                 description: Allow to administrrate the project
@@ -314,10 +379,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.add_comments[].type) is V(group), V(user) or V(projectRole).
                         type: str
             delete_all_comments:
                 description: Allow to administrrate the project
@@ -327,10 +395,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.delete_all_comments[].type) is V(group), V(user) or V(projectRole).
                         type: str
             delete_own_comments:
                 description: Allow to administrrate the project
@@ -340,10 +411,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.delete_own_comments[].type) is V(group), V(user) or V(projectRole).
                         type: str
             edit_all_comments:
                 description: Allow to administrrate the project
@@ -353,10 +427,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.edit_all_comments[].type) is V(group), V(user) or V(projectRole).
                         type: str
             edit_own_comments:
                 description: Allow to administrrate the project
@@ -366,10 +443,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.edit_own_comments[].type) is V(group), V(user) or V(projectRole).
                         type: str
             create_attachments:
                 description: Allow to administrrate the project
@@ -379,10 +459,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.create_attachments[].type) is V(group), V(user) or V(projectRole).
                         type: str
             delete_all_attachments:
                 description: Allow to administrrate the project
@@ -392,10 +475,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.delete_all_attachments[].type) is V(group), V(user) or V(projectRole).
                         type: str
             delete_own_attachments:
                 description: Allow to administrrate the project
@@ -405,10 +491,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.delete_own_attachments[].type) is V(group), V(user) or V(projectRole).
                         type: str
             delete_all_worklogs:
                 description: Allow to administrrate the project
@@ -418,10 +507,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.delete_all_worklogs[].type) is V(group), V(user) or V(projectRole).
                         type: str
             delete_own_worklogs:
                 description: Allow to administrrate the project
@@ -431,10 +523,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.delete_own_worklogs[].type) is V(group), V(user) or V(projectRole).
                         type: str
             edit_all_worklogs:
                 description: Allow to administrrate the project
@@ -444,10 +539,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.edit_all_worklogs[].type) is V(group), V(user) or V(projectRole).
                         type: str
             edit_own_worklogs:
                 description: Allow to administrrate the project
@@ -457,10 +555,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.edit_own_worklogs[].type) is V(group), V(user) or V(projectRole).
                         type: str
             work_on_issues:
                 description: Allow to administrrate the project
@@ -470,10 +571,13 @@ options:
                     type:
                         description: Type of grant
                         type: str
-                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']
+                        choices: ['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField', 'projectLead', 'projectRole', 'reporter', 'user']
                         required: true
                     value:
-                        description: Value to Identify whi this permissions are granted to.
+                        description:
+                            - Value to Identify whi this permissions are granted to.
+                            - Name or groupId for V(group), name or accountId for V(user), name or id for V(projectRole).
+                            - Required if O(permission.work_on_issues[].type) is V(group), V(user) or V(projectRole).
                         type: str
         default: {}
 
@@ -484,122 +588,141 @@ author:
 '''
 
 EXAMPLES = '''
-- name: Set Jira Title
-  jira_setting:
-    atlassian_instance: example
-    atlassian_username: user@example.com
-    atlassian_password: secret
-    settings:
-      jira.title: Example Jira
-
-
-- name: Reset Jira Title
-  jira_setting:
-    atlassian_instance: example
-    atlassian_username: user@example.com
-    atlassian_password: secret
-    settings:
-      jira.title:
+- name: Manage a permission scheme and its grants
+  scsitteam.atlassian.jira_permission_scheme:
+    name: Software
+    description: Permissions of software projects
+    permission:
+      browse_projects:
+        - type: group
+          value: jira-users
+      administer_projects:
+        - type: projectRole
+          value: Administrators
+      create_issues:
+        - type: projectRole
+          value: Developers
+        - type: reporter
+
+- name: Delete a permission scheme
+  scsitteam.atlassian.jira_permission_scheme:
+    name: Software
+    state: absent
 '''
 
 RETURN = '''
-settings:
-  description: Jira settings
-  returned: success
-  type: dict
-  sample:
-    {
-      "jira.clone.prefix": "CLONE -",
-      "jira.comment.collapsing.minimum.hidden": "4",
-      "jira.date.picker.java.format": "d/MMM/yy",
-      "jira.date.picker.javascript.format": "%e/%b/%y",
-      "jira.date.time.picker.java.format": "dd/MMM/yy h:mm a",
-      "jira.date.time.picker.javascript.format": "%e/%b/%y %I:%M %p"
-    }
+current_scheme:
+    description: The permission scheme before the change, with its grants if O(permission) is given.
+    returned: success
+    type: dict
+granted:
+    description: The grants added.
+    returned: success
+    type: list
+    elements: dict
+    sample: [{permission: BROWSE_PROJECTS, type: group, value: 276f955c-63d7-42c8-9520-92d01dca0625}]
+revoked:
+    description: The grants removed.
+    returned: success
+    type: list
+    elements: dict
 '''
 
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import AnsibleAtlassianModule
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import JiraPlatformApi
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.executor import ApiExecutor
 
 
 permission_options = dict(
-    type=dict(type='str', required=True, choices=['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField']),
+    type=dict(type='str', required=True, choices=['anyone', 'applicationRole', 'assignee', 'group', 'groupCustomField',
+                                                  'projectLead', 'projectRole', 'reporter', 'user']),
     value=dict(type='str')
 )
+permission_required_if = [
+    ('type', 'group', ['value']),
+    ('type', 'user', ['value']),
+    ('type', 'projectRole', ['value']),
+]
 
+# Option names differing from the permission key in upper case
+PERMISSION_KEYS = dict(
+    view_voter_and_Watchers='VIEW_VOTERS_AND_WATCHERS',
+)
 
-def main():
-    # define available arguments/parameters a user can pass to the module
-    module_args = dict(
-        name=dict(type='str', required=True),
-        description=dict(type='str'),
-        state=dict(type='str', default='present', choices=['absent', 'present']),
-        permission=dict(type='dict', default={}, options=dict(
-            # Project permissions
-            administer_projects=dict(type='list', elements='dict', options=permission_options),
-            browse_projects=dict(type='list', elements='dict', options=permission_options),
-            manage_sprints_permission=dict(type='list', elements='dict', options=permission_options),
-            servicedesk_agent=dict(type='list', elements='dict', options=permission_options),
-            view_dev_tools=dict(type='list', elements='dict', options=permission_options),
-            view_readonly_workflow=dict(type='list', elements='dict', options=permission_options),
-            # Issue permissions
-            assignable_user=dict(type='list', elements='dict', options=permission_options),
-            assign_issues=dict(type='list', elements='dict', options=permission_options),
-            close_issues=dict(type='list', elements='dict', options=permission_options),
-            create_issues=dict(type='list', elements='dict', options=permission_options),
-            delete_issues=dict(type='list', elements='dict', options=permission_options),
-            edit_issues=dict(type='list', elements='dict', options=permission_options),
-            link_issues=dict(type='list', elements='dict', options=permission_options),
-            modify_reporter=dict(type='list', elements='dict', options=permission_options),
-            move_issues=dict(type='list', elements='dict', options=permission_options),
-            resolve_issues=dict(type='list', elements='dict', options=permission_options),
-            schedule_issues=dict(type='list', elements='dict', options=permission_options),
-            set_issue_security=dict(type='list', elements='dict', options=permission_options),
-            transition_issues=dict(type='list', elements='dict', options=permission_options),
-            # Voters and watchers permissions
-            manage_watchers=dict(type='list', elements='dict', options=permission_options),
-            view_voter_and_Watchers=dict(type='list', elements='dict', options=permission_options),
-            # Comments permissions
-            add_comments=dict(type='list', elements='dict', options=permission_options),
-            delete_all_comments=dict(type='list', elements='dict', options=permission_options),
-            delete_own_comments=dict(type='list', elements='dict', options=permission_options),
-            edit_all_comments=dict(type='list', elements='dict', options=permission_options),
-            edit_own_comments=dict(type='list', elements='dict', options=permission_options),
-            # Attachments permissions
-            create_attachments=dict(type='list', elements='dict', options=permission_options),
-            delete_all_attachments=dict(type='list', elements='dict', options=permission_options),
-            delete_own_attachments=dict(type='list', elements='dict', options=permission_options),
-            # Time tracking permissions
-            delete_all_worklogs=dict(type='list', elements='dict', options=permission_options),
-            delete_own_worklogs=dict(type='list', elements='dict', options=permission_options),
-            edit_all_worklogs=dict(type='list', elements='dict', options=permission_options),
-            edit_own_worklogs=dict(type='list', elements='dict', options=permission_options),
-            work_on_issues=dict(type='list', elements='dict', options=permission_options),
-        )),
+
+def permission_key(option):
+    return PERMISSION_KEYS.get(option, option.upper())
+
+
+def wanted_grants(module, api, permission):
+    """Set of (permission, holder type, holder value) of the permissions given, holders resolved to ids."""
+    grants = {(permission_key(option), g['type'], g['value']) for option, holders in permission.items() for g in holders or []}
+
+    users, missing_users = api.resolve_users([value for key, type, value in grants if type == 'user' and value])
+    groups, missing_groups = api.resolve_groups([value for key, type, value in grants if type == 'group' and value])
+    roles = {}
+    if any(type == 'projectRole' for key, type, value in grants):
+        for role in api.get("/api/2/role") or []:
+            roles[role['name']] = roles[str(role['id'])] = str(role['id'])
+    missing_roles = [value for key, type, value in grants if type == 'projectRole' and value not in roles]
+    if missing_users or missing_groups or missing_roles:
+        module.fail_json(msg="Could not resolve all grant holders.", missing_users=missing_users, missing_groups=missing_groups,
+                         missing_roles=missing_roles)
+
+    resolved = dict(
+        user=lambda value: users[value]['accountId'],
+        group=lambda value: groups[value]['groupId'],
+        projectRole=lambda value: roles[value],
     )
+    return {(key, type, resolved[type](value) if type in resolved and value else value) for key, type, value in grants}
+
+
+def grant_key(grant):
+    return (grant['permission'], grant['holder']['type'], grant['holder'].get('value'))
+
+
+def grant_payload(key):
+    permission, type, value = key
+    holder = dict(type=type) if value is None else dict(type=type, value=value)
+    return dict(permission=permission, holder=holder)
+
 
+def grant_view(key):
+    return dict(zip(('permission', 'type', 'value'), key))
+
+
+def process(module, api, params):
     # seed the result dict in the object
     result = dict(
         changed=False,
     )
 
-    # Setup AnsibleModule
-    module = AnsibleAtlassianModule(
-        argument_spec=module_args,
-        supports_check_mode=True,
-    )
-
     # Parameters
-    name = module.params['name']
-    description = module.params['description']
-    state = module.params['state']
+    name = params['name']
+    description = params['description']
+    state = params['state']
+    permission = {option: holders for option, holders in (params['permission'] or {}).items() if holders is not None}
 
-    # Setup API
-    api = JiraPlatformApi(module)
-
-    current_scheme = next(filter(lambda p: p['name'] == name, api.get("/api/3/permissionscheme")['permissionSchemes']), None)
+    # The scheme is revalidated, the response cache may only serve the name to id lookup
+    if permission:
+        current_scheme = api.get_permission_scheme(name, params=dict(expand='permissions,group'), max_age=0)
+    else:
+        current_scheme = api.get_permission_scheme(name, max_age=0)
     result['current_scheme'] = current_scheme
 
+    # Grants
+    current = {}
+    if state == 'present' and permission:
+        wanted = wanted_grants(module, api, permission)
+        current = {grant_key(g): g['id'] for g in (current_scheme or {}).get('permissions', [])}
+        managed = {permission_key(option) for option in permission}
+        grant = wanted - set(current)
+        revoke = {key for key in current if key[0] in managed and key not in wanted}
+    else:
+        grant, revoke = set(), set()
+    result['granted'] = [grant_view(key) for key in sorted(grant, key=str)]
+    result['revoked'] = [grant_view(key) for key in sorted(revoke, key=str)]
+
     # Create
     if state == 'present' and current_scheme is None:
         result['changed'] = True
@@ -607,19 +730,37 @@ def main():
             name=name,
             description=description,
         )
+        if grant:
+            new_scheme['permissions'] = [grant_payload(key) for key in sorted(grant, key=str)]
         if not module.check_mode:
             new_scheme = api.post("/api/3/permissionscheme", json=new_scheme)
 
-    # Create
+    # Update
     if state == 'present' and current_scheme is not None:
-        if current_scheme['description'] != description:
+        new_scheme = {k: v for k, v in current_scheme.items() if k != 'permissions'}
+        update = dict(name=name, description=current_scheme.get('description'))
+        if description is not None and current_scheme.get('description') != description:
+            update['description'] = new_scheme['description'] = description
             result['changed'] = True
 
-            if not module.check_mode:
-                new_scheme = api.put(f"/api/3/permissionscheme/{current_scheme['id']}", json=dict(name=name, description=description))
+        if grant or revoke:
+            result['changed'] = True
+            permissions = sorted((set(current) - revoke) | grant, key=str)
+            new_scheme['permissions'] = [grant_view(key) for key in permissions]
+
+            # A full update replaces every grant with a single request, single grants are cheaper for small changes
+            if len(grant) + len(revoke) > (module.params['parallel_requests'] or 1):
+                update['permissions'] = [grant_payload(key) for key in permissions]
             else:
-                new_scheme = current_scheme.copy()
-                new_scheme['description'] = description
+                executor = ApiExecutor(module)
+                for key in sorted(revoke, key=str):
+                    executor.submit(api.delete, f"/api/3/permissionscheme/{current_scheme['id']}/permission/{current[key]}")
+                for key in sorted(grant, key=str):
+                    executor.submit(api.post, f"/api/3/permissionscheme/{current_scheme['id']}/permission", json=grant_payload(key))
+                executor.wait()
+
+        if (update['description'] != current_scheme.get('description') or 'permissions' in update) and not module.check_mode:
+            api.put(f"/api/3/permissionscheme/{current_scheme['id']}", json=update)
 
     # Delete
     if state == 'absent' and current_scheme is not None:
@@ -630,9 +771,74 @@ def main():
 
     # Diff
     if result['changed'] and module._diff:
-        result['diff'] = dict(before=dict(scheme=current_scheme), after=dict(scheme=new_scheme))
+        before = current_scheme
+        if before is not None and 'permissions' in before:
+            before = dict(before, permissions=[grant_view(key) for key in sorted(current, key=str)])
+        result['diff'] = dict(before=dict(scheme=before), after=dict(scheme=new_scheme))
+
+    return result
+
+
+def main():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        name=dict(type='str', required=True),
+        description=dict(type='str'),
+        state=dict(type='str', default='present', choices=['absent', 'present']),
+        permission=dict(type='dict', default={}, options=dict(
+            # Project permissions
+            administer_projects=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            browse_projects=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            manage_sprints_permission=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            servicedesk_agent=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            view_dev_tools=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            view_readonly_workflow=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            # Issue permissions
+            assignable_user=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            assign_issues=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            close_issues=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            create_issues=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            delete_issues=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            edit_issues=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            link_issues=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            modify_reporter=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            move_issues=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            resolve_issues=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            schedule_issues=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            set_issue_security=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            transition_issues=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            # Voters and watchers permissions
+            manage_watchers=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            view_voter_and_Watchers=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            # Comments permissions
+            add_comments=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            delete_all_comments=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            delete_own_comments=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            edit_all_comments=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            edit_own_comments=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            # Attachments permissions
+            create_attachments=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            delete_all_attachments=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            delete_own_attachments=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            # Time tracking permissions
+            delete_all_worklogs=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            delete_own_worklogs=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            edit_all_worklogs=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            edit_own_worklogs=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+            work_on_issues=dict(type='list', elements='dict', options=permission_options, required_if=permission_required_if),
+        )),
+    )
+
+    # Setup AnsibleModule
+    module = AnsibleAtlassianModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    # Setup API
+    api = JiraPlatformApi(module)
 
-    module.exit_json(**result)
+    module.run(lambda params: process(module, api, params))
 
 
 if __name__ == '__main__':
@@ -61,84 +61,58 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+issues:
+    description: Keys of the first 50 issues of the project, if it could not be deleted as it is not empty.
+    returned: failure
+    type: list
+    elements: str
+    sample: [ANSIBLE-1, ANSIBLE-2]
+issue_count:
+    description: Number of issues of the project, if it could not be deleted as it is not empty.
+    returned: failure
+    type: int
+    sample: 2
 '''
 
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import AnsibleAtlassianModule
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import JiraPlatformApi
 
 
-def main():
-    # define available arguments/parameters a user can pass to the module
-    module_args = dict(
-        key=dict(type='str', required=True, no_log=False),
-        name=dict(type='str'),
-        description=dict(type='str'),
-        lead=dict(type='str'),
-        permission_scheme=dict(type='str'),
-        notification_scheme=dict(type='str'),
-        state=dict(type='str',
-                   default='present',
-                   choices=['absent', 'present']),
-        template=dict(type='str', default='com.pyxis.greenhopper.jira:gh-simplified-basic')
-    )
-
+def process(module, api, params):
     # seed the result dict in the object
     result = dict(
         changed=False,
     )
 
-    # Setup AnsibleModule
-    module = AnsibleAtlassianModule(
-        argument_spec=module_args,
-        supports_check_mode=True,
-        required_if=[
-            ('state', 'present', ('name', 'lead'), True),
-        ]
-    )
-
     # Parameters
-    key = module.params['key']
-    name = module.params['name']
-    description = module.params['description']
-    state = module.params['state']
-    lead = module.params['lead']
-    permission_scheme_name = module.params['permission_scheme']
-    notification_scheme_name = module.params['notification_scheme']
-    template = module.params['template']
-
-    # Setup API
-    api = JiraPlatformApi(module)
+    key = params['key']
+    name = params['name']
+    description = params['description']
+    state = params['state']
+    lead = params['lead']
+    permission_scheme_name = params['permission_scheme']
+    notification_scheme_name = params['notification_scheme']
+    template = params['template']
 
     # Get lead
     if lead:
-        leaduser = api.get(f"/api/3/user/search?query={ lead }")
-        if len(leaduser) != 1:
+        leaduser = api.get_user(lead)
+        if leaduser is None:
             module.fail_json(msg="Error finding Lead user", **result)
-        leaduser = leaduser[0]
 
     # Get permission scheme
     if permission_scheme_name:
-        permission_schemes = api.get("/api/3/permissionscheme")['permissionSchemes']
-        permission_scheme = next(filter(lambda p: p['name'] == permission_scheme_name, permission_schemes), None)
+        permission_scheme = api.permission_scheme_id(permission_scheme_name)
         if permission_scheme is None:
-            module.fail_json(msg=f"Error finding permission scheme '{permission_scheme_name}'",
-                             permission_schemes=[p['name'] for p in permission_schemes], **result)
+            module.fail_json(msg=f"Error finding permission scheme '{permission_scheme_name}'", **result)
     else:
         permission_scheme = None
 
     # Get notification scheme
     if notification_scheme_name:
-        startat = 0
-        while True:
-            page = api.get(f"/api/3/notificationscheme?startAt={startat}")
-            notification_schemes = page['values']
-            notification_scheme = next(filter(lambda p: p['name'] == notification_scheme_name, notification_schemes), None)
-            if notification_scheme is not None:
-                break
-            if page['isLast']:
-                module.fail_json(msg=f"Error finding permission scheme '{notification_scheme_name}'",
-                                 notification_scheme=[p['name'] for p in notification_schemes], **result, page=page)
-            startat += page['maxResults']
+        notification_scheme = api.notification_scheme_id(notification_scheme_name)
+        if notification_scheme is None:
+            module.fail_json(msg=f"Error finding notification scheme '{notification_scheme_name}'", **result)
     else:
         notification_scheme = None
 
@@ -147,9 +121,9 @@ def main():
 
     # Delete
     if state == 'absent' and current_project is not None:
-        issues = api.get(f"/api/2/search?jql=project%20%3D%20{ key }")
-        if issues['total'] > 0:
-            module.fail_json(msg="The Project is not empty", issues=[i['key'] for i in issues['issues']], **result)
+        jql = f'project = "{ key }"'
+        if api.has_issues(jql):
+            module.fail_json(msg="The Project is not empty", issues=api.issue_keys(jql, 50), issue_count=api.count_issues(jql), **result)
 
         result['changed'] = True
         new_project = {}
@@ -169,9 +143,9 @@ def main():
             projectTemplateKey=template,
         )
         if permission_scheme:
-            payload['permissionScheme'] = permission_scheme['id']
+            payload['permissionScheme'] = int(permission_scheme)
         if notification_scheme:
-            payload['notificationScheme'] = notification_scheme['id']
+            payload['notificationScheme'] = int(notification_scheme)
         result['new_project'] = payload
         if not module.check_mode:
             result['new_project'] = api.post("/api/2/project", json=payload)
@@ -198,7 +172,37 @@ def main():
     if result['changed'] and module._diff:
         result['diff'] = dict(before=current_project, after=new_project)
 
-    module.exit_json(**result)
+    return result
+
+
+def main():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        key=dict(type='str', required=True, no_log=False),
+        name=dict(type='str'),
+        description=dict(type='str'),
+        lead=dict(type='str'),
+        permission_scheme=dict(type='str'),
+        notification_scheme=dict(type='str'),
+        state=dict(type='str',
+                   default='present',
+                   choices=['absent', 'present']),
+        template=dict(type='str', default='com.pyxis.greenhopper.jira:gh-simplified-basic')
+    )
+
+    # Setup AnsibleModule
+    module = AnsibleAtlassianModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+        required_if=[
+            ('state', 'present', ('name', 'lead'), True),
+        ]
+    )
+
+    # Setup API
+    api = JiraPlatformApi(module)
+
+    module.run(lambda params: process(module, api, params))
 
 
 if __name__ == '__main__':
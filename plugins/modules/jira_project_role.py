@@ -50,40 +50,19 @@ from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import JiraPlatformApi
 
 
-def main():
-    # define available arguments/parameters a user can pass to the module
-    module_args = dict(
-        name=dict(type='str', required=True),
-        description=dict(type='str'),
-        state=dict(type='str',
-                   default='present',
-                   choices=['absent', 'present']),
-    )
-
+def process(module, api, params):
     # seed the result dict in the object
     result = dict(
         changed=False,
     )
 
-    # Setup AnsibleModule
-    module = AnsibleAtlassianModule(
-        argument_spec=module_args,
-        supports_check_mode=True,
-        required_if=[
-            ('state', 'present', ('description',), True),
-        ]
-    )
-
     # Parameters
-    name = module.params['name']
-    description = module.params['description']
-    state = module.params['state']
+    name = params['name']
+    description = params['description']
+    state = params['state']
 
-    # Setup API
-    api = JiraPlatformApi(module)
-
-    # Get current state
-    current_project_role = api.get_role(name)
+    # Get current state, revalidated as the index may hold an outdated role
+    current_project_role = api.get_role(name, max_age=0)
 
     # Delete
     if state == 'absent' and current_project_role is not None:
@@ -100,7 +79,7 @@ def main():
             description=description
         )
         if not module.check_mode:
-            new_project_role = api.post("/api/2/role", payload=new_project_role)
+            new_project_role = api.post("/api/2/role", json=new_project_role)
 
     # Update
     if state == 'present' and current_project_role is not None and current_project_role["description"] != description:
@@ -108,13 +87,38 @@ def main():
         new_project_role = current_project_role.copy()
         new_project_role["description"] = description
         if not module.check_mode:
-            new_project_role = api.post(f"/api/2/role/{current_project_role['id']}", payload=dict(description=description))
+            new_project_role = api.post(f"/api/2/role/{current_project_role['id']}", json=dict(description=description))
 
     # Diff
     if result['changed'] and module._diff:
         result['diff'] = dict(before=current_project_role, after=new_project_role)
 
-    module.exit_json(**result)
+    return result
+
+
+def main():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        name=dict(type='str', required=True),
+        description=dict(type='str'),
+        state=dict(type='str',
+                   default='present',
+                   choices=['absent', 'present']),
+    )
+
+    # Setup AnsibleModule
+    module = AnsibleAtlassianModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+        required_if=[
+            ('state', 'present', ('description',), True),
+        ]
+    )
+
+    # Setup API
+    api = JiraPlatformApi(module)
+
+    module.run(lambda params: process(module, api, params))
 
 
 if __name__ == '__main__':
@@ -61,47 +61,57 @@ EXAMPLES = '''
   confluence_space:
     state: absent
     key: ANSIBLE
+
+# Assign the roles of many projects at once
+- name: Assign project roles
+  scsitteam.atlassian.jira_project_role_actor:
+    items:
+      - project_key: ENG
+        role: Developers
+        groups: [engineering]
+      - project_key: ENG
+        role: Administrators
+        users: [jane.doe@example.com]
+      - project_key: OPS
+        role: Developers
+        groups: [engineering, operations]
 '''
 
 RETURN = '''
+granted:
+    description: The groupIds and accountIds granted the role.
+    returned: changed and state is present or pure
+    type: dict
+revoked:
+    description: The groupIds and accountIds the role was revoked from.
+    returned: changed and state is absent or pure
+    type: dict
 '''
 
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import AnsibleAtlassianModule
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import JiraPlatformApi
 
 
-def main():
-    # define available arguments/parameters a user can pass to the module
-    module_args = dict(
-        project_key=dict(type='str', required=True, no_log=False),
-        role=dict(type='str', required=True),
-        users=dict(type='list', elements='str', aliases=['user'], default=[]),
-        groups=dict(type='list', elements='str', aliases=['group'], default=[]),
-        state=dict(type='str',
-                   default='present',
-                   choices=['absent', 'present', 'pure']),
-    )
+def prepare(module, api, items):
+    """Resolve all roles, users and groups of the batch once."""
+    for role in dict.fromkeys(p['role'] for p in items):
+        api.role_id(role)
+    api.resolve_users([u for p in items for u in p['users']])
+    api.resolve_groups([g for p in items for g in p['groups']])
 
+
+def process(module, api, params):
     # seed the result dict in the object
     result = dict(
         changed=False,
     )
 
-    # Setup AnsibleModule
-    module = AnsibleAtlassianModule(
-        argument_spec=module_args,
-        supports_check_mode=True,
-    )
-
-    # Setup API
-    api = JiraPlatformApi(module)
-
     # Parameters
-    project_key = module.params['project_key']
-    role = api.get_project_role(project_key, module.params['role'])
+    project_key = params['project_key']
+    role = api.get_project_role(project_key, params['role'])
     if not role:
-        module.fail_json(f"Role '{module.params['role']}' not found.")
-    state = module.params['state']
+        module.fail_json(f"Role '{params['role']}' not found in project '{project_key}'.")
+    state = params['state']
 
     # Get current state
     current_groups = {a['actorGroup']['groupId']: a['name'] for a in role['actors'] if a['type'] == 'atlassian-group-role-actor'}
@@ -109,43 +119,83 @@ def main():
     result['current_groups'] = current_groups
     result['current_users'] = current_users
 
+    # Resolve every requested subject, the current actors are compared by id
+    users, missing_users = api.resolve_users(params['users'])
+    groups, missing_groups = api.resolve_groups(params['groups'])
+    user_ids = set(u['accountId'] for u in users.values())
+    group_ids = set(g['groupId'] for g in groups.values())
+
     # Present
     if state == 'present' or state == 'pure':
+        if missing_users or missing_groups:
+            module.fail_json(msg="Could not resolve all users and groups.", missing_users=missing_users, missing_groups=missing_groups, **result)
+
         grant = dict(
-            groupId=[api.get_group(g)['groupId'] for g in module.params['groups'] if g not in current_groups.values()],
-            user=[api.get_user(u)['accountId'] for u in module.params['users'] if u not in current_users.values()],
+            groupId=list(dict.fromkeys(g['groupId'] for g in groups.values() if g['groupId'] not in current_groups)),
+            user=list(dict.fromkeys(u['accountId'] for u in users.values() if u['accountId'] not in current_users)),
         )
 
         if grant['groupId'] or grant['user']:
             result['changed'] = True
+            result['granted'] = grant
             if not module.check_mode:
                 api.post(f"/api/2/project/{project_key}/role/{role['id']}", json=grant)
 
     # Absent
     if state == 'absent':
         revoke = dict(
-            groupId=[id for id, name in current_groups.items() if name in module.params['groups']],
-            user=[id for id, name in current_users.items() if name in module.params['users']],
+            groupId=[id for id in current_groups if id in group_ids],
+            user=[id for id in current_users if id in user_ids],
         )
 
         if revoke['groupId'] or revoke['user']:
             result['changed'] = True
+            result['revoked'] = revoke
             if not module.check_mode:
                 api.delete(f"/api/2/project/{project_key}/role/{role['id']}", params=revoke)
 
     # Pure
     if state == 'pure':
         revoke = dict(
-            groupId=[id for id, name in current_groups.items() if name not in module.params['groups']],
-            user=[id for id, name in current_users.items() if name not in module.params['users']],
+            groupId=[id for id in current_groups if id not in group_ids],
+            user=[id for id in current_users if id not in user_ids],
         )
 
         if revoke['groupId'] or revoke['user']:
             result['changed'] = True
+            result['revoked'] = revoke
             if not module.check_mode:
                 api.delete(f"/api/2/project/{project_key}/role/{role['id']}", params=revoke)
 
-    module.exit_json(**result)
+    return result
+
+
+def main():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        project_key=dict(type='str', required=True, no_log=False),
+        role=dict(type='str', required=True),
+        users=dict(type='list', elements='str', aliases=['user'], default=[]),
+        groups=dict(type='list', elements='str', aliases=['group'], default=[]),
+        state=dict(type='str',
+                   default='present',
+                   choices=['absent', 'present', 'pure']),
+    )
+
+    # Setup AnsibleModule
+    module = AnsibleAtlassianModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    # Setup API
+    api = JiraPlatformApi(module)
+
+    module.run(
+        lambda params: process(module, api, params),
+        prepare=lambda items: prepare(module, api, items),
+        parallel=True,
+    )
 
 
 if __name__ == '__main__':
@@ -16,8 +16,9 @@ description:
 options:
     settings:
         description:
-            - The Jira settings as dictionary.
+            - The Jira settings as dictionary, regular and advanced settings alike.
             - Settings set to None will be reset to there default value.
+            - Only settings which differ are written.
         required: true
         type: dict
 
@@ -48,7 +49,7 @@ EXAMPLES = '''
 
 RETURN = '''
 settings:
-  description: Jira settings
+  description: Jira settings before the change, regular and advanced settings alike.
   returned: success
   type: dict
   sample:
@@ -64,55 +65,82 @@ settings:
 
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import AnsibleAtlassianModule
 from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import JiraPlatformApi
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.executor import ApiExecutor
 
 
-def main():
-    # define available arguments/parameters a user can pass to the module
-    module_args = dict(
-        settings=dict(type='dict', required=True),
-    )
+def setting_index(api, keys):
+    """Map the key of every regular and advanced setting, and of the given keys, to the setting."""
+    # The values are compared, so cached responses are revalidated
+    def get(url, **kwargs):
+        return api.get(url, max_age=0, **kwargs)
 
+    index = {}
+    for settings in api.map_concurrently(get, ["/api/3/application-properties", "/api/3/application-properties/advanced-settings"]):
+        index.update((setting['key'], setting) for setting in settings or [])
+
+    # Not every setting is listed, but they can be looked up by key
+    unlisted = [key for key in keys if key not in index]
+    for key, settings in zip(unlisted, api.map_concurrently(lambda key: get("/api/3/application-properties", params=dict(key=key)), unlisted)):
+        if isinstance(settings, dict):
+            settings = [settings]
+        index.update((setting['key'], setting) for setting in settings or [] if setting['key'] == key)
+    return index
+
+
+def process(module, api, params):
     # seed the result dict in the object
     result = dict(
         changed=False,
     )
 
-    # Setup AnsibleModule
-    module = AnsibleAtlassianModule(
-        argument_spec=module_args,
-        supports_check_mode=True,
-    )
-
     # Parameters
-    settings = module.params['settings']
+    settings = params['settings']
 
-    # Setup API
-    api = JiraPlatformApi(module)
+    index = setting_index(api, list(settings))
+    missing = [key for key in settings if key not in index]
+    if missing:
+        module.fail_json(msg=f"Unknown settings: {', '.join(missing)}", missing=missing)
 
-    current_settings = {ap['key']: ap['value'] for ap in api.get("/api/3/application-properties")}
+    current_settings = {key: setting.get('value', setting.get('defaultValue')) for key, setting in index.items()}
     new_settings = current_settings.copy()
     result['settings'] = current_settings
 
+    executor = ApiExecutor(module)
     for key, value in settings.items():
-        if key not in current_settings:
-            current_settings[key] = api.get("/api/3/application-properties", params=dict(key=key))['defaultValue']
-
         if value is None:
-            value = api.get("/api/3/application-properties", params=dict(key=key))['value']
+            value = index[key].get('defaultValue')
 
-        if current_settings.get(key, None) == value:
+        if current_settings[key] == value:
             continue
 
         result['changed'] = True
         new_settings[key] = value
-        if not module.check_mode:
-            api.put(f"/api/3/application-properties/{key}", json=dict(id=key, value=value))
+        executor.submit(api.put, f"/api/3/application-properties/{key}", json=dict(id=key, value=value))
+    executor.wait()
 
     # Diff
     if result['changed'] and module._diff:
         result['diff'] = dict(before=current_settings, after=new_settings)
 
-    module.exit_json(**result)
+    return result
+
+
+def main():
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        settings=dict(type='dict', required=True),
+    )
+
+    # Setup AnsibleModule
+    module = AnsibleAtlassianModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+
+    # Setup API
+    api = JiraPlatformApi(module)
+
+    module.run(lambda params: process(module, api, params))
 
 
 if __name__ == '__main__':
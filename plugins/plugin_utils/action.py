@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import importlib
+import inspect
+import io
+import json
+import os
+import sys
+import traceback
+
+from contextlib import contextmanager, redirect_stdout
+from unittest import mock
+
+from ansible.module_utils import basic
+from ansible.module_utils.common.text.converters import to_bytes, to_native
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action import ActionBase
+from ansible.utils.display import Display
+from ansible.utils.vars import merge_hash
+from ansible.vars.clean import remove_internal_keys
+
+display = Display()
+
+COLLECTION = 'ansible_collections.scsitteam.atlassian'
+PROFILE = 'legacy'
+
+
+@contextmanager
+def module_args(args):
+    """Expose args to the AnsibleModule created by a module's main()."""
+    try:
+        from ansible.module_utils.common.json import Direction, get_module_encoder
+    except ImportError:
+        from ansible.module_utils.common.json import AnsibleJSONEncoder
+        with mock.patch.object(basic, '_ANSIBLE_ARGS', to_bytes(json.dumps(dict(ANSIBLE_MODULE_ARGS=args), cls=AnsibleJSONEncoder))):
+            yield
+        return
+
+    encoder = get_module_encoder(PROFILE, Direction.CONTROLLER_TO_MODULE)
+    with mock.patch.object(basic, '_ANSIBLE_ARGS', to_bytes(json.dumps(dict(ANSIBLE_MODULE_ARGS=args), cls=encoder))), \
+            mock.patch.object(basic, '_ANSIBLE_PROFILE', PROFILE):
+        yield
+
+
+class AtlassianActionModule(ActionBase):
+    """Run the collection's modules inside the controller process.
+
+    The modules only talk to the Atlassian APIs, so packaging each task as
+    an AnsiballZ payload and starting a fresh interpreter for it is pure
+    overhead when the task runs on the controller anyway. For tasks with a
+    local connection the module's main() is called in the worker process
+    instead. Tasks connecting elsewhere, using become or async, a controller
+    without the requests library or the atlassian_in_process=false variable
+    execute the module the usual way.
+
+    Every module has an action plugin of the same name subclassing this.
+    """
+
+    _supports_check_mode = True
+    _supports_async = True
+
+    def run(self, tmp=None, task_vars=None):
+        result = super().run(tmp, task_vars)
+        del tmp  # tmp no longer has any effect
+        task_vars = task_vars or dict()
+
+        # The task resolves to this plugin, look up the module it stands for
+        module_name = self._shared_loader_obj.module_loader.find_plugin_with_context(
+            self._task.action, collection_list=self._task.collections).resolved_fqcn
+        if self._in_process(module_name, task_vars):
+            return merge_hash(result, self._execute_in_process(module_name, task_vars))
+
+        wrap_async = self._task.async_val and not self._connection.has_native_async
+        result = merge_hash(result, self._execute_module(module_name=module_name, task_vars=task_vars, wrap_async=wrap_async))
+        if not wrap_async:
+            self._remove_tmp_path(self._connection._shell.tmpdir)
+        return result
+
+    def _in_process(self, module_name, task_vars):
+        if not boolean(task_vars.get('atlassian_in_process', True), strict=False):
+            return False
+        if self._connection.transport != 'local' or self._play_context.become or self._task.async_val:
+            return False
+        if not module_name.startswith('scsitteam.atlassian.'):
+            return False
+        from ansible_collections.scsitteam.atlassian.plugins.module_utils.transport import HAS_REQUESTS
+        return HAS_REQUESTS
+
+    def _execute_in_process(self, module_name, task_vars):
+        display.vvv(f"Running {module_name} in the controller process")
+        args = self._task.args.copy()
+        self._update_module_args(module_name, args, task_vars)
+        environment = dict()
+        self._compute_environment_string(raw_environment_out=environment)
+
+        # AnsibleModule prepares the process it runs in, which is the worker here
+        from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import AnsibleAtlassianModule
+        in_worker = mock.patch.multiple(AnsibleAtlassianModule, _check_locale=mock.DEFAULT, _set_cwd=mock.DEFAULT, _log_invocation=mock.DEFAULT)
+
+        stdout = io.StringIO()
+        with module_args(args), redirect_stdout(stdout), mock.patch.dict(os.environ, {k: to_native(v) for k, v in environment.items()}), in_worker:
+            try:
+                importlib.import_module(f"{COLLECTION}.plugins.modules.{module_name.split('.')[-1]}").main()
+            except SystemExit:
+                pass
+            except Exception as e:
+                return dict(failed=True, msg=f"Module {module_name} failed: {to_native(e)}", exception=traceback.format_exc())
+            finally:
+                # The worker process exits without running atexit handlers
+                cassette = sys.modules.get(f"{COLLECTION}.plugins.module_utils.cassette")
+                if cassette is not None:
+                    cassette.flush()
+
+        res = dict(stdout=stdout.getvalue(), stderr='', rc=0)
+        if 'profile' in inspect.signature(self._parse_returned_data).parameters:
+            data = self._parse_returned_data(res, PROFILE)
+        else:
+            data = self._parse_returned_data(res)
+        remove_internal_keys(data)
+        return data
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import threading
+
+from ansible.errors import AnsibleLookupError
+from ansible.module_utils.common.parameters import DEFAULT_TYPE_VALIDATORS
+from ansible.plugins.lookup import LookupBase
+from ansible.release import __version__ as ansible_version
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.cache import credentials_hash
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import atlassian_argument_spec
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.stats import ApiStats
+
+# Options of the scsitteam.atlassian.atlassian.plugin doc fragment
+PLUGIN_OPTIONS = ('atlassian_instance', 'atlassian_username', 'atlassian_password', 'validate_certs', 'cache_path')
+
+# Lookup results of the process, by plugin, instance and credentials
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+class PluginModule(object):
+    """Stand-in for AnsibleAtlassianModule so plugins can use the API classes.
+
+    Options not given by the plugin fall back to their environment variable
+    or default, like they would in a module. Failures raise error instead
+    of exiting the process.
+    """
+
+    check_mode = False
+    ansible_version = ansible_version
+
+    def __init__(self, name, options, error=AnsibleLookupError):
+        self._name = name
+        self.error = error
+        self.stats = ApiStats()
+        self.params = {}
+        for option, spec in atlassian_argument_spec().items():
+            value = spec.get('default')
+            fallback = spec.get('fallback')
+            if fallback is not None and any(env in os.environ for env in fallback[1]):
+                value = DEFAULT_TYPE_VALIDATORS[spec['type']](next(os.environ[env] for env in fallback[1] if env in os.environ))
+            self.params[option] = value
+        self.params.update({k: v for k, v in options.items() if v is not None})
+
+    def fail_json(self, msg, **kwargs):
+        raise self.error(msg)
+
+
+class AtlassianLookupBase(LookupBase):
+    """Base of the lookups resolving terms to Atlassian objects.
+
+    All terms of a lookup are resolved at once by resolve(), which returns
+    a dict of term to object. Results are cached for the lifetime of the
+    process, so lookups repeated in loops and templates do not hit the API
+    again. Ansible templates a task in the worker forked for it and the
+    host, so the cache is not shared between tasks or hosts; only what the
+    API classes keep in cache_path is.
+    """
+
+    api_class = None
+
+    def resolve(self, api, terms):
+        raise NotImplementedError
+
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+        module = PluginModule(self._load_name, {option: self.get_option(option) for option in PLUGIN_OPTIONS})
+        if not module.params.get('atlassian_instance'):
+            raise AnsibleLookupError("No atlassian_instance given")
+        scope = (self._load_name, credentials_hash(module.params))
+
+        terms = [str(term) for term in terms]
+        with _cache_lock:
+            pending = [term for term in dict.fromkeys(terms) if (scope, term) not in _cache]
+        if pending:
+            resolved = self.resolve(self.api_class(module), pending)
+            with _cache_lock:
+                _cache.update({(scope, term): resolved[term] for term in pending if term in resolved})
+
+        with _cache_lock:
+            missing = [term for term in terms if (scope, term) not in _cache]
+            if missing:
+                raise AnsibleLookupError(f"Could not find {', '.join(missing)}")
+            return [_cache[(scope, term)] for term in terms]
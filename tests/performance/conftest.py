@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.atlassian_stub import AtlassianStub
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import routed_to
+
+pytest.importorskip('pytest_benchmark')
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('atlassian stub')
+    group.addoption('--stub-latency', type=float, default=0.0, help='latency in ms added to every stub response')
+    group.addoption('--stub-scale', type=float, default=1.0, help='scale the size of the stub data set')
+
+
+@pytest.fixture(scope='session')
+def stub(request):
+    scale = request.config.getoption('--stub-scale')
+    stub = AtlassianStub(
+        latency=request.config.getoption('--stub-latency') / 1000,
+        projects=int(5000 * scale),
+        users=int(50000 * scale),
+        grants=int(300 * scale),
+    ).start()
+    with routed_to(stub.url):
+        yield stub
+    stub.stop()
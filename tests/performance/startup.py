@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Measure the cold start import time of every module in plugins/modules.
+
+Each module is imported in a fresh interpreter with ``python -X importtime``,
+the same way every task starts a fresh AnsiballZ process. The script reports
+the median cumulative import time per module and whether one of the heavy
+network libraries got imported already.
+
+Run it from a checkout inside an ``ansible_collections/<namespace>/<name>``
+tree::
+
+    python tests/performance/startup.py --runs 10 --budget 250
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+HEAVY_IMPORTS = ('requests', 'urllib3', 'charset_normalizer', 'idna', 'concurrent.futures')
+IMPORTTIME = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$')
+
+
+def collection_root():
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    parts = root.split(os.sep)
+    if len(parts) < 3 or parts[-3] != 'ansible_collections':
+        sys.exit(f"{root} is not inside an ansible_collections/<namespace>/<name> tree")
+    return root, parts[-2], parts[-1]
+
+
+def import_time(python, env, module):
+    """Return the cumulative import time in ms and the heavy imports seen."""
+    proc = subprocess.run(
+        [python, '-X', 'importtime', '-c', f"import {module}"],
+        env=env, stderr=subprocess.PIPE, stdout=subprocess.DEVNULL, universal_newlines=True, check=True,
+    )
+    total = None
+    heavy = set()
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME.match(line)
+        if not match:
+            continue
+        name = match.group(4)
+        if name == module:
+            total = int(match.group(2)) / 1000
+        if name.split('.')[0] in HEAVY_IMPORTS or name in HEAVY_IMPORTS:
+            heavy.add(name if name in HEAVY_IMPORTS else name.split('.')[0])
+    return total, sorted(heavy)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='imports per module, the median is reported')
+    parser.add_argument('--budget', type=float, help='fail if a module takes longer than this many ms')
+    parser.add_argument('--python', default=sys.executable, help='interpreter to measure')
+    parser.add_argument('modules', nargs='*', help='only measure these modules')
+    args = parser.parse_args()
+
+    root, namespace, name = collection_root()
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [os.path.dirname(os.path.dirname(os.path.dirname(root))),
+                                                                     os.environ.get('PYTHONPATH')])),
+               PYTHONDONTWRITEBYTECODE='')
+    modules = args.modules or sorted(f[:-3] for f in os.listdir(os.path.join(root, 'plugins', 'modules'))
+                                     if f.endswith('.py') and not f.startswith('_'))
+
+    # Warm the bytecode cache so only the import itself is measured
+    import_time(args.python, env, 'ansible.module_utils.basic')
+
+    over_budget = []
+    print(f"{'module':<32} {'median ms':>10} {'min ms':>8}  heavy imports")
+    for module in modules:
+        fqmn = f"ansible_collections.{namespace}.{name}.plugins.modules.{module}"
+        samples = []
+        heavy = []
+        for i in range(args.runs):
+            total, heavy = import_time(args.python, env, fqmn)
+            samples.append(total)
+        median = statistics.median(samples)
+        print(f"{module:<32} {median:>10.1f} {min(samples):>8.1f}  {', '.join(heavy) or '-'}")
+        if args.budget is not None and median > args.budget:
+            over_budget.append(module)
+
+    if over_budget:
+        sys.exit(f"Over the {args.budget}ms import budget: {', '.join(over_budget)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Benchmark every module against the local AtlassianStub.
+
+Every scenario runs the module in-process on a freshly reset stub and
+records the wall time through pytest-benchmark, plus the number of requests
+and the peak memory of one extra traced run in extra_info::
+
+    pytest tests/performance --stub-latency 50 --benchmark-save=before
+    pytest tests/performance --stub-latency 50 --benchmark-compare
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import tracemalloc
+
+import pytest
+
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import run_module
+
+SCENARIOS = [
+    ('jira_info', 'info', {}, False),
+    ('jira_group_info', 'large group', dict(name='group-0'), False),
+    ('jira_project_role', 'create', dict(name='Benchmark', description='Benchmark role'), False),
+    ('jira_project_role', 'noop', dict(name='Role 1', description='Role 1 description'), False),
+    ('jira_project', 'create', dict(key='BENCH', name='Benchmark', lead='User 1', permission_scheme='Permission Scheme 0',
+                                                notification_scheme='Notification Scheme 110'), False),
+    ('jira_project', 'noop', dict(key='P4999', name='Project 4999', lead='User 4999'), False),
+    ('jira_project', 'update', dict(key='P4999', name='Renamed', lead='User 1'), False),
+    ('jira_project', 'delete', dict(key='P4998', state='absent'), False),
+    ('jira_project', 'check mode', dict(key='P4999', name='Renamed', lead='User 1'), True),
+    ('jira_project_role_actor', 'noop', dict(project_key='P0100', role='Role 1', users=['User 100'], groups=['group-0']), False),
+    ('jira_project_role_actor', 'grant', dict(project_key='P0100', role='Role 1', users=[f"User {i}" for i in range(200, 250)],
+                                                          groups=[f"group-{i}" for i in range(200, 250)]), False),
+    ('jira_project_role_actor', 'pure', dict(project_key='P0100', role='Role 1', users=['User 1'], state='pure'), False),
+    ('jira_project_role_actor', 'batch', dict(items=[dict(project_key=f"P{p:04d}", role=f"Role {r}", users=['User 1', 'User 2'], groups=['group-1'])
+                                                     for p in range(100, 150) for r in range(6)]), False),
+    ('jira_permission_scheme', 'noop', dict(name='Permission Scheme 0', description='Scheme 0'), False),
+    ('jira_permission_scheme', 'update', dict(name='Permission Scheme 0', description='Benchmark'), False),
+    ('jira_permission_scheme', 'grants', dict(name='Permission Scheme 0', permission=dict(
+        browse_projects=[dict(type='group', value=f"group-{j}") for j in range(0, 300, 2)],
+        edit_issues=[dict(type='group', value=f"group-{j}") for j in range(2, 300, 4)])), False),
+    ('jira_setting', 'update', dict(settings={f"jira.setting.{i}": f"new {i}" for i in range(10)}), False),
+    ('jira_setting', 'baseline', dict(settings={f"jira.setting.{i}": f"value {i}" for i in range(60)}), False),
+    ('confluence_space', 'create', dict(key='BENCH', name='Benchmark', description='Benchmark'), False),
+    ('confluence_space', 'noop', dict(key='SP1', name='Space 1', description='Space 1 description'), False),
+    ('confluence_space', 'delete', dict(key='SP2', state='absent'), False),
+    ('confluence_space_permission', 'noop', dict(key='SP0', group='group-0', permission=dict(space=['read'])), False),
+    ('confluence_space_permission', 'pure', dict(key='SP0', group='group-0', state='pure', permission=dict(space=['read'])), False),
+    ('confluence_space_permission', 'many subjects', dict(key='SP0', groups=[f"group-{i}" for i in range(20)], state='pure',
+                                                          permission=dict(space=['read', 'export'])), False),
+    ('bitbucket_group', 'create', dict(name='bb-benchmark'), False),
+    ('bitbucket_project', 'noop', dict(key='BP1', name='Bitbucket Project 1'), False),
+    ('bitbucket_project', 'set permissions', dict(key='BP0', name='Bitbucket Project 0', group_permission=dict(
+        set=[dict(group=f"bb-group-{i}", permission='write') for i in range(25)])), False),
+]
+
+
+@pytest.mark.parametrize('module,scenario,args,check_mode', SCENARIOS, ids=[f"{s[0]}-{s[1]}" for s in SCENARIOS])
+def test_module(benchmark, stub, module, scenario, args, check_mode):
+    benchmark.group = module
+    benchmark.pedantic(run_module, args=(module, args, check_mode), setup=stub.reset, rounds=5, warmup_rounds=1)
+
+    stub.reset()
+    tracemalloc.start()
+    result = run_module(module, args, check_mode)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert not result.get('failed'), result.get('msg')
+    benchmark.extra_info.update(scenario=scenario, requests=stub.request_count(), peak_memory=peak)
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.atlassian_stub import AtlassianStub
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import routed_to
+
+
+@pytest.fixture(scope='session')
+def atlassian_stub():
+    stub = AtlassianStub(projects=500, users=1000, groups=300, grants=300, spaces=20, bitbucket_projects=20).start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def stub(atlassian_stub):
+    """The AtlassianStub reset to its seed, with all Cloud URLs routed to it."""
+    atlassian_stub.reset()
+    with routed_to(atlassian_stub.url):
+        yield atlassian_stub
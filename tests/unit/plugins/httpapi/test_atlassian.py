@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+
+from unittest import mock
+
+import pytest
+
+from ansible_collections.scsitteam.atlassian.plugins.httpapi.atlassian import HttpApi
+from ansible_collections.scsitteam.atlassian.plugins.module_utils import persistent
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import DEFAULT_ARGS, run_module
+
+
+class NetworkConnection(object):
+    """The ansible.netcommon.httpapi connection the plugin is loaded by."""
+
+    options = dict(remote_user=DEFAULT_ARGS['atlassian_username'], password=DEFAULT_ARGS['atlassian_password'], validate_certs=True)
+
+    def get_option(self, option):
+        return self.options[option]
+
+
+@pytest.fixture
+def httpapi(stub):
+    """HttpApi plugin the modules reach through the persistent connection socket."""
+    plugin = HttpApi(NetworkConnection())
+    plugin.get_option = dict(pool_maxsize=4).get
+    calls = []
+
+    class Connection(object):
+        def __init__(self, socket_path):
+            assert socket_path == '/persistent/socket'
+
+        def send_request(self, *args, **kwargs):
+            # Pass the JSON-RPC channel like ansible-connection does
+            calls.append(args[:2])
+            return json.loads(json.dumps(plugin.send_request(*json.loads(json.dumps(args)), **json.loads(json.dumps(kwargs)))))
+
+    with mock.patch.object(persistent, 'Connection', Connection):
+        yield plugin, calls
+
+
+def test_module_over_persistent_connection(httpapi):
+    plugin, calls = httpapi
+    args = dict(project_key='P0001', role='Role 1', users=['User 1', 'User 7'], groups=['group-1'], _ansible_socket='/persistent/socket')
+
+    first = run_module('jira_project_role_actor', args)
+    session = plugin.session
+    second = run_module('jira_project_role_actor', args)
+
+    assert not first.get('failed'), first.get('msg')
+    assert first['changed'] and not second['changed']
+    assert sorted(second['current_users'].values()) == ['User 1', 'User 7']
+    assert len(calls) == 11
+    assert plugin.session is session
+
+
+def test_connection_credentials(httpapi):
+    plugin, calls = httpapi
+    args = dict(atlassian_username=None, atlassian_password=None, _ansible_socket='/persistent/socket')
+
+    with mock.patch.object(plugin.session, 'request', wraps=plugin.session.request) as request:
+        result = run_module('jira_info', args)
+
+    assert not result.get('failed'), result.get('msg')
+    assert request.call_args.kwargs['auth'] == (DEFAULT_ARGS['atlassian_username'], DEFAULT_ARGS['atlassian_password'])
+    assert 'Authorization' not in request.call_args.kwargs['headers']
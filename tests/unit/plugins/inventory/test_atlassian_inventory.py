@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible.errors import AnsibleParserError
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+
+try:
+    from ansible.template import trust_as_template
+except ImportError:
+    # Templates are only tagged as trusted since ansible-core 2.19
+    def trust_as_template(value):
+        return value
+
+from ansible_collections.scsitteam.atlassian.plugins.inventory.atlassian import InventoryModule
+from ansible_collections.scsitteam.atlassian.plugins.plugin_utils.atlassian import PLUGIN_OPTIONS
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import DEFAULT_ARGS
+
+
+@pytest.fixture
+def inventory(stub):
+    """Build an inventory with options set directly, without the plugin loader."""
+    def build(**options):
+        plugin = InventoryModule()
+        plugin._options = dict(
+            dict.fromkeys(PLUGIN_OPTIONS),
+            sources=['jira_projects', 'confluence_spaces'],
+            bitbucket_workspace=None,
+            parallel_requests=4,
+            compose={}, groups={}, keyed_groups=[], strict=False,
+            leading_separator=True, use_extra_vars=False,
+        )
+        plugin._options.update(DEFAULT_ARGS, **options)
+        plugin.inventory = InventoryData()
+        plugin.templar = Templar(loader=DataLoader())
+        objects = plugin._fetch()
+        plugin._populate(objects)
+        return plugin.inventory, objects
+    return build
+
+
+def test_hosts(inventory, atlassian_stub):
+    inv, objects = inventory(sources=['jira_projects', 'confluence_spaces', 'bitbucket_projects'], bitbucket_workspace='stub')
+
+    assert len(inv.groups['jira_projects'].hosts) == 500
+    assert len(inv.groups['confluence_spaces'].hosts) == 20
+    assert len(inv.groups['bitbucket_projects'].hosts) == 20
+    host = inv.get_host('jira-P0042')
+    assert host.vars['jira_project']['name'] == 'Project 42'
+    assert host.vars['ansible_connection'] == 'local'
+    assert inv.get_host('confluence-SP3').vars['confluence_space']['id'] == '100003'
+    assert inv.get_host('bitbucket-BP7').vars['bitbucket_project']['key'] == 'BP7'
+
+
+def test_pages_fetched_once(inventory, atlassian_stub):
+    inventory(sources=['jira_projects', 'bitbucket_projects'], bitbucket_workspace='stub', parallel_requests=8)
+
+    paths = [path.split('?')[0] for method, path in atlassian_stub.requests]
+    # 50 projects per page in Jira, 100 per page in Bitbucket
+    assert paths.count('/rest/api/3/project/search') == 10
+    assert paths.count('/2.0/workspaces/stub/projects') == 1
+    assert len(set(atlassian_stub.requests)) == len(atlassian_stub.requests)
+
+
+def test_compose_and_groups(inventory):
+    inv, objects = inventory(
+        sources=['jira_projects'],
+        compose=dict(project_name=trust_as_template('jira_project.name')),
+        groups=dict(first_projects=trust_as_template("jira_project.key < 'P0010'")),
+    )
+
+    assert inv.get_host('jira-P0003').vars['project_name'] == 'Project 3'
+    assert len(inv.groups['first_projects'].hosts) == 10
+
+
+def test_bitbucket_requires_workspace(inventory):
+    with pytest.raises(AnsibleParserError, match='bitbucket_workspace'):
+        inventory(sources=['bitbucket_projects'])
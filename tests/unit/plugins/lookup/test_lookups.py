@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import importlib
+
+import pytest
+
+from ansible.errors import AnsibleLookupError
+
+from ansible_collections.scsitteam.atlassian.plugins.plugin_utils import atlassian
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import DEFAULT_ARGS
+
+
+@pytest.fixture
+def lookup(stub, monkeypatch):
+    """Run a lookup with options passed directly, without the plugin loader."""
+    monkeypatch.setattr(atlassian, '_cache', {})
+
+    def set_options(self, task_keys=None, var_options=None, direct=None):
+        self._options = dict(dict.fromkeys(atlassian.PLUGIN_OPTIONS), **direct)
+
+    def run(name, *terms, **kwargs):
+        plugin = importlib.import_module(f"ansible_collections.scsitteam.atlassian.plugins.lookup.{name}").LookupModule()
+        plugin._load_name = name
+        monkeypatch.setattr(plugin, 'set_options', set_options.__get__(plugin))
+        return plugin.run(list(terms), variables={}, **dict(DEFAULT_ARGS, **kwargs))
+    return run
+
+
+def test_jira_role(lookup, atlassian_stub):
+    roles = lookup('jira_role', 'Role 3', 'Role 1')
+    assert [r['id'] for r in roles] == [10003, 10001]
+    assert atlassian_stub.request_count() == 1
+
+
+def test_jira_role_cached(lookup, atlassian_stub):
+    lookup('jira_role', 'Role 1')
+    for i in range(10):
+        assert lookup('jira_role', 'Role 1')[0]['name'] == 'Role 1'
+    assert atlassian_stub.request_count() == 1
+
+
+def test_jira_role_cache_per_credentials(lookup, atlassian_stub):
+    lookup('jira_role', 'Role 1')
+    lookup('jira_role', 'Role 1', atlassian_username='other@example.com')
+    assert atlassian_stub.request_count() == 2
+
+
+def test_jira_role_missing(lookup):
+    with pytest.raises(AnsibleLookupError, match='Role 99'):
+        lookup('jira_role', 'Role 1', 'Role 99')
+
+
+def test_jira_permission_scheme(lookup, atlassian_stub):
+    schemes = lookup('jira_permission_scheme', 'Permission Scheme 2')
+    assert schemes[0]['description'] == 'Scheme 2'
+    assert atlassian_stub.request_count() == 1
+
+
+def test_jira_user(lookup):
+    users = lookup('jira_user', f"{7:024x}", 'User 9')
+    assert [u['displayName'] for u in users] == ['User 7', 'User 9']
+
+
+def test_confluence_space(lookup, atlassian_stub):
+    spaces = lookup('confluence_space', *[f"SP{i}" for i in range(15)])
+    assert [s['id'] for s in spaces] == [str(100000 + i) for i in range(15)]
+    assert atlassian_stub.request_count() == 1
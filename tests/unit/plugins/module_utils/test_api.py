@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+
+from unittest import mock
+
+import pytest
+import requests
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils import api
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import JiraPlatformApi
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import api_module
+
+
+@pytest.fixture
+def closed():
+    """Status codes of the responses closed."""
+    statuses = []
+    close = requests.Response.close
+
+    def record(self):
+        statuses.append(self.status_code)
+        close(self)
+
+    with mock.patch.object(requests.Response, 'close', record), mock.patch('time.sleep'):
+        yield statuses
+
+
+@pytest.mark.parametrize('status', [404, 204])
+def test_stream_closed_without_body(stub, closed, status):
+    stub.inject('GET', r'/rest/api/3/project/search', status)
+    api = JiraPlatformApi(api_module())
+
+    assert api.get('/api/3/project/search', stream='values') is None
+    assert closed == [status]
+
+
+def test_stream_closed_on_error(stub, closed):
+    stub.inject('GET', r'/rest/api/3/project/search', 400)
+    module = api_module()
+    api = JiraPlatformApi(module)
+
+    with mock.patch.object(module, 'fail_json', side_effect=SystemExit), pytest.raises(SystemExit):
+        api.get('/api/3/project/search', stream='values')
+    assert closed == [400]
+
+
+def test_stream_retried_responses_closed(stub, closed):
+    stub.inject('GET', r'/rest/api/3/project/search', 429, headers={'Retry-After': '1'})
+    stub.inject('GET', r'/rest/api/3/project/search', 503, times=1)
+    api = JiraPlatformApi(api_module())
+
+    projects = api.get('/api/3/project/search', stream='values')
+    assert closed == [429, 503]
+
+    assert len(list(projects)) == 50
+    assert closed == [429, 503, 200]
+
+
+def test_stream_closed_by_consumer(stub, closed):
+    api = JiraPlatformApi(api_module())
+
+    projects = iter(api.get('/api/3/project/search', stream='values'))
+    next(projects)
+    assert closed == []
+
+    projects.close()
+    assert closed == [200]
+
+
+class Clock(object):
+    """Stands in for the time module in api, sleeping advances the monotonic time."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock():
+    clock = Clock()
+    with mock.patch.object(api, 'time', clock), mock.patch('random.uniform', side_effect=lambda low, high: high):
+        yield clock
+
+
+def sent(stub, method='GET'):
+    return [path for m, path in stub.requests if m == method]
+
+
+def test_retry_after(stub, clock):
+    stub.inject('GET', r'/rest/api/2/role', 429, headers={'Retry-After': '7'})
+    module = api_module()
+
+    assert len(JiraPlatformApi(module).get('/api/2/role')) == 10
+    assert clock.sleeps == [7 + 0.5 / 4]
+    assert module.stats.retries == 1
+    assert len(sent(stub)) == 2
+
+
+def test_backoff_grows(stub, clock):
+    stub.inject('GET', r'/rest/api/2/role', 503, times=4)
+
+    assert len(JiraPlatformApi(api_module()).get('/api/2/role')) == 10
+    assert clock.sleeps == [0.5, 1, 2, 4]
+    assert len(sent(stub)) == 5
+
+
+def test_max_retries(stub, clock):
+    stub.inject('GET', r'/rest/api/2/role', 503, times=10)
+    module = api_module(dict(max_retries=2))
+
+    with mock.patch.object(module, 'fail_json', side_effect=SystemExit) as fail, pytest.raises(SystemExit):
+        JiraPlatformApi(module).get('/api/2/role')
+    assert '503' in fail.call_args.args[0]
+    assert clock.sleeps == [0.5, 1]
+    assert len(sent(stub)) == 3
+
+
+def test_retry_deadline(stub, clock):
+    stub.inject('GET', r'/rest/api/2/role', 503, times=10)
+    module = api_module(dict(retry_deadline=3))
+
+    with mock.patch.object(module, 'fail_json', side_effect=SystemExit), pytest.raises(SystemExit):
+        JiraPlatformApi(module).get('/api/2/role')
+    # The third retry would end after the deadline
+    assert clock.sleeps == [0.5, 1]
+    assert len(sent(stub)) == 3
+
+
+def test_retry_after_past_deadline(stub, clock):
+    stub.inject('GET', r'/rest/api/2/role', 429, headers={'Retry-After': '60'})
+    module = api_module(dict(retry_deadline=30))
+
+    with mock.patch.object(module, 'fail_json', side_effect=SystemExit), pytest.raises(SystemExit):
+        JiraPlatformApi(module).get('/api/2/role')
+    assert clock.sleeps == []
+    assert len(sent(stub)) == 1
+
+
+def test_post_not_retried(stub, clock):
+    stub.inject('POST', r'/rest/api/2/role', 503)
+    module = api_module()
+
+    with mock.patch.object(module, 'fail_json', side_effect=SystemExit), pytest.raises(SystemExit):
+        JiraPlatformApi(module).post('/api/2/role', json=dict(name='New'))
+    assert clock.sleeps == []
+    assert len(sent(stub, 'POST')) == 1
+    assert 'New' not in [r['name'] for r in stub.data.roles]
+
+
+def test_post_retried_on_request(stub, clock):
+    stub.inject('POST', r'/rest/api/3/search/approximate-count', 503)
+
+    assert JiraPlatformApi(api_module()).count_issues('project = "P0002"') == 2
+    assert clock.sleeps == [0.5]
+    assert len(sent(stub, 'POST')) == 2
+
+
+def test_jira_users_matched_exactly(stub):
+    users, missing = JiraPlatformApi(api_module()).resolve_users(['User 1', 'user2@example.com', 'User 99999'])
+
+    assert {name: user['displayName'] for name, user in users.items()} == {'User 1': 'User 1', 'user2@example.com': 'User 2'}
+    assert missing == ['User 99999']
+    assert len(sent(stub)) == 3
+
+
+def test_jira_users_searched_concurrently(stub):
+    searching = []
+    both_searching = threading.Barrier(2, timeout=5)
+    api = JiraPlatformApi(api_module(dict(parallel_requests=2)))
+    get = api.get
+
+    def search(url, **kwargs):
+        searching.append(kwargs['params']['query'])
+        both_searching.wait()
+        return get(url, **kwargs)
+
+    with mock.patch.object(api, 'get', search):
+        users, missing = api.resolve_users(['User 1', 'User 2'])
+
+    assert sorted(searching) == ['User 1', 'User 2']
+    assert missing == []
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import multiprocessing
+import os
+
+from unittest import mock
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils import cache as cache_module
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import JiraPlatformApi
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.cache import ResponseCache, credentials_hash
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import DEFAULT_ARGS, api_module
+
+URL = 'https://stub.atlassian.net/rest/api/2/role'
+
+
+def entries(path):
+    return [os.path.join(group.path, entry.name) for group in os.scandir(path) if group.is_dir() for entry in os.scandir(group.path)]
+
+
+def test_revalidated_by_etag(stub, tmp_path):
+    module = api_module(dict(cache_path=str(tmp_path)))
+    api = JiraPlatformApi(module)
+    roles = api.get('/api/2/role')
+
+    assert api.get('/api/2/role') == roles
+    assert api.get('/api/2/role', max_age=0) == roles
+    stub.data.roles[0]['description'] = 'Changed'
+    assert api.get('/api/2/role', max_age=0)[0]['description'] == 'Changed'
+
+    assert [r['status'] for r in module.stats.requests] == [200, 'cached', 304, 200]
+
+
+def test_lru_evicted(tmp_path):
+    cache = ResponseCache(str(tmp_path), 'scope', 10 ** 6)
+    # A fixed store time makes every entry the same size
+    with mock.patch.object(cache_module, 'time', mock.Mock(time=lambda: 1000.0)):
+        for age, name in enumerate(['a', 'b', 'c']):
+            cache.set('/api/2/role', name, 'x' * 1000, {})
+            os.utime(cache._entry('/api/2/role', name), (1000 + age, 1000 + age))
+        assert len(set(os.path.getsize(path) for path in entries(str(tmp_path)))) == 1
+
+        # Reading an entry makes it the most recently used
+        assert cache.get('/api/2/role', 'a') is not None
+        cache.max_size = 3 * os.path.getsize(entries(str(tmp_path))[0])
+        cache.set('/api/3/permissionscheme', 'd', 'x' * 1000, {})
+
+    assert cache.get('/api/2/role', 'b') is None
+    assert [cache.get('/api/2/role', name) is not None for name in ['a', 'c']] == [True, True]
+    assert cache.get('/api/3/permissionscheme', 'd') is not None
+
+
+def write(path, writer):
+    cache = ResponseCache(path, 'scope', 64 * 1024)
+    for idx in range(50):
+        cache.set(f"/api/{writer}/role/{idx % 5}", f"{writer}-{idx}", dict(writer=writer, idx=idx, padding='x' * 500), {})
+        if idx == 25:
+            cache.invalidate(f"/api/{writer}/role")
+
+
+def test_concurrent_writers(tmp_path):
+    context = multiprocessing.get_context('fork')
+    writers = [context.Process(target=write, args=(str(tmp_path), writer)) for writer in range(4)]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+
+    assert [writer.exitcode for writer in writers] == [0, 0, 0, 0]
+    paths = entries(str(tmp_path))
+    assert paths
+    assert not [path for path in paths if path.endswith('.tmp')]
+    assert sum(os.path.getsize(path) for path in paths) <= 64 * 1024
+    for path in paths:
+        with open(path) as fd:
+            assert json.load(fd)['body']['padding'] == 'x' * 500
+
+
+def test_keyed_by_credentials(tmp_path):
+    scope = credentials_hash(DEFAULT_ARGS)
+    ResponseCache(str(tmp_path), scope, 10 ** 6).set('/api/2/role', URL, ['roles'], {})
+
+    assert ResponseCache(str(tmp_path), credentials_hash(dict(DEFAULT_ARGS)), 10 ** 6).get('/api/2/role', URL)['body'] == ['roles']
+    for other in [dict(atlassian_password='other'), dict(atlassian_username='other@example.com'), dict(atlassian_instance='other')]:
+        assert ResponseCache(str(tmp_path), credentials_hash(dict(DEFAULT_ARGS, **other)), 10 ** 6).get('/api/2/role', URL) is None
+
+    assert DEFAULT_ARGS['atlassian_password'] not in scope
+    assert not [path for path in entries(str(tmp_path)) if DEFAULT_ARGS['atlassian_password'] in path]
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import gzip
+
+import pytest
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.cassette import cassette
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.atlassian_stub import AtlassianStub
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import routed_to, run_module
+
+ARGS = dict(project_key='P0001', role='Role 1', users=['User 1', 'User 7'], groups=['group-0'], state='pure')
+
+
+@pytest.fixture
+def recorded(tmp_path, monkeypatch):
+    """Cassette recorded from a jira_project_role_actor run, its stub URL and result."""
+    path = str(tmp_path / 'jira.jsonl.gz')
+    stub = AtlassianStub(projects=10, users=10, groups=10, spaces=1, bitbucket_projects=1).start()
+    monkeypatch.setenv('ATLASSIAN_CASSETTE', path)
+    monkeypatch.setenv('ATLASSIAN_CASSETTE_MODE', 'record')
+    try:
+        with routed_to(stub.url):
+            result = run_module('jira_project_role_actor', ARGS, check_mode=True)
+    finally:
+        stub.stop()
+    cassette(path, 'record').flush()
+    monkeypatch.setenv('ATLASSIAN_CASSETTE_MODE', 'replay')
+    return path, stub.url, result
+
+
+def test_record_scrubs_credentials(recorded):
+    path, url, result = recorded
+
+    with gzip.open(path, 'rt') as f:
+        content = f.read()
+    assert len(content.splitlines()) == 5
+    assert 's3cr3t-pw' not in content
+    assert 'Authorization' not in content
+
+
+def test_replay_without_network(recorded):
+    path, url, result = recorded
+
+    # The stub is stopped already
+    with routed_to(url):
+        replayed = run_module('jira_project_role_actor', ARGS, check_mode=True)
+
+    assert not replayed.get('failed'), replayed.get('msg')
+    assert replayed['changed'] == result['changed']
+    assert replayed['current_users'] == result['current_users']
+
+
+def test_replay_unrecorded_request(recorded):
+    path, url, result = recorded
+
+    with routed_to(url):
+        replayed = run_module('jira_project_role_actor', dict(ARGS, project_key='P0002'), check_mode=True)
+
+    assert replayed['failed']
+    assert 'No recorded response for GET' in replayed['msg']
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+import time
+
+import pytest
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import AtlassianApiError
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.executor import ApiExecutor
+
+
+class Failed(Exception):
+    def __init__(self, msg, kwargs):
+        super().__init__(msg)
+        self.kwargs = kwargs
+
+
+class Module(object):
+    def __init__(self, check_mode=False, parallel_requests=4):
+        self.check_mode = check_mode
+        self.params = dict(parallel_requests=parallel_requests)
+
+    def fail_json(self, msg, **kwargs):
+        raise Failed(msg, kwargs)
+
+
+def test_results_in_order():
+    executor = ApiExecutor(Module())
+    for delay in [0.03, 0.0, 0.01]:
+        executor.submit(lambda delay: time.sleep(delay) or delay, delay)
+
+    assert executor.wait() == [0.03, 0.0, 0.01]
+
+
+def test_check_mode_skips_calls():
+    calls = []
+    executor = ApiExecutor(Module(check_mode=True))
+    executor.submit(calls.append, 1)
+    executor.submit(calls.append, 2)
+
+    assert executor.wait() == [None, None]
+    assert calls == []
+    assert executor.pool is None
+
+
+def test_cancelled_after_first_exception():
+    started = []
+
+    def call(idx):
+        started.append(idx)
+        if idx == 0:
+            raise AtlassianApiError('Could not DELETE', status=500)
+        time.sleep(0.05)
+
+    executor = ApiExecutor(Module(parallel_requests=1))
+    for idx in range(20):
+        executor.submit(call, idx)
+
+    with pytest.raises(Failed, match='Could not DELETE'):
+        executor.wait()
+    # At most the call which was picked up before the failure was seen ran
+    assert started[0] == 0
+    assert len(started) <= 2
+
+
+def test_errors_aggregated():
+    both_running = threading.Barrier(2, timeout=5)
+
+    def fail(msg, status):
+        both_running.wait()
+        raise AtlassianApiError(msg, status=status)
+
+    executor = ApiExecutor(Module(parallel_requests=3))
+    executor.submit(lambda: 'ok')
+    executor.submit(fail, 'Could not POST', 400)
+    executor.submit(fail, 'Could not PUT', 409)
+
+    with pytest.raises(Failed) as failed:
+        executor.wait()
+    assert str(failed.value) == 'Could not POST'
+    assert failed.value.kwargs['errors'] == [
+        dict(index=1, msg='Could not POST', status=400),
+        dict(index=2, msg='Could not PUT', status=409),
+    ]
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+
+import pytest
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.jsonstream import JsonArrayStream
+
+DOCUMENT = {
+    'start': 0,
+    'nested': {'values': ['not', 'this']},
+    'note': 'a "values": [ in a string \\ ]',
+    'values': [
+        {'name': 'Grüezi ☃', 'quote': 'say "hi"\\', 'tags': [[1, [2, []]], {}]},
+        12345,
+        -1.5e3,
+        'plain',
+        [],
+        None,
+        True,
+    ],
+    'isLast': True,
+}
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def split_at(data, pos):
+    return [data[:pos], data[pos:]]
+
+
+def parsed(chunks, key='values'):
+    stream = JsonArrayStream(chunks, key)
+    return list(stream), stream
+
+
+@pytest.mark.parametrize('pos', range(len(json.dumps(DOCUMENT, ensure_ascii=False).encode())))
+def test_every_chunk_boundary(pos):
+    data = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+
+    items, stream = parsed(split_at(data, pos))
+
+    assert items == DOCUMENT['values']
+    assert stream.count == len(DOCUMENT['values'])
+    assert stream.document == dict(DOCUMENT, values=[])
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 64 * 1024])
+def test_chunk_sizes(size):
+    data = json.dumps(DOCUMENT, ensure_ascii=False, indent=2).encode()
+
+    items, stream = parsed(chunked(data, size))
+
+    assert items == DOCUMENT['values']
+    assert stream.document == dict(DOCUMENT, values=[])
+
+
+def test_escapes():
+    data = json.dumps({'say "values": [': 1, 'values': ['\\', '"', '\\"', 'é', '\n'], 'end': '\\'}).encode()
+
+    items, stream = parsed(chunked(data, 1))
+
+    assert items == ['\\', '"', '\\"', 'é', '\n']
+    assert stream.document == {'say "values": [': 1, 'values': [], 'end': '\\'}
+
+
+def test_nested_arrays():
+    data = b'[[1, [2, [3]]], [], [[[]]], {"values": [4]}]'
+
+    items, stream = parsed(chunked(data, 2), key=None)
+
+    assert items == [[1, [2, [3]]], [], [[[]]], {'values': [4]}]
+    assert stream.document == []
+
+
+def test_only_top_level_key():
+    data = b'{"page": {"values": [1, 2]}, "values": [3]}'
+
+    items, stream = parsed([data])
+
+    assert items == [3]
+    assert stream.document == {'page': {'values': [1, 2]}, 'values': []}
+
+
+def test_numbers_split():
+    items, stream = parsed([b'[1', b'2, 3', b'4', b'5.', b'5e1', b'0]'], key=None)
+
+    assert items == [12, 345.5e10]
+
+
+@pytest.mark.parametrize('data,error', [
+    (b'{"values": [1, 2', 'Unexpected end of JSON array'),
+    (b'{"values": [1 2]}', "Expected ','"),
+    (b'{"other": [1]}', "no array 'values'"),
+    (b'{"values": [{"a": ]}', 'Expecting value'),
+])
+def test_invalid(data, error):
+    failed, closed = [], []
+    stream = JsonArrayStream(chunked(data, 3), 'values', fail=failed.append, close=lambda: closed.append(True))
+
+    with pytest.raises(ValueError, match=error):
+        list(stream)
+    assert len(failed) == 1
+    assert closed == [True]
+
+
+def test_closed_when_stopped_early():
+    closed = []
+    stream = JsonArrayStream([b'[1, 2, 3]'], close=lambda: closed.append(True))
+
+    items = iter(stream)
+    assert next(items) == 1
+    items.close()
+
+    assert closed == [True]
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from unittest import mock
+
+from ansible.module_utils import basic
+
+from ansible_collections.scsitteam.atlassian.plugins.modules import jira_project_role_actor
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import run_module
+
+
+def test_items(stub, atlassian_stub):
+    result = run_module('jira_project_role', dict(items=[
+        dict(name='Role 1', description='Role 1 description'),
+        dict(name='New', description='New role'),
+    ]))
+
+    assert not result.get('failed'), result.get('msg')
+    assert result['changed']
+    assert [r['changed'] for r in result['results']] == [False, True]
+    assert result['results'][1]['item'] == dict(name='New', description='New role')
+    assert any(r['name'] == 'New' for r in atlassian_stub.data.roles)
+
+
+def test_items_task_options_are_defaults(stub, atlassian_stub):
+    result = run_module('jira_project_role', dict(state='absent', items=[
+        dict(name='Role 1'),
+        dict(name='Role 2'),
+        dict(name='Role 3', description='Role 3 description', state='present'),
+    ]))
+
+    assert not result.get('failed'), result.get('msg')
+    assert [r['changed'] for r in result['results']] == [True, True, False]
+    assert [r['name'] for r in atlassian_stub.data.roles if r['name'] in ('Role 1', 'Role 2', 'Role 3')] == ['Role 3']
+
+
+def test_items_failure_does_not_stop_others(stub, atlassian_stub):
+    result = run_module('jira_project_role', dict(items=[
+        dict(description='Name missing'),
+        dict(name='New', description='New role'),
+    ]))
+
+    assert result['failed']
+    assert result['msg'].startswith('1 of 2 items failed')
+    assert result['results'][0]['failed']
+    assert 'name' in result['results'][0]['msg']
+    assert result['results'][1]['changed']
+
+
+def test_items_share_reference_data(stub, atlassian_stub):
+    result = run_module('jira_project', dict(lead='User 1', permission_scheme='Permission Scheme 0', items=[
+        dict(key=f"NEW{i}", name=f"New {i}") for i in range(5)
+    ]))
+
+    assert not result.get('failed'), result.get('msg')
+    assert len(result['results']) == 5
+    paths = [path.split('?')[0] for method, path in atlassian_stub.requests if method == 'GET']
+    assert paths.count('/rest/api/3/permissionscheme') == 1
+
+
+def test_no_items_validates_module_options(stub):
+    result = run_module('jira_project_role', dict(description='Name missing'))
+
+    assert result['failed']
+    assert result['msg'] == 'missing required arguments: name'
+
+
+def test_documented_spec_passed_to_ansible_module():
+    """validate-modules compares the spec AnsibleModule gets with the documentation."""
+    captured = {}
+
+    def capture(self, argument_spec, **kwargs):
+        captured.update(argument_spec=argument_spec, **kwargs)
+        raise SystemExit()
+
+    with mock.patch.object(basic, '_load_params', lambda: None), mock.patch.object(basic.AnsibleModule, '__init__', capture):
+        try:
+            jira_project_role_actor.main()
+        except SystemExit:
+            pass
+
+    assert captured['argument_spec']['project_key']['required'] is True
+    assert captured['argument_spec']['state']['default'] == 'present'
+    assert 'items' in captured['argument_spec']
+
+
+def test_items_task_options_checked(stub):
+    result = run_module('confluence_space_permission', dict(items=[dict(key='SP0', permission=dict(space=['read']))]))
+
+    assert result['failed']
+    assert 'one of the following is required: user, group, users, groups' in result['results'][0]['msg']
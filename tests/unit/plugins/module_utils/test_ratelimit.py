@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.ratelimit import RateLimiter, state_path
+
+
+class Clock(object):
+    """Clock which only advances when slept on or moved explicitly."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def limiter(path, clock, rate=50, burst=1):
+    return RateLimiter(path, rate=rate, burst=burst, clock=clock, sleep=clock.sleep)
+
+
+def test_burst_then_rate(tmp_path):
+    clock = Clock()
+    bucket = limiter(state_path(str(tmp_path), 'stub'), clock, burst=3)
+
+    assert [bucket.acquire() for i in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(0.02)
+    assert bucket.acquire() == pytest.approx(0.02)
+    assert clock.now == pytest.approx(1000.04)
+
+
+def test_tokens_refill(tmp_path):
+    clock = Clock()
+    bucket = limiter(state_path(str(tmp_path), 'stub'), clock, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 1.0
+    assert [bucket.acquire() for i in range(2)] == [0.0, 0.0]
+
+
+def test_shared_between_limiters(tmp_path):
+    clock = Clock()
+    path = state_path(str(tmp_path), 'stub')
+    first, second = limiter(path, clock), limiter(path, clock)
+
+    assert first.acquire() == 0.0
+    assert second.acquire() == pytest.approx(0.02)
+
+
+def test_state_per_instance(tmp_path):
+    assert state_path(str(tmp_path), 'one') != state_path(str(tmp_path), 'two')
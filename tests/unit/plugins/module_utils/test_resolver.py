@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.resolver import ResolverIndex, index_path
+
+
+class Loader(object):
+    def __init__(self, ids):
+        self.ids = ids
+        self.calls = []
+
+    def __call__(self, reload):
+        self.calls.append(reload)
+        return dict(self.ids)
+
+
+def test_loaded_once(tmp_path):
+    index = ResolverIndex(index_path(str(tmp_path), 'scope'))
+    load = Loader({'Role 1': '10001', 'Role 2': '10002'})
+
+    assert index.lookup('/api/2/role', 'Role 1', load, 60) == '10001'
+    assert index.lookup('/api/2/role', 'Role 2', load, 60) == '10002'
+    assert load.calls == [False]
+
+
+def test_reloaded_once_on_miss(tmp_path):
+    index = ResolverIndex(index_path(str(tmp_path), 'scope'))
+    load = Loader({'Role 1': '10001'})
+    index.lookup('/api/2/role', 'Role 1', load, 60)
+
+    load.ids['Role 2'] = '10002'
+    assert ResolverIndex(index.path).lookup('/api/2/role', 'Role 2', load, 60) == '10002'
+    assert load.calls == [False, True]
+
+    second = ResolverIndex(index.path)
+    assert second.lookup('/api/2/role', 'Missing', load, 60) is None
+    assert second.lookup('/api/2/role', 'Missing', load, 60) is None
+    assert load.calls == [False, True, True]
+
+
+def test_shared_and_expired(tmp_path):
+    path = index_path(str(tmp_path), 'scope')
+    load = Loader({'Role 1': '10001'})
+    ResolverIndex(path).lookup('/api/2/role', 'Role 1', load, 60)
+
+    assert ResolverIndex(path).lookup('/api/2/role', 'Role 1', load, 60) == '10001'
+    assert load.calls == [False]
+    assert ResolverIndex(path).lookup('/api/2/role', 'Role 1', load, 0) == '10001'
+    assert load.calls == [False, True]
+
+
+def test_kinds_merged_and_invalidated(tmp_path):
+    path = index_path(str(tmp_path), 'scope')
+    first, second = ResolverIndex(path), ResolverIndex(path)
+    roles, schemes = Loader({'Role 1': '10001'}), Loader({'Scheme 1': '20001'})
+    first.lookup('/api/2/role', 'Role 1', roles, 60)
+    second.lookup('/api/3/permissionscheme', 'Scheme 1', schemes, 60)
+
+    assert set(ResolverIndex(path)._kinds()) == {'/api/2/role', '/api/3/permissionscheme'}
+
+    first.invalidate('/api/2/role/10001')
+    assert set(ResolverIndex(path)._kinds()) == {'/api/3/permissionscheme'}
+
+
+def test_in_memory():
+    index = ResolverIndex()
+    load = Loader({'Role 1': '10001'})
+
+    assert index.lookup('/api/2/role', 'Role 1', load, 60) == '10001'
+    index.invalidate('/api/2/role')
+    assert index.lookup('/api/2/role', 'Role 1', load, 60) == '10001'
+    assert load.calls == [False, False]
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.stats import ApiStats, endpoint, percentiles
+
+
+@pytest.mark.parametrize('method,url,expected', [
+    ('get', 'https://stub.atlassian.net/rest/api/2/project/P0001/role/10001', 'GET /rest/api/2/project/{key}/role/{id}'),
+    ('GET', 'https://stub.atlassian.net/rest/api/3/user?accountId=1', 'GET /rest/api/3/user'),
+    ('DELETE', 'https://stub.atlassian.net/rest/api/3/user/557058:f58131cb-b67d-43c7-b30d-6b58d40bd077', 'DELETE /rest/api/3/user/{accountId}'),
+    ('GET', 'https://stub.atlassian.net/rest/api/3/user/5b10a2844c20165700ede21f', 'GET /rest/api/3/user/{accountId}'),
+    ('GET', 'https://stub.atlassian.net/wiki/api/v2/spaces/123/permissions', 'GET /wiki/api/v2/spaces/{id}/permissions'),
+    ('PUT', 'https://api.bitbucket.org/2.0/workspaces/stub/projects/PROJ', 'PUT /2.0/workspaces/stub/projects/{key}'),
+])
+def test_endpoint(method, url, expected):
+    assert endpoint(method, url) == expected
+
+
+def test_percentiles():
+    assert percentiles([i / 1000 for i in range(100, 0, -1)]) == dict(p50=0.051, p90=0.091, p99=0.1, max=0.1, total=5.05)
+    assert percentiles([]) == dict(p50=0, p90=0, p99=0, max=0, total=0)
+
+
+def test_summary():
+    stats = ApiStats()
+    stats.record('GET', 'https://stub.atlassian.net/rest/api/2/role/10001', 200, bytes_in=100, latency=0.2)
+    stats.record('GET', 'https://stub.atlassian.net/rest/api/2/role/10002', 503, bytes_in=20, latency=0.4, retries=2)
+    stats.record('POST', 'https://stub.atlassian.net/rest/api/2/role', 201, bytes_in=50, bytes_out=30, latency=0.1)
+    stats.record('GET', 'https://stub.atlassian.net/rest/api/2/role', 'cached')
+    stats.retried(0.5)
+    stats.retried(1.25)
+    stats.limited(0.1)
+
+    summary = stats.summary()
+
+    assert {k: v for k, v in summary.items() if k != 'endpoints'} == dict(
+        requests=4, statuses={'200': 1, '503': 1, '201': 1, 'cached': 1}, retries=2, bytes_in=170, bytes_out=30,
+        latency=dict(p50=0.2, p90=0.4, p99=0.4, max=0.4, total=0.7), retry_sleep=1.75, rate_limit_sleep=0.1,
+    )
+    assert list(summary['endpoints']) == ['GET /rest/api/2/role', 'GET /rest/api/2/role/{id}', 'POST /rest/api/2/role']
+    assert summary['endpoints']['GET /rest/api/2/role/{id}'] == dict(
+        requests=2, statuses={'200': 1, '503': 1}, retries=2, bytes_in=120, bytes_out=0,
+        latency=dict(p50=0.4, p90=0.4, p99=0.4, max=0.4, total=0.6),
+    )
+    assert stats.retries == 2
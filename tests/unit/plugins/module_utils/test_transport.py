@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import socket
+import time
+
+from unittest import mock
+
+import pytest
+import requests
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils import transport
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.transport import DeadlineExceeded, KeepAliveAdapter, Transport
+
+
+class Module(object):
+    def __init__(self, **params):
+        self.params = dict(connection_timeout=10, read_timeout=60, api_deadline=None, pool_connections=4, pool_maxsize=16)
+        self.params.update(params)
+
+
+@pytest.fixture
+def silent_server():
+    """Address of a server accepting connections but never answering."""
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    host, port = server.getsockname()
+    yield f"http://{host}:{port}/rest/api/2/role"
+    server.close()
+
+
+def test_keepalive_on_pooled_connections():
+    adapter = KeepAliveAdapter(pool_connections=2, pool_maxsize=3, pool_block=True)
+
+    options = adapter.poolmanager.connection_pool_kw['socket_options']
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 3
+    assert adapter.poolmanager.connection_pool_kw['block']
+
+
+def test_session_uses_keepalive_adapter():
+    session = Transport(Module(pool_maxsize=8)).session
+
+    assert isinstance(session.get_adapter('https://stub.atlassian.net'), KeepAliveAdapter)
+    assert session.get_adapter('https://stub.atlassian.net')._pool_maxsize == 8
+
+
+def test_timeouts_without_deadline():
+    assert Transport(Module()).timeout() == (10, 60)
+
+
+def test_deadline_caps_timeouts():
+    with mock.patch.object(transport.time, 'monotonic', return_value=1000.0):
+        connection = Transport(Module(api_deadline=30))
+        assert connection.timeout() == (10, 30)
+
+    with mock.patch.object(transport.time, 'monotonic', return_value=1025.0):
+        assert connection.timeout() == (5, 5)
+
+    with mock.patch.object(transport.time, 'monotonic', return_value=1030.0), pytest.raises(DeadlineExceeded):
+        connection.timeout()
+
+
+def test_deadline_fires_before_read_timeout(silent_server):
+    connection = Transport(Module(api_deadline=1))
+
+    started = time.monotonic()
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        connection.request('GET', silent_server)
+    assert time.monotonic() - started < 5
+
+    time.sleep(max(0, connection.deadline - time.monotonic()))
+    with pytest.raises(DeadlineExceeded):
+        connection.request('GET', silent_server)
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import run_module
+
+
+def test_delete_not_empty(stub):
+    result = run_module('confluence_space', dict(key='SP1', state='absent'))
+
+    assert result['failed']
+    assert result['msg'] == 'The Space is not empty'
+    assert result['pages'] == ['Page 0']
+    assert result['page_count'] == 1
+    assert 'SP1' in stub.data.spaces
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.api import ConfluenceApi
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.atlassian_stub import account_id
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import run_module
+
+
+def permissions(stub, kind, name):
+    return sorted((p['operation']['targetType'], p['operation']['operation'])
+                  for p in stub.data.space_permissions['SP0'] if p['subject'] == (kind, name))
+
+
+def test_grant(stub):
+    result = run_module('confluence_space_permission', dict(key='SP0', group='group-21', permission=dict(space=['read', 'export'], page=['archive'])))
+
+    assert result['changed']
+    assert result['missing_permissions'] == dict(space=[], page=['archive'], blogpost=[], comment=[], attachment=[])
+    assert dict(id='300294', operation=dict(operation='read', targetType='space'), subjects=dict(group=['group-21'])) in result['current_permissions']
+    assert ('page', 'archive') in permissions(stub, 'group', 'group-21')
+
+
+def test_revoke(stub):
+    result = run_module('confluence_space_permission', dict(key='SP0', group='group-0', state='revoke', permission=dict(space=['read', 'delete'])))
+
+    assert result['changed']
+    assert result['revoked'] == [dict(type='group', name='group-0', target='space', operation='delete'),
+                                 dict(type='group', name='group-0', target='space', operation='read')]
+    assert permissions(stub, 'group', 'group-0') == sorted([
+        ('space', 'export'), ('space', 'administer'), ('space', 'restrict_content'),
+        ('page', 'create'), ('page', 'delete'), ('page', 'archive'),
+        ('blogpost', 'create'), ('blogpost', 'delete'), ('comment', 'create'), ('comment', 'delete'),
+        ('attachment', 'create'), ('attachment', 'delete'),
+    ])
+    assert ('space', 'read') in permissions(stub, 'group', 'group-1')
+
+
+def test_pure(stub):
+    result = run_module('confluence_space_permission', dict(key='SP0', groups=['group-0', 'group-100'], state='pure',
+                                                            permission=dict(space=['read'], page=['create'])))
+
+    assert result['changed']
+    assert len(result['additional_permissions']) == 12
+    assert all(p['subjects'] == dict(group=['group-0']) for p in result['additional_permissions'])
+    assert permissions(stub, 'group', 'group-0') == [('page', 'create'), ('space', 'read')]
+    assert permissions(stub, 'group', 'group-1') != [('page', 'create'), ('space', 'read')]
+    assert 'diff' not in result
+
+
+def test_diff(stub):
+    result = run_module('confluence_space_permission', dict(key='SP0', group='group-100', permission=dict(space=['read']), _ansible_diff=True))
+
+    assert result['diff'] == dict(before=dict(users={}, groups={'group-100': {}}), after=dict(users={}, groups={'group-100': dict(space=['read'])}))
+
+
+def test_user_names_matched_exactly(stub):
+    result = run_module('confluence_space_permission', dict(key='SP0', users=['User 1', 'User 10'], permission=dict(space=['read'])))
+
+    assert not result.get('failed'), result.get('msg')
+    assert [(g['name'], g['target'], g['operation']) for g in result['granted']] == [('User 1', 'space', 'read'), ('User 10', 'space', 'read')]
+
+
+def test_user_name_quoted(stub):
+    api = ConfluenceApi(None)
+    api.get = lambda url, **kwargs: None
+
+    sent = []
+
+    def paginate(url, **kwargs):
+        sent.append(kwargs['params']['cql'])
+        return iter([dict(user=dict(accountId=account_id(1), displayName='Jane "JD" Doe\\'))])
+
+    api.paginate = paginate
+
+    assert api.resolve_users(['Jane "JD" Doe\\']) == ({'Jane "JD" Doe\\': account_id(1)}, [])
+    assert sent == ['user.fullname~"Jane \\"JD\\" Doe\\\\"']
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import run_module
+
+
+def test_all_members_in_page_shape(stub):
+    result = run_module('jira_group_info', dict(name='group-0'))
+
+    assert not result.get('failed'), result.get('msg')
+    group = result['group']
+    assert {k: v for k, v in group.items() if k != 'values'} == dict(startAt=0, maxResults=1000, total=1000, isLast=True)
+    assert len(group['values']) == 1000
+    assert group['values'][0] == stub.data.user(0)
+
+
+def test_missing_group(stub):
+    result = run_module('jira_group_info', dict(name='no-such-group'))
+
+    assert not result.get('failed'), result.get('msg')
+    assert result['group'] is None
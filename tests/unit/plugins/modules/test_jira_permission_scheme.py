@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.atlassian_stub import group_id
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import run_module
+
+
+def grants(stub, name):
+    scheme = next(s for s in stub.data.permission_schemes if s['name'] == name)
+    return sorted((g['permission'], g['holder']['type'], g['holder'].get('value')) for g in scheme['permissions'])
+
+
+@pytest.mark.parametrize('parallel_requests', [1, 10])
+def test_grants_reconciled(stub, parallel_requests):
+    result = run_module('jira_permission_scheme', dict(name='Permission Scheme 1', parallel_requests=parallel_requests, permission=dict(
+        browse_projects=[dict(type='group', value='group-0'), dict(type='group', value='group-100')],
+        create_issues=[dict(type='reporter')],
+    )))
+
+    assert not result.get('failed'), result.get('msg')
+    assert result['changed']
+    assert grants(stub, 'Permission Scheme 1') == sorted([
+        ('ADMINISTER_PROJECTS', 'group', group_id('group-3')),
+        ('ADMINISTER_PROJECTS', 'group', group_id('group-7')),
+        ('BROWSE_PROJECTS', 'group', group_id('group-0')),
+        ('BROWSE_PROJECTS', 'group', group_id('group-100')),
+        ('CREATE_ISSUES', 'reporter', None),
+        ('EDIT_ISSUES', 'group', group_id('group-2')),
+        ('EDIT_ISSUES', 'group', group_id('group-6')),
+    ])
+
+
+@pytest.mark.parametrize('type', ['group', 'user', 'projectRole'])
+def test_grant_value_required(stub, type):
+    before = grants(stub, 'Permission Scheme 1')
+
+    result = run_module('jira_permission_scheme', dict(name='Permission Scheme 1', permission=dict(browse_projects=[dict(type=type)])))
+
+    assert result['failed']
+    assert 'value' in result['msg']
+    assert grants(stub, 'Permission Scheme 1') == before
+
+
+def test_grants_read_past_response_cache(stub, tmp_path):
+    args = dict(name='Permission Scheme 1', cache_path=str(tmp_path), permission=dict(browse_projects=[dict(type='group', value='group-0')]))
+    assert not run_module('jira_permission_scheme', args).get('failed')
+    assert not run_module('jira_permission_scheme', args)['changed']
+
+    # Changed outside of Ansible while the responses are cached
+    scheme = next(s for s in stub.data.permission_schemes if s['name'] == 'Permission Scheme 1')
+    scheme['permissions'].append(dict(id=29999, permission='BROWSE_PROJECTS', holder=dict(type='group', parameter='group-1', value=group_id('group-1'))))
+
+    result = run_module('jira_permission_scheme', args)
+
+    assert result['changed']
+    assert result['revoked'] == [dict(permission='BROWSE_PROJECTS', type='group', value=group_id('group-1'))]
+    assert ('BROWSE_PROJECTS', 'group', group_id('group-1')) not in grants(stub, 'Permission Scheme 1')
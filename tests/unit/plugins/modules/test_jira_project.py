@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import run_module
+
+
+def test_delete_not_empty(stub):
+    result = run_module('jira_project', dict(key='P0002', state='absent'))
+
+    assert result['failed']
+    assert result['msg'] == 'The Project is not empty'
+    assert result['issues'] == ['ISSUE-0', 'ISSUE-1']
+    assert result['issue_count'] == 2
+    assert 'P0002' in stub.data.projects
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import run_module
+
+
+def test_role_read_past_index(stub, tmp_path):
+    args = dict(cache_path=str(tmp_path), name='Role 1', description='Role 1 description')
+    # The first run indexes the roles, the second caches the role by its id
+    for run in range(2):
+        assert not run_module('jira_project_role', args)['changed']
+
+    # Changed outside of Ansible while the role is indexed and cached
+    role = [r for r in stub.data.roles if r['name'] == 'Role 1'][0]
+    role['description'] = 'changed'
+
+    result = run_module('jira_project_role', args)
+
+    assert result['changed']
+    assert role['description'] == 'Role 1 description'
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.atlassian_stub import account_id
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import run_module
+
+ROLE = dict(project_key='P0100', role='Role 1')
+
+
+def test_absent_by_email(stub):
+    result = run_module('jira_project_role_actor', dict(ROLE, users=['user100@example.com'], state='absent'))
+
+    assert result['changed']
+    assert result['revoked'] == dict(groupId=[], user=[account_id(100)])
+    assert run_module('jira_project_role_actor', dict(ROLE, users=['User 100'], groups=['group-0']))['changed']
+
+
+def test_pure_keeps_requested(stub):
+    result = run_module('jira_project_role_actor', dict(ROLE, users=['user100@example.com', 'User 1'], state='pure'))
+
+    assert result['changed']
+    assert result['granted'] == dict(groupId=[], user=[account_id(1)])
+    assert account_id(100) not in result['revoked']['user']
+
+    result = run_module('jira_project_role_actor', dict(ROLE, users=['User 1', account_id(100)], state='pure'))
+
+    assert not result['changed'], result
+    assert sorted(result['current_users'].values()) == ['User 1', 'User 100']
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import run_module
+
+
+def test_settings_read_past_response_cache(stub, tmp_path):
+    args = dict(cache_path=str(tmp_path), settings={'jira.setting.1': 'value 1', 'jira.advanced.1': 'value 1'})
+    assert not run_module('jira_setting', args)['changed']
+
+    # Changed outside of Ansible while the responses are cached
+    stub.data.settings['jira.setting.1']['value'] = 'changed'
+    stub.data.advanced_settings['jira.advanced.1']['value'] = 'changed'
+
+    result = run_module('jira_setting', args)
+
+    assert result['changed']
+    assert stub.data.settings['jira.setting.1']['value'] == 'value 1'
+    assert stub.data.advanced_settings['jira.advanced.1']['value'] == 'value 1'
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""HTTP request budgets per module and scenario.
+
+Every request a module sends through AtlassianApi._cli is counted, retries
+included. A scenario fails once a module needs more requests than its
+budget, so lookups per item do not creep back in unnoticed. Lower a budget
+when a change saves requests.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from unittest import mock
+
+import pytest
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.transport import Transport
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import run_module
+
+# module, scenario, args, check mode, expected changed, request budget
+BUDGETS = [
+    ('jira_info', 'info', {}, False, False, 1),
+    ('jira_group_info', 'group', dict(name='group-1'), False, False, 1),
+    ('jira_project_role', 'create', dict(name='Budget', description='Budget role'), False, True, 2),
+    ('jira_project_role', 'noop', dict(name='Role 1', description='Role 1 description'), False, False, 2),
+    ('jira_project_role', 'update', dict(name='Role 1', description='Changed'), False, True, 3),
+    ('jira_project_role', 'delete', dict(name='Role 1', state='absent'), False, True, 3),
+    ('jira_project_role', 'check mode', dict(name='Budget', description='Budget role'), True, True, 1),
+    ('jira_project', 'create', dict(key='BUDGET', name='Budget', lead='User 1', permission_scheme='Permission Scheme 0',
+                                    notification_scheme='Notification Scheme 1'), False, True, 7),
+    ('jira_project', 'noop', dict(key='P0001', name='Project 1', lead='User 1'), False, False, 2),
+    ('jira_project', 'update', dict(key='P0001', name='Changed', lead='User 2'), False, True, 3),
+    ('jira_project', 'delete', dict(key='P0003', state='absent'), False, True, 3),
+    ('jira_project', 'check mode', dict(key='P0001', name='Changed', lead='User 2'), True, True, 2),
+    ('jira_project', 'items', dict(lead='User 1', permission_scheme='Permission Scheme 0', items=[dict(key=f"ITEM{i}", name=f"Item {i}") for i in range(5)]),
+     False, True, 16),
+    ('jira_project_role_actor', 'create', dict(project_key='P0100', role='Role 1', users=['User 1', 'User 2'], groups=['group-1', 'group-2']),
+     False, True, 6),
+    ('jira_project_role_actor', 'noop', dict(project_key='P0100', role='Role 1', users=['User 100'], groups=['group-0']), False, False, 4),
+    ('jira_project_role_actor', 'update', dict(project_key='P0100', role='Role 1', users=['User 1'], groups=['group-0'], state='pure'),
+     False, True, 6),
+    ('jira_project_role_actor', 'delete', dict(project_key='P0100', role='Role 1', users=['User 100'], groups=['group-0'], state='absent'),
+     False, True, 5),
+    ('jira_project_role_actor', 'batch', dict(items=[dict(project_key=f"P01{p:02d}", role=f"Role {r}", users=['User 1', 'User 2'], groups=['group-1'])
+                                                     for p in range(10) for r in range(3)]), False, True, 64),
+    ('jira_project_role_actor', 'check mode', dict(project_key='P0100', role='Role 1', users=['User 1', 'User 2'], groups=['group-1']),
+     True, True, 5),
+    ('jira_permission_scheme', 'create', dict(name='Budget', description='Budget'), False, True, 2),
+    ('jira_permission_scheme', 'noop', dict(name='Permission Scheme 1', description='Scheme 1'), False, False, 2),
+    ('jira_permission_scheme', 'update', dict(name='Permission Scheme 1', description='Changed'), False, True, 3),
+    ('jira_permission_scheme', 'delete', dict(name='Permission Scheme 1', state='absent'), False, True, 3),
+    ('jira_permission_scheme', 'check mode', dict(name='Budget', description='Budget'), True, True, 1),
+    ('jira_permission_scheme', 'grants noop', dict(name='Permission Scheme 0', permission=dict(
+        browse_projects=[dict(type='group', value=f"group-{j}") for j in range(0, 300, 4)])), False, False, 4),
+    ('jira_permission_scheme', 'grant', dict(name='Permission Scheme 0', permission=dict(
+        browse_projects=[dict(type='group', value=f"group-{j}") for j in list(range(0, 300, 4)) + [1]])), False, True, 5),
+    ('jira_permission_scheme', 'replace grants', dict(name='Permission Scheme 0', permission=dict(
+        browse_projects=[dict(type='group', value='group-0')], create_issues=[dict(type='reporter')])), False, True, 4),
+    ('jira_permission_scheme', 'create with grants', dict(name='Budget', description='Budget', permission=dict(
+        browse_projects=[dict(type='group', value='group-0')], administer_projects=[dict(type='projectRole', value='Role 1')])), False, True, 4),
+    ('jira_setting', 'noop', dict(settings={'jira.setting.1': 'value 1', 'jira.setting.2': 'value 2'}), False, False, 2),
+    ('jira_setting', 'update', dict(settings={'jira.setting.1': 'new 1', 'jira.setting.2': 'new 2'}), False, True, 4),
+    ('jira_setting', 'reset', dict(settings={'jira.setting.1': None, 'jira.advanced.1': None}), False, True, 4),
+    ('jira_setting', 'baseline', dict(settings=dict({f"jira.setting.{i}": f"value {i}" for i in range(60)}, **{'jira.setting.7': 'new 7'})),
+     False, True, 3),
+    ('jira_setting', 'check mode', dict(settings={'jira.setting.1': 'new 1', 'jira.setting.2': 'new 2'}), True, True, 2),
+    ('confluence_space', 'create', dict(key='BUDGET', name='Budget', description='Budget'), False, True, 2),
+    ('confluence_space', 'noop', dict(key='SP1', name='Space 1', description='Space 1 description'), False, False, 1),
+    ('confluence_space', 'update', dict(key='SP1', name='Changed'), False, True, 2),
+    ('confluence_space', 'delete', dict(key='SP2', state='absent'), False, True, 3),
+    ('confluence_space', 'check mode', dict(key='SP1', name='Changed'), True, True, 1),
+    ('confluence_space_permission', 'create', dict(key='SP0', group='group-100', permission=dict(page=['create', 'delete'])), False, True, 6),
+    ('confluence_space_permission', 'noop', dict(key='SP0', group='group-0', permission=dict(space=['read'])), False, False, 4),
+    ('confluence_space_permission', 'update', dict(key='SP0', group='group-0', state='pure', permission=dict(space=['read'])), False, True, 17),
+    ('confluence_space_permission', 'check mode', dict(key='SP0', group='group-0', state='pure', permission=dict(space=['read'])), True, True, 4),
+    ('confluence_space_permission', 'many subjects', dict(key='SP0', users=['User 1', 'User 2'], groups=['group-100', 'group-101'],
+                                                          permission=dict(page=['create'])), False, True, 11),
+    ('bitbucket_group', 'create', dict(name='bb-budget'), False, True, 2),
+    ('bitbucket_group', 'noop', dict(name='bb-group-1'), False, False, 1),
+    ('bitbucket_group', 'delete', dict(name='bb-group-1', state='absent'), False, True, 2),
+    ('bitbucket_project', 'create', dict(key='BUDGET', name='Budget'), False, True, 2),
+    ('bitbucket_project', 'noop', dict(key='BP1', name='Bitbucket Project 1', group_permission=dict(add=[dict(group='bb-group-1', permission='read')])),
+     False, False, 2),
+    ('bitbucket_project', 'update', dict(key='BP1', name='Changed', group_permission=dict(set=[dict(group='bb-group-1', permission='write')])),
+     False, True, 8),
+    ('bitbucket_project', 'delete', dict(key='BP1', state='absent'), False, True, 2),
+    ('bitbucket_project', 'check mode', dict(key='BP1', name='Changed'), True, True, 1),
+]
+
+
+@pytest.fixture
+def api_requests(stub):
+    """List of every request sent through AtlassianApi._cli."""
+    sent = []
+    request = Transport.request
+
+    def counted(self, method, url, **kwargs):
+        sent.append(f"{method} {url}")
+        return request(self, method, url, **kwargs)
+
+    with mock.patch.object(Transport, 'request', counted):
+        yield sent
+
+
+@pytest.mark.parametrize('module,scenario,args,check_mode,changed,budget', BUDGETS, ids=[f"{b[0]}-{b[1]}" for b in BUDGETS])
+def test_request_budget(api_requests, module, scenario, args, check_mode, changed, budget):
+    result = run_module(module, args, check_mode)
+
+    assert not result.get('failed'), result.get('msg')
+    assert result['changed'] == changed
+    assert len(api_requests) <= budget, '\n'.join([f"{module} {scenario} sent {len(api_requests)} requests, budget is {budget}:"] + api_requests)
+
+
+# module, scenario, args, request budget once the resolver index is persisted
+WARM_BUDGETS = [
+    ('jira_project', 'create', dict(key='BUDGET', name='Budget', lead='User 1', permission_scheme='Permission Scheme 0',
+                                    notification_scheme='Notification Scheme 1'), 3),
+    ('jira_project_role_actor', 'noop', dict(project_key='P0100', role='Role 1', users=['User 100'], groups=['group-0']), 3),
+    ('jira_permission_scheme', 'noop', dict(name='Permission Scheme 1', description='Scheme 1'), 1),
+]
+
+
+@pytest.mark.parametrize('module,scenario,args,budget', WARM_BUDGETS, ids=[f"{b[0]}-{b[1]}" for b in WARM_BUDGETS])
+def test_request_budget_warm_index(api_requests, tmp_path, module, scenario, args, budget):
+    args = dict(args, cache_path=str(tmp_path))
+    run_module(module, dict(args, state='absent') if module == 'jira_project' else args, True)
+    api_requests.clear()
+
+    result = run_module(module, args)
+
+    assert not result.get('failed'), result.get('msg')
+    assert len(api_requests) <= budget, '\n'.join([f"{module} {scenario} sent {len(api_requests)} requests, budget is {budget}:"] + api_requests)
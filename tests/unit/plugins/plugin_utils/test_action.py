@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from unittest import mock
+
+import pytest
+
+from ansible_collections.scsitteam.atlassian.plugins.action.jira_project_role import ActionModule
+from ansible_collections.scsitteam.atlassian.tests.unit.utils.module_runner import DEFAULT_ARGS
+
+
+def action(args, check_mode=False, diff=False, transport='local'):
+    """The jira_project_role action plugin for a task with args."""
+    task = mock.MagicMock(args=dict(DEFAULT_ARGS, **args), check_mode=check_mode, diff=diff, no_log=False, environment=None, async_val=0)
+    connection = mock.MagicMock(transport=transport, socket_path=None, become=None)
+    connection._shell.tmpdir = None
+    connection._shell.get_option.return_value = '~/.ansible/tmp'
+    play_context = mock.MagicMock(become=False, executable='/bin/sh')
+    templar = mock.MagicMock()
+    templar.template.side_effect = lambda value: value
+    return ActionModule(task, connection, play_context, loader=mock.MagicMock(), templar=templar)
+
+
+def run(plugin):
+    return plugin._execute_in_process('scsitteam.atlassian.jira_project_role', {})
+
+
+def roles(stub):
+    return {r['name']: r['description'] for r in stub.data.roles}
+
+
+def test_result(stub):
+    result = run(action(dict(name='New', description='New role')))
+
+    assert not result.get('failed'), result.get('msg')
+    assert result['changed']
+    assert result['invocation']['module_args']['atlassian_password'] == 'VALUE_SPECIFIED_IN_NO_LOG_PARAMETER'
+    assert roles(stub)['New'] == 'New role'
+
+
+def test_check_mode(stub):
+    result = run(action(dict(name='New', description='New role'), check_mode=True))
+
+    assert result['changed']
+    assert 'New' not in roles(stub)
+
+
+def test_diff(stub):
+    result = run(action(dict(name='Role 1', description='Changed'), diff=True))
+
+    assert result['diff']['before']['description'] == 'Role 1 description'
+    assert result['diff']['after']['description'] == 'Changed'
+    assert 'diff' not in run(action(dict(name='Role 2', description='Changed')))
+
+
+def test_fail_json(stub):
+    result = run(action(dict(name='New')))
+
+    assert result['failed']
+    assert result['msg'] == 'state is present but any of the following are missing: description'
+    assert 'New' not in roles(stub)
+
+
+def test_exception(stub):
+    with mock.patch('ansible_collections.scsitteam.atlassian.plugins.modules.jira_project_role.process', side_effect=KeyError('id')):
+        result = run(action(dict(name='Role 1', description='Changed')))
+
+    assert result['failed']
+    assert result['msg'] == "Module scsitteam.atlassian.jira_project_role failed: 'id'"
+    assert 'KeyError' in result['exception']
+
+
+@pytest.mark.parametrize('transport,task_vars,in_process', [
+    ('local', {}, True),
+    ('local', dict(atlassian_in_process='no'), False),
+    ('ssh', {}, False),
+])
+def test_in_process(transport, task_vars, in_process):
+    assert action({}, transport=transport)._in_process('scsitteam.atlassian.jira_project_role', task_vars) == in_process
@@ -0,0 +1,725 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""In-process fake of the Jira, Confluence and Bitbucket Cloud APIs.
+
+The stub serves the endpoints the collection uses from a deterministic data
+set of configurable size, keeps the changes modules make until reset() and
+records every request it answered. A latency in seconds can be injected
+into every response to emulate a remote Cloud instance, and error
+responses into single requests with inject(). GET responses carry an ETag
+and are answered with 304 if the client sends it back.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import hashlib
+import json
+import re
+import threading
+import time
+import uuid
+
+from copy import deepcopy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+BITBUCKET = 'https://api.bitbucket.org'
+
+
+def account_id(idx):
+    return f"{idx:024x}"
+
+
+def group_id(name):
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, name))
+
+
+class StubData(object):
+    """Deterministic data set of a Cloud site."""
+
+    def __init__(self, projects=5000, users=50000, groups=500, grants=300, spaces=500, roles=10,
+                 notification_schemes=120, settings=60, bitbucket_projects=200, bitbucket_groups=50):
+        self.size = dict(projects=projects, users=users, groups=groups, grants=grants, spaces=spaces,
+                         bitbucket_groups=bitbucket_groups)
+
+        self.roles = [dict(id=10000 + i, name=f"Role {i}", description=f"Role {i} description") for i in range(roles)]
+        self.projects = {
+            f"P{i:04d}": dict(id=str(10000 + i), key=f"P{i:04d}", name=f"Project {i}", description=f"Project {i} description",
+                              lead=dict(accountId=account_id(i % users)), issues=i % 3)
+            for i in range(projects)
+        }
+        self.actors = {}
+        self.groups = [f"group-{i}" for i in range(groups)]
+
+        operations = [('read', 'space'), ('delete', 'space'), ('export', 'space'), ('administer', 'space'),
+                      ('restrict_content', 'space'), ('create', 'page'), ('delete', 'page'), ('archive', 'page'),
+                      ('create', 'blogpost'), ('delete', 'blogpost'), ('create', 'comment'), ('delete', 'comment'),
+                      ('create', 'attachment'), ('delete', 'attachment')]
+        self.permission_schemes = [
+            dict(id=10000 + i, name=f"Permission Scheme {i}", description=f"Scheme {i}", permissions=[
+                dict(id=20000 + j, permission=['BROWSE_PROJECTS', 'CREATE_ISSUES', 'EDIT_ISSUES', 'ADMINISTER_PROJECTS'][j % 4],
+                     holder=dict(type='group', parameter=f"group-{j}", value=group_id(f"group-{j}")))
+                for j in range(grants if i == 0 else 10)
+            ])
+            for i in range(20)
+        ]
+        self.notification_schemes = [dict(id=10000 + i, name=f"Notification Scheme {i}") for i in range(notification_schemes)]
+        self.settings = {
+            f"jira.setting.{i}": dict(id=f"jira.setting.{i}", key=f"jira.setting.{i}", value=f"value {i}",
+                                      defaultValue=f"default {i}", name=f"Setting {i}", type='string')
+            for i in range(settings)
+        }
+        self.advanced_settings = {
+            f"jira.advanced.{i}": dict(id=f"jira.advanced.{i}", key=f"jira.advanced.{i}", value=f"value {i}",
+                                       defaultValue=f"default {i}", name=f"Advanced {i}", type='string')
+            for i in range(10)
+        }
+
+        self.spaces = {
+            f"SP{i}": dict(id=str(100000 + i), key=f"SP{i}", name=f"Space {i}",
+                           description=dict(plain=dict(value=f"Space {i} description", representation='plain')),
+                           pages=i % 2)
+            for i in range(spaces)
+        }
+        self.space_permissions = {}
+        for key in list(self.spaces)[:5]:
+            self.space_permissions[key] = [
+                dict(id=300000 + j, operation=dict(operation=operations[j % len(operations)][0],
+                                                   targetType=operations[j % len(operations)][1]),
+                     subject=('group', f"group-{j // len(operations)}"))
+                for j in range(grants)
+            ]
+
+        self.bitbucket_projects = {
+            f"BP{i}": dict(key=f"BP{i}", name=f"Bitbucket Project {i}", description=f"Bitbucket Project {i}",
+                           is_private=True, groups={f"bb-group-{j}": 'read' for j in range(bitbucket_groups if i == 0 else 5)})
+            for i in range(bitbucket_projects)
+        }
+        self.bitbucket_groups = [f"bb-group-{i}" for i in range(bitbucket_groups)]
+
+    def user(self, idx):
+        return dict(accountId=account_id(idx), displayName=f"User {idx}", emailAddress=f"user{idx}@example.com", active=True)
+
+    def user_index(self, value):
+        match = re.match(r'^(?:User |user)(\d+)(?:@example\.com)?$', value)
+        if match and int(match.group(1)) < self.size['users']:
+            return int(match.group(1))
+        if re.match(r'^[0-9a-f]{24}$', value) and int(value, 16) < self.size['users']:
+            return int(value, 16)
+        return None
+
+    def group(self, name):
+        if name not in self.groups:
+            return None
+        return dict(name=name, groupId=group_id(name))
+
+
+class AtlassianStub(object):
+    """HTTP server answering like a Cloud site with the given StubData."""
+
+    def __init__(self, latency=0.0, **size):
+        self.latency = latency
+        self.size = size
+        self.requests = []
+        self._lock = threading.Lock()
+        self.reset()
+        self.routes = [(method, re.compile(f"^{pattern}$"), handler) for method, pattern, handler in (
+            # Jira
+            ('GET', r'/rest/api/3/serverInfo', self.jira_server_info),
+            ('GET', r'/rest/api/2/role', self.jira_roles),
+            ('POST', r'/rest/api/2/role', self.jira_role_create),
+            ('GET', r'/rest/api/2/role/(\d+)', self.jira_role),
+            ('POST', r'/rest/api/2/role/(\d+)', self.jira_role_update),
+            ('DELETE', r'/rest/api/2/role/(\d+)', self.jira_role_delete),
+            ('GET', r'/rest/api/3/project/search', self.jira_project_search),
+            ('POST', r'/rest/api/2/project', self.jira_project_create),
+            ('GET', r'/rest/api/2/project/([^/]+)', self.jira_project),
+            ('PUT', r'/rest/api/2/project/([^/]+)', self.jira_project_update),
+            ('DELETE', r'/rest/api/2/project/([^/]+)', self.jira_project_delete),
+            ('GET', r'/rest/api/2/project/([^/]+)/role', self.jira_project_roles),
+            ('GET', r'/rest/api/2/project/([^/]+)/role/(\d+)', self.jira_project_role),
+            ('POST', r'/rest/api/2/project/([^/]+)/role/(\d+)', self.jira_project_role_add),
+            ('DELETE', r'/rest/api/2/project/([^/]+)/role/(\d+)', self.jira_project_role_remove),
+            ('GET', r'/rest/api/3/user/search', self.jira_user_search),
+            ('GET', r'/rest/api/3/user/bulk', self.jira_user_bulk),
+            ('GET', r'/rest/api/2/group/bulk', self.jira_group_bulk),
+            ('GET', r'/rest/api/2/groups/picker', self.jira_group_picker),
+            ('GET', r'/rest/api/2/group/member', self.jira_group_member),
+            ('GET', r'/rest/api/3/permissionscheme', self.jira_permission_schemes),
+            ('POST', r'/rest/api/3/permissionscheme', self.jira_permission_scheme_create),
+            ('GET', r'/rest/api/3/permissionscheme/(\d+)', self.jira_permission_scheme),
+            ('PUT', r'/rest/api/3/permissionscheme/(\d+)', self.jira_permission_scheme_update),
+            ('DELETE', r'/rest/api/3/permissionscheme/(\d+)', self.jira_permission_scheme_delete),
+            ('POST', r'/rest/api/3/permissionscheme/(\d+)/permission', self.jira_permission_grant_create),
+            ('DELETE', r'/rest/api/3/permissionscheme/(\d+)/permission/(\d+)', self.jira_permission_grant_delete),
+            ('GET', r'/rest/api/3/notificationscheme', self.jira_notification_schemes),
+            ('GET', r'/rest/api/3/search/jql', self.jira_search),
+            ('GET', r'/rest/api/2/search', self.jira_search),
+            ('POST', r'/rest/api/3/search/approximate-count', self.jira_approximate_count),
+            ('GET', r'/rest/api/3/application-properties', self.jira_settings),
+            ('GET', r'/rest/api/3/application-properties/advanced-settings', self.jira_advanced_settings),
+            ('PUT', r'/rest/api/3/application-properties/([^/]+)', self.jira_setting_update),
+            # Confluence
+            ('GET', r'/wiki/api/v2/spaces', self.confluence_spaces),
+            ('GET', r'/wiki/api/v2/spaces/(\d+)/pages', self.confluence_pages),
+            ('GET', r'/wiki/api/v2/spaces/(\d+)/permissions', self.confluence_space_permissions_v2),
+            ('GET', r'/wiki/rest/api/search', self.confluence_search),
+            ('POST', r'/wiki/rest/api/space', self.confluence_space_create),
+            ('GET', r'/wiki/rest/api/space/([^/]+)', self.confluence_space),
+            ('PUT', r'/wiki/rest/api/space/([^/]+)', self.confluence_space_update),
+            ('DELETE', r'/wiki/rest/api/space/([^/]+)', self.confluence_space_delete),
+            ('POST', r'/wiki/rest/api/space/([^/]+)/permission', self.confluence_permission_create),
+            ('DELETE', r'/wiki/rest/api/space/([^/]+)/permission/(\d+)', self.confluence_permission_delete),
+            ('GET', r'/wiki/rest/api/group/by-name', self.confluence_group),
+            ('GET', r'/wiki/rest/api/search/user', self.confluence_user_search),
+            # Bitbucket
+            ('GET', r'/2\.0/workspaces/[^/]+/projects', self.bitbucket_project_list),
+            ('POST', r'/2\.0/workspaces/[^/]+/projects', self.bitbucket_project_create),
+            ('GET', r'/2\.0/workspaces/[^/]+/projects/([^/]+)', self.bitbucket_project),
+            ('PUT', r'/2\.0/workspaces/[^/]+/projects/([^/]+)', self.bitbucket_project_update),
+            ('DELETE', r'/2\.0/workspaces/[^/]+/projects/([^/]+)', self.bitbucket_project_delete),
+            ('GET', r'/2\.0/workspaces/([^/]+)/projects/([^/]+)/permissions-config/groups', self.bitbucket_group_permissions),
+            ('PUT', r'/2\.0/workspaces/[^/]+/projects/([^/]+)/permissions-config/groups/([^/]+)', self.bitbucket_group_permission_set),
+            ('DELETE', r'/2\.0/workspaces/[^/]+/projects/([^/]+)/permissions-config/groups/([^/]+)', self.bitbucket_group_permission_delete),
+            ('GET', r'/1\.0/groups/[^/]+/', self.bitbucket_groups),
+            ('POST', r'/1\.0/groups/[^/]+/', self.bitbucket_group_create),
+            ('DELETE', r'/1\.0/groups/[^/]+/([^/]+)', self.bitbucket_group_delete),
+        )]
+        self.server = None
+
+    def reset(self):
+        """Restore the seeded data set and forget all recorded requests."""
+        self.data = StubData(**self.size)
+        self.requests = []
+        self.faults = []
+
+    # Server
+
+    def start(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def handle_request(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                status, body, headers = stub.handle(self.command, self.path, self.headers, self.rfile.read(length) if length else b'')
+                data = b'' if body is None else json.dumps(body).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = handle_request
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    def handle(self, method, path, headers, body):
+        url = urlsplit(path)
+        query = parse_qs(url.query)
+        with self._lock:
+            self.requests.append((method, path))
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self._lock:
+            fault = next((f for f in self.faults if f['method'] == method and f['pattern'].match(url.path)), None)
+            if fault is not None:
+                fault['times'] -= 1
+                if not fault['times']:
+                    self.faults.remove(fault)
+                body = None if fault['status'] in (204, 304) else dict(errorMessages=[f"Injected {fault['status']}"])
+                return fault['status'], body, dict(fault['headers'])
+
+        if body:
+            try:
+                body = json.loads(body)
+            except ValueError:
+                body = parse_qs(body.decode())
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(url.path)
+            if route_method == method and match:
+                with self._lock:
+                    result = handler(query, body, *match.groups())
+                if not isinstance(result, tuple):
+                    result = (200, result)
+                if len(result) == 2:
+                    result = result + ({},)
+                if method == 'GET' and result[0] == 200:
+                    return self._conditional(result, headers)
+                return result
+        return 404, dict(errorMessages=[f"No stub for {method} {url.path}"]), {}
+
+    # Helpers
+
+    @staticmethod
+    def _conditional(result, headers):
+        """Tag a response with an ETag, answer 304 if the client has it already."""
+        status, body, response_headers = result
+        etag = '"' + hashlib.sha1(json.dumps(body, sort_keys=True).encode()).hexdigest() + '"'
+        if headers.get('If-None-Match') == etag:
+            return 304, None, dict(ETag=etag)
+        return status, body, dict(response_headers, ETag=etag)
+
+    def inject(self, method, pattern, status, headers=None, times=1):
+        """Answer the next times requests to paths matching pattern with status instead."""
+        with self._lock:
+            self.faults.append(dict(method=method, pattern=re.compile(f"^{pattern}$"), status=status, headers=headers or {}, times=times))
+
+    def request_count(self, method=None):
+        return len([r for r in self.requests if method is None or r[0] == method])
+
+    @staticmethod
+    def _int(query, name, default):
+        return int(query.get(name, [default])[0])
+
+    def _offset_page(self, query, values, max_results=50):
+        start = self._int(query, 'startAt', 0)
+        size = min(self._int(query, 'maxResults', max_results), max_results)
+        page = values[start:start + size]
+        return dict(startAt=start, maxResults=size, total=len(values), isLast=start + size >= len(values), values=page)
+
+    # Jira
+
+    def jira_server_info(self, query, body):
+        return dict(baseUrl='https://stub.atlassian.net', version='1001.0.0', versionNumbers=[1001, 0, 0],
+                    deploymentType='Cloud', buildNumber=100000, serverTitle='Stub')
+
+    def jira_roles(self, query, body):
+        return deepcopy(self.data.roles)
+
+    def jira_role(self, query, body, role_id):
+        return next((deepcopy(r) for r in self.data.roles if r['id'] == int(role_id)), None) or (404, None)
+
+    def jira_role_create(self, query, body):
+        role = dict(id=max([r['id'] for r in self.data.roles] + [10000]) + 1, name=body['name'], description=body.get('description'))
+        self.data.roles.append(role)
+        return deepcopy(role)
+
+    def jira_role_update(self, query, body, role_id):
+        for role in self.data.roles:
+            if role['id'] == int(role_id):
+                role.update(body)
+                return deepcopy(role)
+        return 404, None
+
+    def jira_role_delete(self, query, body, role_id):
+        self.data.roles = [r for r in self.data.roles if r['id'] != int(role_id)]
+        return 204, None
+
+    def _project(self, key):
+        return self.data.projects.get(key) or next((p for p in self.data.projects.values() if p['id'] == key), None)
+
+    def jira_project_search(self, query, body):
+        projects = [dict(id=p['id'], key=p['key'], name=p['name']) for p in self.data.projects.values()]
+        return self._offset_page(query, projects)
+
+    def jira_project(self, query, body, key):
+        project = self._project(key)
+        if project is None:
+            return 404, dict(errorMessages=['No project could be found'])
+        project = {k: v for k, v in project.items() if k != 'issues'}
+        return deepcopy(project)
+
+    def jira_project_create(self, query, body):
+        project = dict(id=str(20000 + len(self.data.projects)), key=body['key'], name=body['name'], description=body.get('description') or '',
+                       lead=dict(accountId=body['leadAccountId']), issues=0)
+        self.data.projects[body['key']] = project
+        return 201, dict(id=int(project['id']), key=project['key'])
+
+    def jira_project_update(self, query, body, key):
+        project = self._project(key)
+        if 'leadAccountId' in body:
+            project['lead'] = dict(accountId=body.pop('leadAccountId'))
+        project.update(body)
+        return {k: v for k, v in project.items() if k != 'issues'}
+
+    def jira_project_delete(self, query, body, key):
+        project = self._project(key)
+        del self.data.projects[project['key']]
+        return 204, None
+
+    def _actors(self, key, role_id):
+        project = self._project(key)
+        if (project['key'], role_id) not in self.data.actors:
+            idx = int(project['id']) - 10000
+            self.data.actors[(project['key'], role_id)] = [
+                dict(id=1, type='atlassian-user-role-actor', displayName=f"User {idx}", actorUser=dict(accountId=account_id(idx))),
+                dict(id=2, type='atlassian-group-role-actor', name=f"group-{idx % 100}", displayName=f"group-{idx % 100}",
+                     actorGroup=dict(name=f"group-{idx % 100}", groupId=group_id(f"group-{idx % 100}"))),
+            ]
+        return self.data.actors[(project['key'], role_id)]
+
+    def jira_project_roles(self, query, body, key):
+        project = self._project(key)
+        if project is None:
+            return 404, None
+        return {r['name']: f"https://stub.atlassian.net/rest/api/2/project/{project['id']}/role/{r['id']}" for r in self.data.roles}
+
+    def jira_project_role(self, query, body, key, role_id):
+        role = next((r for r in self.data.roles if r['id'] == int(role_id)), None)
+        if self._project(key) is None or role is None:
+            return 404, None
+        return dict(deepcopy(role), actors=deepcopy(self._actors(key, int(role_id))))
+
+    def jira_project_role_add(self, query, body, key, role_id):
+        actors = self._actors(key, int(role_id))
+        for account in body.get('user') or []:
+            idx = self.data.user_index(account)
+            actors.append(dict(id=len(actors) + 1, type='atlassian-user-role-actor', displayName=f"User {idx}",
+                               actorUser=dict(accountId=account)))
+        for gid in body.get('groupId') or []:
+            name = next(g for g in self.data.groups if group_id(g) == gid)
+            actors.append(dict(id=len(actors) + 1, type='atlassian-group-role-actor', name=name, displayName=name,
+                               actorGroup=dict(name=name, groupId=gid)))
+        return self.jira_project_role(query, body, key, role_id)
+
+    def jira_project_role_remove(self, query, body, key, role_id):
+        users = set(query.get('user', []))
+        groups = set(query.get('groupId', []))
+        self.data.actors[(self._project(key)['key'], int(role_id))] = [
+            a for a in self._actors(key, int(role_id))
+            if a.get('actorUser', {}).get('accountId') not in users and a.get('actorGroup', {}).get('groupId') not in groups
+        ]
+        return 204, None
+
+    def jira_user_search(self, query, body):
+        # Prefix match on display name and email like the real search, "User 1" finds "User 10" as well
+        term = query.get('query', [''])[0]
+        number = re.match(r'^(?:User |user)(\d+)$', term)
+        if number:
+            found = [i for i in range(self.data.size['users']) if str(i).startswith(number.group(1))]
+        else:
+            found = [i for i in [self.data.user_index(term)] if i is not None]
+        start = self._int(query, 'startAt', 0)
+        return [self.data.user(i) for i in found[start:start + self._int(query, 'maxResults', 50)]]
+
+    def jira_user_bulk(self, query, body):
+        users = [self.data.user(self.data.user_index(a)) for a in query.get('accountId', []) if self.data.user_index(a) is not None]
+        return self._offset_page(query, users, 200)
+
+    def jira_group_bulk(self, query, body):
+        groups = [self.data.group(g) for g in query.get('groupName', []) if self.data.group(g)]
+        groups += [self.data.group(g) for g in self.data.groups if group_id(g) in query.get('groupId', [])]
+        return self._offset_page(query, groups)
+
+    def jira_group_picker(self, query, body):
+        name = query.get('query', [''])[0]
+        groups = [self.data.group(g) for g in self.data.groups if g.startswith(name)][:20]
+        return dict(header=f"Showing {len(groups)} matching groups", total=len(groups), groups=groups)
+
+    def jira_group_member(self, query, body):
+        name = query.get('groupname', [''])[0]
+        if name not in self.data.groups:
+            return 404, None
+        idx = self.data.groups.index(name)
+        members = 1000 if idx == 0 else 10
+        start = self._int(query, 'startAt', 0)
+        size = min(self._int(query, 'maxResults', 50), 50)
+        values = [self.data.user((idx * 10 + i) % self.data.size['users']) for i in range(start, min(start + size, members))]
+        return dict(startAt=start, maxResults=size, total=members, isLast=start + size >= members, values=values)
+
+    def _scheme(self, scheme_id):
+        return next((s for s in self.data.permission_schemes if s['id'] == int(scheme_id)), None)
+
+    def _scheme_view(self, scheme, query):
+        expand = query.get('expand', [''])[0].split(',')
+        view = {k: v for k, v in scheme.items() if k != 'permissions'}
+        if 'permissions' in expand or 'all' in expand:
+            view['permissions'] = deepcopy(scheme['permissions'])
+            if 'group' in expand:
+                for grant in view['permissions']:
+                    if grant['holder']['type'] == 'group':
+                        grant['holder']['group'] = dict(name=grant['holder']['parameter'], groupId=grant['holder']['value'])
+        return view
+
+    def jira_permission_schemes(self, query, body):
+        return dict(permissionSchemes=[self._scheme_view(s, query) for s in self.data.permission_schemes])
+
+    def jira_permission_scheme(self, query, body, scheme_id):
+        scheme = self._scheme(scheme_id)
+        return (404, None) if scheme is None else self._scheme_view(scheme, query)
+
+    def _grants(self, grants):
+        ids = [g['id'] for s in self.data.permission_schemes for g in s['permissions']] + [20000]
+        result = []
+        for idx, grant in enumerate(grants or []):
+            grant = deepcopy(grant)
+            grant['id'] = max(ids) + 1 + idx
+            if grant['holder']['type'] == 'group' and 'value' not in grant['holder']:
+                grant['holder']['value'] = group_id(grant['holder']['parameter'])
+            if grant['holder']['type'] == 'group' and 'parameter' not in grant['holder']:
+                grant['holder']['parameter'] = next((g for g in self.data.groups if group_id(g) == grant['holder']['value']), None)
+            result.append(grant)
+        return result
+
+    def jira_permission_scheme_create(self, query, body):
+        scheme = dict(id=max(s['id'] for s in self.data.permission_schemes) + 1, name=body['name'],
+                      description=body.get('description'), permissions=self._grants(body.get('permissions')))
+        self.data.permission_schemes.append(scheme)
+        return 201, self._scheme_view(scheme, query)
+
+    def jira_permission_scheme_update(self, query, body, scheme_id):
+        scheme = self._scheme(scheme_id)
+        scheme['name'] = body.get('name', scheme['name'])
+        scheme['description'] = body.get('description', scheme['description'])
+        if 'permissions' in body:
+            scheme['permissions'] = self._grants(body['permissions'])
+        return self._scheme_view(scheme, query)
+
+    def jira_permission_scheme_delete(self, query, body, scheme_id):
+        self.data.permission_schemes.remove(self._scheme(scheme_id))
+        return 204, None
+
+    def jira_permission_grant_create(self, query, body, scheme_id):
+        grant = self._grants([body])[0]
+        self._scheme(scheme_id)['permissions'].append(grant)
+        return 201, deepcopy(grant)
+
+    def jira_permission_grant_delete(self, query, body, scheme_id, grant_id):
+        scheme = self._scheme(scheme_id)
+        scheme['permissions'] = [g for g in scheme['permissions'] if g['id'] != int(grant_id)]
+        return 204, None
+
+    def jira_notification_schemes(self, query, body):
+        return self._offset_page(query, deepcopy(self.data.notification_schemes))
+
+    def _jql_project(self, query, body):
+        jql = (body or {}).get('jql') or query.get('jql', [''])[0]
+        match = re.search(r'project\s*=\s*"?(\w+)"?', jql)
+        project = self._project(match.group(1)) if match else None
+        return project['issues'] if project else 0
+
+    def jira_search(self, query, body):
+        total = self._jql_project(query, body)
+        size = min(self._int(query, 'maxResults', 50), total)
+        issues = [dict(id=str(i), key=f"ISSUE-{i}") for i in range(size)]
+        return dict(startAt=0, maxResults=self._int(query, 'maxResults', 50), total=total, issues=issues)
+
+    def jira_approximate_count(self, query, body):
+        return dict(count=self._jql_project(query, body))
+
+    def jira_settings(self, query, body):
+        if 'key' in query:
+            setting = self.data.settings.get(query['key'][0]) or self.data.advanced_settings.get(query['key'][0])
+            return (404, None) if setting is None else [deepcopy(setting)]
+        return deepcopy(list(self.data.settings.values()))
+
+    def jira_advanced_settings(self, query, body):
+        return deepcopy(list(self.data.advanced_settings.values()))
+
+    def jira_setting_update(self, query, body, key):
+        setting = self.data.settings.get(key) or self.data.advanced_settings.get(key)
+        if setting is None:
+            return 404, None
+        setting['value'] = body['value']
+        return dict(id=key, value=body['value'])
+
+    # Confluence
+
+    def _space_view(self, space):
+        return {k: deepcopy(v) for k, v in space.items() if k != 'pages'}
+
+    def confluence_spaces(self, query, body):
+        keys = ','.join(query.get('keys', [])).split(',') if 'keys' in query else None
+        spaces = [self._space_view(s) for k, s in self.data.spaces.items() if keys is None or k in keys]
+        limit = self._int(query, 'limit', 25)
+        start = self._int(query, 'cursor', 0)
+        links = {}
+        if start + limit < len(spaces):
+            links['next'] = f"/wiki/api/v2/spaces?cursor={start + limit}&limit={limit}"
+        return dict(results=spaces[start:start + limit], _links=links)
+
+    def _space_by_id(self, space_id):
+        return next((s for s in self.data.spaces.values() if s['id'] == space_id), None)
+
+    def confluence_pages(self, query, body, space_id):
+        space = self._space_by_id(space_id)
+        if space is None:
+            return 404, None
+        limit = self._int(query, 'limit', 25)
+        return dict(results=[dict(id=str(i), title=f"Page {i}") for i in range(min(space['pages'], limit))], _links={})
+
+    def _principal(self, subject):
+        kind, name = subject
+        if kind == 'group':
+            return dict(type='group', id=group_id(name))
+        return dict(type='user', id=account_id(self.data.user_index(name)))
+
+    def confluence_space_permissions_v2(self, query, body, space_id):
+        space = self._space_by_id(space_id)
+        if space is None:
+            return 404, None
+        permissions = [
+            dict(id=str(p['id']), principal=self._principal(p['subject']),
+                 operation=dict(key=p['operation']['operation'], targetType=p['operation']['targetType']))
+            for p in self.data.space_permissions.get(space['key'], [])
+        ]
+        limit = self._int(query, 'limit', 25)
+        start = self._int(query, 'cursor', 0)
+        links = {}
+        if start + limit < len(permissions):
+            links['next'] = f"/wiki/api/v2/spaces/{space_id}/permissions?cursor={start + limit}&limit={limit}"
+        return dict(results=permissions[start:start + limit], _links=links)
+
+    def confluence_search(self, query, body):
+        match = re.search(r'space="?(\w+)"?', query.get('cql', [''])[0])
+        space = self.data.spaces.get(match.group(1)) if match else None
+        return dict(results=[], size=0, totalSize=space['pages'] if space else 0)
+
+    def confluence_space(self, query, body, key):
+        space = self.data.spaces.get(key)
+        if space is None:
+            return 404, None
+        result = self._space_view(space)
+        if 'permissions' in query.get('expand', [''])[0]:
+            result['permissions'] = []
+            for permission in self.data.space_permissions.get(key, []):
+                kind, name = permission['subject']
+                if kind == 'group':
+                    subjects = dict(group=dict(results=[dict(type='group', name=name, id=group_id(name))], size=1))
+                else:
+                    subjects = dict(user=dict(results=[self.data.user(self.data.user_index(name))], size=1))
+                result['permissions'].append(dict(id=permission['id'], subjects=subjects, operation=deepcopy(permission['operation'])))
+        return result
+
+    def confluence_space_create(self, query, body):
+        space = dict(id=str(200000 + len(self.data.spaces)), key=body['key'], name=body['name'],
+                     description=dict(plain=dict(value=body['description']['plain']['value'], representation='plain')), pages=0)
+        self.data.spaces[body['key']] = space
+        return self._space_view(space)
+
+    def confluence_space_update(self, query, body, key):
+        space = self.data.spaces[key]
+        space.update(body)
+        return self._space_view(space)
+
+    def confluence_space_delete(self, query, body, key):
+        del self.data.spaces[key]
+        return 202, dict(id='task')
+
+    def confluence_permission_create(self, query, body, key):
+        permissions = self.data.space_permissions.setdefault(key, [])
+        subject = body.get('subject') or dict(type='user', identifier=None)
+        name = subject['identifier']
+        if subject['type'] == 'user' and name and self.data.user_index(name) is not None:
+            name = f"User {self.data.user_index(name)}"
+        if subject['type'] == 'group':
+            name = next((g for g in self.data.groups if group_id(g) == name), name)
+        permission = dict(id=400000 + len(permissions), operation=dict(operation=body['operation']['key'], targetType=body['operation']['target']),
+                          subject=(subject['type'], name))
+        permissions.append(permission)
+        return dict(id=permission['id'])
+
+    def confluence_permission_delete(self, query, body, key, permission_id):
+        self.data.space_permissions[key] = [p for p in self.data.space_permissions.get(key, []) if p['id'] != int(permission_id)]
+        return 204, None
+
+    def confluence_group(self, query, body):
+        group = self.data.group(query.get('name', [''])[0])
+        return (404, None) if group is None else dict(type='group', name=group['name'], id=group['groupId'])
+
+    def confluence_user_search(self, query, body):
+        # Fuzzy like the real search, "User 1" finds "User 10" as well
+        cql = query.get('cql', [''])[0]
+        match = re.search(r'user\.fullname~"((?:[^"\\]|\\.)*)"', cql)
+        term = re.sub(r'\\(.)', r'\1', match.group(1)) if match else ''
+        number = re.match(r'^User (\d+)$', term)
+        if number:
+            found = [i for i in range(self.data.size['users']) if str(i).startswith(number.group(1))]
+        else:
+            found = [i for i in [self.data.user_index(term)] if i is not None]
+        limit = self._int(query, 'limit', 25)
+        start = self._int(query, 'start', 0)
+        results = [dict(user=dict(self.data.user(i), type='known')) for i in found[start:start + limit]]
+        links = {}
+        if start + limit < len(found):
+            links['next'] = f"/wiki/rest/api/search/user?{urlencode(dict(cql=cql, start=start + limit, limit=limit))}"
+        return dict(results=results, start=start, limit=limit, size=len(results), totalSize=len(found), _links=links)
+
+    # Bitbucket
+
+    def _bitbucket_project_view(self, project):
+        return {k: deepcopy(v) for k, v in project.items() if k != 'groups'}
+
+    def bitbucket_project_list(self, query, body):
+        projects = [self._bitbucket_project_view(p) for p in self.data.bitbucket_projects.values()]
+        page = self._int(query, 'page', 1)
+        size = self._int(query, 'pagelen', 10)
+        result = dict(page=page, pagelen=size, size=len(projects), values=projects[(page - 1) * size:page * size])
+        if page * size < len(projects):
+            result['next'] = f"{BITBUCKET}/2.0/workspaces/stub/projects?page={page + 1}&pagelen={size}"
+        return result
+
+    def bitbucket_project(self, query, body, key):
+        project = self.data.bitbucket_projects.get(key)
+        return (404, None) if project is None else self._bitbucket_project_view(project)
+
+    def bitbucket_project_create(self, query, body):
+        project = dict(key=body['key'], name=body['name'], description=body.get('description') or '', is_private=body.get('is_private', True), groups={})
+        self.data.bitbucket_projects[body['key']] = project
+        return 201, self._bitbucket_project_view(project)
+
+    def bitbucket_project_update(self, query, body, key):
+        project = self.data.bitbucket_projects[key]
+        project.update(body)
+        return self._bitbucket_project_view(project)
+
+    def bitbucket_project_delete(self, query, body, key):
+        del self.data.bitbucket_projects[key]
+        return 204, None
+
+    def bitbucket_group_permissions(self, query, body, workspace, key):
+        project = self.data.bitbucket_projects.get(key)
+        if project is None:
+            return 404, None
+        values = [dict(group=dict(name=name, slug=name), permission=permission) for name, permission in sorted(project['groups'].items())]
+        page = self._int(query, 'page', 1)
+        size = self._int(query, 'pagelen', 10)
+        result = dict(page=page, pagelen=size, size=len(values), values=values[(page - 1) * size:page * size])
+        if page * size < len(values):
+            result['next'] = f"{BITBUCKET}/2.0/workspaces/{workspace}/projects/{key}/permissions-config/groups?page={page + 1}&pagelen={size}"
+        return result
+
+    def bitbucket_group_permission_set(self, query, body, key, group):
+        self.data.bitbucket_projects[key]['groups'][group] = body['permission']
+        return dict(group=dict(name=group, slug=group), permission=body['permission'])
+
+    def bitbucket_group_permission_delete(self, query, body, key, group):
+        self.data.bitbucket_projects[key]['groups'].pop(group, None)
+        return 204, None
+
+    def bitbucket_groups(self, query, body):
+        return [dict(name=name, slug=name) for name in self.data.bitbucket_groups]
+
+    def bitbucket_group_create(self, query, body):
+        name = body['name'][0] if isinstance(body['name'], list) else body['name']
+        self.data.bitbucket_groups.append(name)
+        return dict(name=name, slug=name)
+
+    def bitbucket_group_delete(self, query, body, name):
+        self.data.bitbucket_groups.remove(name)
+        return 204, None
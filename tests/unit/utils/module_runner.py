@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2023, Marius Rieder <marius.rieder@scs.ch>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Run the collection's modules in-process against an AtlassianStub."""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import importlib
+import io
+import json
+import re
+
+from contextlib import contextmanager, redirect_stdout
+from unittest import mock
+
+from ansible.module_utils import basic
+from ansible.module_utils.common.text.converters import to_bytes
+
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.module import AnsibleAtlassianModule
+from ansible_collections.scsitteam.atlassian.plugins.module_utils.transport import Transport
+
+try:
+    from ansible.module_utils.testing import patch_module_args
+except ImportError:
+    @contextmanager
+    def patch_module_args(args):
+        with mock.patch.object(basic, '_ANSIBLE_ARGS', to_bytes(json.dumps({'ANSIBLE_MODULE_ARGS': args}))):
+            yield
+
+CLOUD_URL = re.compile(r'^https://(?:[^/]+\.atlassian\.net|api\.bitbucket\.org)')
+
+DEFAULT_ARGS = dict(
+    atlassian_instance='stub',
+    atlassian_username='admin@example.com',
+    atlassian_password='s3cr3t-pw',
+)
+
+
+@contextmanager
+def routed_to(url):
+    """Send every request to the Cloud APIs to url instead."""
+    request = Transport.request
+
+    def routed(self, method, target, **kwargs):
+        return request(self, method, CLOUD_URL.sub(url, target), **kwargs)
+
+    with mock.patch.object(Transport, 'request', routed):
+        yield
+
+
+def api_module(args=None, check_mode=False):
+    """AnsibleAtlassianModule with just the shared options, to build an API object with.
+
+    The options default to DEFAULT_ARGS like for run_module().
+    """
+    args = dict(DEFAULT_ARGS, **(args or {}))
+    if check_mode:
+        args['_ansible_check_mode'] = True
+    with patch_module_args(args):
+        return AnsibleAtlassianModule(argument_spec={}, supports_check_mode=True)
+
+
+def run_module(name, args, check_mode=False):
+    """Run main() of the module name with args, return the result.
+
+    The connection options default to DEFAULT_ARGS. Failed runs return the
+    result of fail_json with failed set instead of raising.
+    """
+    module = importlib.import_module(f"ansible_collections.scsitteam.atlassian.plugins.modules.{name}")
+    args = dict(DEFAULT_ARGS, **args)
+    if check_mode:
+        args['_ansible_check_mode'] = True
+
+    stdout = io.StringIO()
+    with patch_module_args(args), redirect_stdout(stdout):
+        try:
+            module.main()
+        except SystemExit:
+            pass
+    return json.loads(stdout.getvalue())